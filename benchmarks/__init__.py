@@ -0,0 +1,9 @@
+""" Benchmarks of dkc-api. Not part of installed package, run from repository root:
+
+    python -m benchmarks.endpoints   # every endpoint of DkcAPI against local stand-in server
+    python -m benchmarks.validation  # validation modes of bulk responces
+    python -m benchmarks.decode      # responce pipelines: legacy, parse_responce with json / orjson decoder
+    python -m benchmarks.transport   # transport backends: requests HTTP/1.1, httpx HTTP/1.1 and HTTP/2, compression
+    python -m benchmarks.mirror      # RevisionMirror sync in every validation mode, rows are checked against "full"
+    python -m benchmarks.startup     # import and init time of DkcAPI in fresh interpreters
+"""
@@ -0,0 +1,106 @@
+""" Compare responce pipelines on bulk payloads: legacy per-method block (`Model(**responce.json())`, body decoded
+again on error) and `parse_responce` with `json` and `orjson` (if installed) decoders.
+
+    python -m benchmarks.decode --items 100000 --repeat 5
+    python -m benchmarks.decode --validation decode   # decode only, without building of models
+"""
+from __future__ import annotations
+from typing import Any, Callable
+
+from dkc_api.v1.records import construct
+from dkc_api.v1.responce import parse_responce, set_json_decoder, orjson
+from dkc_api.v1.models.error import ResponceError, ResponceErrorAlternative
+from dkc_api.v1.objects.catalog.models import GetMaterialStock
+from dkc_api.v1.objects.content.models import GetRevisionMaterials, GetRevisionLast
+
+from . import payloads
+
+import gc
+import json
+import time
+import argparse
+
+import requests
+from pydantic.error_wrappers import ValidationError
+
+
+CASES = (
+    ("getMaterialStock", GetMaterialStock, payloads.material_stock),
+    ("getRevisionMaterials", GetRevisionMaterials, payloads.revision_materials),
+    ("getRevisionsLast", GetRevisionLast, payloads.revisions_last),
+)
+
+
+def build_responce(status_code: int, content: bytes) -> requests.Response:
+    responce = requests.Response()
+    responce.status_code = status_code
+    responce.encoding = "utf-8"
+    responce._content = content
+    return responce
+
+
+def legacy(responce: requests.Response, model, build: Callable[[Any], Any]) -> Any:
+    """ Per-method block how was used before `parse_responce` """
+    try: return build(responce.json())
+    except ValidationError:
+        if responce.status_code == 500 or responce.status_code == 403:
+            return ResponceErrorAlternative(**responce.json())
+        return ResponceError(**{"code": responce.status_code, **responce.json() })
+
+
+def measure(call: Callable[[], Any], repeat: int) -> float:
+    """ Best time of call in seconds """
+    best = float("inf")
+    for _ in range(repeat):
+        gc.collect()
+        start = time.perf_counter()
+        result = call()
+        best = min(best, time.perf_counter() - start)
+        del result
+    return best
+
+
+def pipelines() -> dict[str, Callable]:
+    """ Pipelines by name, `parse_responce` with every installed decoder """
+    def pipeline(decoder: Callable[[bytes], Any]) -> Callable:
+        def parse(responce: requests.Response, model, build: Callable[[Any], Any]) -> Any:
+            return parse_responce(responce, model, model.__name__, build=build)
+        parse.decoder = decoder
+        return parse
+
+    result = { "legacy": legacy, "json": pipeline(json.loads) }
+    if orjson is not None: result["orjson"] = pipeline(orjson.loads)
+    return result
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--items", type=int, default=100000, help="Count of items in every payload")
+    parser.add_argument("--repeat", type=int, default=5, help="Count of runs, best is reported")
+    parser.add_argument("--validation", default="trusted",
+                        help="Validation mode of success body (full, trusted, sampled) or `decode` for decode only. Defaults to trusted")
+    args = parser.parse_args()
+
+    print(f"{'payload':<22}{'body MB':>9}  {'pipeline':<10}{'success s':>11}{'error s':>11}{'speedup':>10}")
+    for name, model, generate in CASES:
+        data = generate(args.items)
+        content = json.dumps(data, ensure_ascii=False).encode("utf-8")
+        # Error body of the same size, so legacy decode of error twice is visible
+        error = json.dumps({ "errorCode": "500", "errorMessage": "", "data": data }, ensure_ascii=False).encode("utf-8")
+        if args.validation == "decode": build = lambda data: data
+        else: build = lambda data, model=model: construct(model, data, args.validation)
+
+        base = None
+        for pipeline, parse in pipelines().items():
+            set_json_decoder(getattr(parse, "decoder", None))
+            success = measure(lambda: parse(build_responce(200, content), model, build), args.repeat)
+            failure = measure(lambda: parse(build_responce(500, error), model, build), args.repeat)
+            if base is None: base = success + failure
+            print(f"{name:<22}{len(content) / 1024 / 1024:>9.1f}  {pipeline:<10}{success:>11.3f}{failure:>11.3f}"
+                  f"{base / (success + failure):>9.1f}x")
+
+    set_json_decoder()
+
+
+if __name__ == "__main__":
+    main()
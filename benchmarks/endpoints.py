@@ -0,0 +1,181 @@
+""" Per-endpoint benchmark of DkcAPI against local stand-in server. Reports throughput, p50/p99 latency,
+parse time (latency without network) and peak memory of one call.
+
+    python -m benchmarks.endpoints --items 10000 --latency 0.005
+    python -m benchmarks.endpoints --output baseline.json
+    python -m benchmarks.endpoints --compare baseline.json --threshold 0.2
+"""
+from __future__ import annotations
+from typing import Any, Callable, NamedTuple
+from concurrent.futures import ThreadPoolExecutor
+
+from dkc_api.v1.dkc_api import DkcAPI
+from dkc_api.v1.transport import Transport
+from dkc_api.v1.models.error import ResponceError, ResponceErrorAlternative
+from dkc_api.v1.objects.content.models import PostFileContent
+from dkc_api.v1.objects.delivery.models import DeliveryTimeContent, DeliveryTimeContentItem
+
+from .server import StandInServer, MemoryTokenStorage
+
+import sys
+import json
+import time
+import argparse
+import threading
+import tracemalloc
+
+import loguru
+
+
+class TimedTransport(Transport):
+    """ Transport how sums time of requests in current thread, so parse time is latency without network """
+
+    def __init__(self, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self._local = threading.local()
+
+    def request(self, method: str, url: str, **kwargs):
+        start = time.perf_counter()
+        try: return super().request(method, url, **kwargs)
+        finally: self._local.network = self.network + time.perf_counter() - start
+
+    @property
+    def network(self) -> float:
+        return getattr(self._local, "network", 0.0)
+
+    def reset(self) -> None:
+        self._local.network = 0.0
+
+
+class Case(NamedTuple):
+    name: str
+    call: Callable[[DkcAPI], Any]
+    bulk: bool = False
+
+
+DELIVERY_CONTENT = DeliveryTimeContent(company_warehouse="1100", items=[
+    DeliveryTimeContentItem(code=1000 + number, count=10, warehouse_id=1100) for number in range(10)
+])
+
+CASES = (
+    # Token is got lazily, so new client with empty storage is authorized explicitly for one token round-trip
+    Case("auth", lambda api: DkcAPI(master_key="benchmark", storage=MemoryTokenStorage(), url_domain=api.url_domain,
+                                    transport=api.transport, logger=api.logger).authorize()),
+    Case("getMaterial", lambda api: api.Catalog.getMaterial(code="R5CEB000000")),
+    Case("getMaterialCertificates", lambda api: api.Catalog.getMaterialCertificates(code="R5CEB000000")),
+    Case("getMaterialStock", lambda api: api.Catalog.getMaterialStock(), bulk=True),
+    Case("getMaterialRelated", lambda api: api.Catalog.getMaterialRelated(), bulk=True),
+    Case("getMaterialAccessories", lambda api: api.Catalog.getMaterialAccessories(), bulk=True),
+    Case("getMaterialAnalogs", lambda api: api.Catalog.getMaterialAnalogs(), bulk=True),
+    Case("getRevisionsLastSize", lambda api: api.Content.getRevisionsLastSize()),
+    Case("getRevisionsLast", lambda api: api.Content.getRevisionsLast(), bulk=True),
+    Case("getRevisionDrawings", lambda api: api.Content.getRevisionDrawings(), bulk=True),
+    Case("getRevisionCertificates", lambda api: api.Content.getRevisionCertificates(), bulk=True),
+    Case("getRevisionMaterials", lambda api: api.Content.getRevisionMaterials(), bulk=True),
+    Case("getNewsCompany", lambda api: api.News.getNewsCompany()),
+    Case("getNewsCommunity", lambda api: api.News.getNewsCommunity()),
+    Case("getNewsProducts", lambda api: api.News.getNewsProducts()),
+    Case("getDeliveryTime", lambda api: api.Delivery.getDeliveryTime(delivery_time_content=DELIVERY_CONTENT)),
+    Case("getFile", lambda api: api.Content.getFile(file_id=1)),
+    Case("postFile", lambda api: api.Content.postFile(file_content=PostFileContent(name="benchmark.txt", value="MUAy" * 256))),
+)
+
+
+def percentile(values: list[float], q: float) -> float:
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, round(q * (len(ordered) - 1)))]
+
+
+def run_case(api: DkcAPI, case: Case, requests: int, concurrency: int) -> dict:
+    """ Run `requests` calls of case in `concurrency` threads """
+    transport: TimedTransport = api.transport
+
+    def call(_) -> tuple[float, float, bool]:
+        transport.reset()
+        start = time.perf_counter()
+        try: error = isinstance(case.call(api), (ResponceError, ResponceErrorAlternative))
+        except Exception: error = True
+        latency = time.perf_counter() - start
+        return latency, latency - transport.network, error
+
+    call(None)  # warm up
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        results = list(executor.map(call, range(requests)))
+    elapsed = time.perf_counter() - start
+
+    tracemalloc.start()
+    call(None)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    latencies = [latency for latency, _, _ in results]
+    parse = [parse for _, parse, _ in results]
+    return {
+        "requests": requests,
+        "errors": sum(error for _, _, error in results),
+        "throughput": requests / elapsed,
+        "p50": percentile(latencies, 0.50),
+        "p99": percentile(latencies, 0.99),
+        "parse_p50": percentile(parse, 0.50),
+        "peak_mb": peak / 1024 / 1024,
+    }
+
+
+def compare(results: dict[str, dict], baseline: dict[str, dict], threshold: float) -> list[str]:
+    """ Names of endpoints how p50 latency or peak memory grew more than `threshold` against baseline """
+    regressions = []
+    for name, result in results.items():
+        base = baseline.get(name)
+        if base is None: continue
+        for metric in ("p50", "peak_mb"):
+            if base[metric] > 0 and result[metric] > base[metric] * (1 + threshold):
+                regressions.append(f"{name}: {metric} {base[metric]:.4f} -> {result[metric]:.4f}")
+    return regressions
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--items", type=int, default=10000, help="Count of items in bulk responces")
+    parser.add_argument("--file-size", type=int, default=1024 * 1024, help="Size of file content in bytes")
+    parser.add_argument("--latency", type=float, default=0.0, help="Server delay of every responce in seconds")
+    parser.add_argument("--requests", type=int, default=50, help="Count of calls of small endpoints")
+    parser.add_argument("--bulk-requests", type=int, default=3, help="Count of calls of bulk endpoints")
+    parser.add_argument("--concurrency", type=int, default=1, help="Count of threads how send calls")
+    parser.add_argument("--endpoint", action="append", help="Run only this endpoint, can be repeated")
+    parser.add_argument("--output", help="Save results to json file")
+    parser.add_argument("--compare", help="Compare results with saved json file, exit code 1 on regression")
+    parser.add_argument("--threshold", type=float, default=0.2, help="Allowed growth against baseline. Defaults to 0.2")
+    args = parser.parse_args()
+
+    logger = loguru.logger
+    logger.remove()
+
+    cases = [case for case in CASES if not args.endpoint or case.name in args.endpoint]
+    results = {}
+
+    with StandInServer(items=args.items, latency=args.latency, file_size=args.file_size) as server:
+        api = DkcAPI(master_key="benchmark", storage=MemoryTokenStorage(), logger=logger, url_domain=server.url,
+                     transport=TimedTransport(pool_maxsize=max(args.concurrency, 10)))
+
+        print(f"{'endpoint':<26}{'req/s':>10}{'p50 ms':>10}{'p99 ms':>10}{'parse ms':>10}{'peak MB':>10}{'errors':>8}")
+        for case in cases:
+            requests = args.bulk_requests if case.bulk else args.requests
+            result = results[case.name] = run_case(api, case, requests, args.concurrency)
+            print(f"{case.name:<26}{result['throughput']:>10.1f}{result['p50'] * 1000:>10.2f}{result['p99'] * 1000:>10.2f}"
+                  f"{result['parse_p50'] * 1000:>10.2f}{result['peak_mb']:>10.2f}{result['errors']:>8}")
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as file:
+            json.dump({ "args": vars(args), "results": results }, file, indent=2)
+
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as file:
+            regressions = compare(results, json.load(file)["results"], args.threshold)
+        for regression in regressions: print(f"REGRESSION {regression}")
+        if regressions: sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,69 @@
+""" Sync `RevisionMirror` against local stand-in server in every validation mode ("full", "trusted", "sampled").
+Reports time of full sync and checks that every mode stores the same rows as "full", exit code 1 if not.
+
+    python -m benchmarks.mirror --items 10000 --sample-rate 100
+"""
+from __future__ import annotations
+
+from dkc_api.v1.dkc_api import DkcAPI
+from dkc_api.v1.mirror import RevisionMirror
+from dkc_api.v1.records import VALIDATION_MODES
+
+from .server import StandInServer, MemoryTokenStorage
+
+import os
+import sys
+import time
+import argparse
+import tempfile
+
+import loguru
+
+
+def sync(url: str, validation: str, sample_rate: int, path: str, logger) -> tuple[float, list[tuple]]:
+    """ Time of full sync in seconds and all rows of mirror """
+    api = DkcAPI(master_key="benchmark", storage=MemoryTokenStorage(), logger=logger, url_domain=url,
+                 validation=validation, sample_rate=sample_rate)
+    mirror = RevisionMirror(api, path=path)
+    try:
+        start = time.perf_counter()
+        results = mirror.sync()
+        seconds = time.perf_counter() - start
+
+        errors = [result for result in results if result.error is not None]
+        if errors: raise RuntimeError(f"Mirror sync in {validation} mode failed -> {errors}")
+
+        rows = mirror.connection.execute("SELECT section, id, code, data FROM item ORDER BY section, id").fetchall()
+    finally:
+        mirror.connection.close()
+        api.transport.close()
+    return seconds, rows
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--items", type=int, default=10000, help="Count of items in revisions of stand-in server")
+    parser.add_argument("--sample-rate", type=int, default=100, help="1 in N items is validated in sampled mode")
+    args = parser.parse_args()
+
+    logger = loguru.logger
+    logger.remove()
+
+    mismatches = []
+    print(f"{'mode':<10}{'seconds':>10}{'rows':>10}  same as full")
+    with StandInServer(items=args.items) as server, tempfile.TemporaryDirectory() as directory:
+        full = None
+        for validation in VALIDATION_MODES:
+            path = os.path.join(directory, f"{validation}.sqlite3")
+            seconds, rows = sync(server.url, validation, args.sample_rate, path, logger)
+            if full is None: full = rows
+            if rows != full: mismatches.append(validation)
+            print(f"{validation:<10}{seconds:>10.3f}{len(rows):>10}  {'yes' if rows == full else 'NO'}")
+
+    if mismatches:
+        print(f"MISMATCH {', '.join(mismatches)}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
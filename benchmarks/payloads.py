@@ -0,0 +1,207 @@
+""" Generators of realistic api payloads (decoded json) for benchmarks """
+from __future__ import annotations
+
+import random
+
+
+WAREHOUSES = (1100, 2765, 3010, 4100)
+
+
+def material_stock(count: int, seed: int=0) -> dict:
+    """ Payload of `/catalog/material/stock`: every material has 1-4 warehouses with 0-3 receipts """
+    rand = random.Random(seed)
+    return {
+        "create": "2021-07-19T21:00:00+00:00",
+        "materials": [{
+            "id": 1000000 + number,
+            "status": rand.random() > 0.1,
+            "code": f"R5CEB{number:06d}",
+            "warehouse": [{
+                "code": code,
+                "amount": rand.randint(0, 5000),
+                "receipt": [
+                    { "date": f"2021-08-{rand.randint(1, 28):02d}T00:00:00+00:00", "amount": rand.randint(1, 500) }
+                    for _ in range(rand.randint(0, 3))
+                ],
+            } for code in rand.sample(WAREHOUSES, rand.randint(1, len(WAREHOUSES)))],
+        } for number in range(count)],
+    }
+
+
+def _revision_material(rand: random.Random, number: int) -> dict:
+    code = f"R5CEB{number:06d}"
+    return {
+        "id": str(1000000 + number),
+        "node_id": str(rand.randint(1, 5000)),
+        "name": f"Материал {code} оцинкованный, 300x80 мм",
+        "etim_class_id": f"EC00{rand.randint(1000, 9999)}",
+        "type": "Лоток",
+        "series": "S5 Combitech",
+        "country": "Россия",
+        "unit": "м",
+        "volume": rand.randint(1, 100000),
+        "weight": rand.randint(1, 100000),
+        "code": code,
+        "url": f"https://www.dkc.ru/ru/catalog/{number}/{code}/",
+        "price": rand.randint(100, 100000),
+        "barcode": [str(rand.randint(10 ** 12, 10 ** 13 - 1))],
+        "thumbnail_url": f"https://www.dkc.ru/upload/iblock/{number % 1000:03d}/{code}.png",
+        "additional_images": [f"https://www.dkc.ru/upload/iblock/{number % 1000:03d}/{code}_{i}.png" for i in range(2)],
+        "attributes": { f"attribute_{i}": str(rand.randint(1, 1000)) for i in range(8) },
+        "etim_attributes": { f"EF00{i:04d}": str(rand.randint(1, 1000)) for i in range(8) },
+        "packing": { "min": rand.randint(1, 10), "box": rand.randint(10, 100) },
+        "avg_delivery": { "1100": rand.randint(1, 30), "2765": rand.randint(1, 30) },
+        "accessories": [str(1000000 + rand.randrange(number + 1)) for _ in range(3)],
+        "accessories_codes": [f"R5CEB{rand.randrange(number + 1):06d}" for _ in range(3)],
+    }
+
+
+def revision_materials(count: int, seed: int=0) -> dict:
+    """ Payload of `/revisions/materials` with `count` updated materials """
+    rand = random.Random(seed)
+    return {
+        "revision": {
+            "delta": False,
+            "materials": {
+                "updated": [_revision_material(rand, number) for number in range(count)],
+                "removed": [str(number) for number in range(count // 100)],
+            },
+        },
+    }
+
+
+def revisions_last(count: int, seed: int=0) -> dict:
+    """ Payload of `/revisions/last` with `count` products and proportional count of other items """
+    rand = random.Random(seed)
+    small = max(count // 100, 1)
+
+    def section(items: list) -> dict:
+        return { "updated": items, "removed": [str(number) for number in range(len(items) // 100)] }
+
+    return {
+        "revision": {
+            "delta": False,
+            "countries": section([{ "id": str(i), "name": f"Страна {i}" } for i in range(small)]),
+            "cities": section([{ "id": str(i), "name": f"Город {i}", "country_id": str(i % small),
+                                 "coordinates": ["55.75", "37.61"] } for i in range(small)]),
+            "nodes": section([{ "id": str(i), "name": f"Раздел {i}", "parent_id": str(i // 10), "sort": str(i) }
+                              for i in range(small * 10)]),
+            "products": section([{
+                "id": str(1000000 + i),
+                "sort": str(i),
+                "node_id": str(rand.randint(1, small * 10)),
+                "name": f"Материал R5CEB{i:06d}",
+                "code": f"R5CEB{i:06d}",
+                "barcode": [str(rand.randint(10 ** 12, 10 ** 13 - 1))],
+                "thumbnail_url": f"https://www.dkc.ru/upload/iblock/{i % 1000:03d}/R5CEB{i:06d}.png",
+                "additional_images": [],
+                "attributes": { f"attribute_{a}": str(rand.randint(1, 1000)) for a in range(8) },
+                "drawables": [{ "name": "Чертеж", "src": f"https://www.dkc.ru/upload/drawings/{i}.pdf" }],
+            } for i in range(count)]),
+            "catalogues": section([{ "id": str(i), "parent_id": "0", "name": f"Каталог {i}",
+                                     "src": f"https://www.dkc.ru/upload/catalogues/{i}.pdf",
+                                     "node_ids": [str(i)] } for i in range(small)]),
+            "booklets": section([{ "id": str(i), "name": f"Буклет {i}", "src": f"https://www.dkc.ru/upload/booklets/{i}.pdf",
+                                   "node_ids": [str(i)] } for i in range(small)]),
+            "certificates": section([{ "id": str(i), "name": f"Сертификат {i}",
+                                       "src": f"https://www.dkc.ru/upload/certificates/{i}.pdf",
+                                       "node_ids": [str(i)], "item_ids": [str(i)] } for i in range(small)]),
+            "instructions": section([{ "id": str(i), "name": f"Инструкция {i}",
+                                       "src": f"https://www.dkc.ru/upload/instructions/{i}.pdf",
+                                       "node_ids": [str(i)] } for i in range(small)]),
+            "salepoints": section([{
+                "id": str(i), "name": f"Точка продаж {i}", "url": "https://www.dkc.ru",
+                "location": { "city_id": str(i % small), "address": f"ул. Строителей, {i}", "coordinates": ["55.75", "37.61"] },
+                "contact": { "phones": ["+7 495 000-00-00"] },
+            } for i in range(small)]),
+        },
+    }
+
+
+def material(number: int=0, seed: int=0) -> dict:
+    """ Payload of `/catalog/material` """
+    rand = random.Random(seed + number)
+    data = _revision_material(rand, number)
+    data.update({
+        "id": 1000000 + number,
+        "node_id": rand.randint(1, 5000),
+        "packing": { key: str(value) for key, value in data["packing"].items() },
+        "avg_delivery": { key: str(value) for key, value in data["avg_delivery"].items() },
+        "warehouse": [{ "code": code, "amount": rand.randint(0, 5000), "receipt": [] } for code in WAREHOUSES],
+    })
+    return { "material": data }
+
+
+def _certificate(number: int) -> dict:
+    return {
+        "id": number,
+        "name": f"Сертификат соответствия {number}",
+        "src": f"https://www.dkc.ru/upload/certificates/{number}.pdf",
+        "type": "Сертификат",
+        "number": f"ЕАЭС RU С-RU.АД07.В.{number:05d}",
+        "start_date": 1609459200,
+        "expiration_date": 1767225600,
+        "node_ids": [str(number % 5000)],
+        "item_ids": [str(1000000 + number)],
+        "item_full_codes": [f"R5CEB{number:06d}"],
+    }
+
+
+def material_certificates(count: int) -> list:
+    """ Payload of `/catalog/material/certificates`, api returns list without key """
+    return [_certificate(number) for number in range(count)]
+
+
+def material_relation(name: str, count: int, seed: int=0) -> dict:
+    """ Payload of relation dumps (`related`, `accessories`, `analogs`, `video`, ...): code -> list of values """
+    rand = random.Random(seed)
+    return { name: {
+        f"R5CEB{number:06d}": [f"R5CEB{rand.randrange(count):06d}" for _ in range(rand.randint(1, 5))]
+        for number in range(count)
+    } }
+
+
+def revision_drawings(count: int) -> dict:
+    """ Payload of `/revisions/drawings` """
+    return { "revision": { "delta": False, "drawings": { "updated": [{
+        "id": str(number),
+        "name": f"Чертеж {number}",
+        "links": [{ "type": "pdf", "src": f"https://www.dkc.ru/upload/drawings/{number}.pdf" }],
+        "node_ids": [str(number % 5000)],
+        "item_ids": [str(1000000 + number)],
+        "item_full_codes": [f"R5CEB{number:06d}"],
+    } for number in range(count)], "removed": [] } } }
+
+
+def revision_certificates(count: int) -> dict:
+    """ Payload of `/revisions/certificates` """
+    certificates = [{ **_certificate(number), "id": str(number) } for number in range(count)]
+    return { "revision": { "delta": False, "certificates": { "updated": certificates, "removed": [] } } }
+
+
+def news(kind: str, count: int) -> dict:
+    """ Payload of `/news/company`, `/news/community` and `/news/products` """
+    if kind == "community":
+        return { "news": [{ "text": f"Новость {number}", "timestamp": "2021-08-01" } for number in range(count)] }
+    return { "news": [{
+        "title": f"Новость {number}",
+        "text": "Текст новости. " * 50,
+        "thumbnail_url": f"https://www.dkc.ru/upload/news/{number}.jpg",
+        "images": [f"https://www.dkc.ru/upload/news/{number}_{i}.jpg" for i in range(3)],
+        "timestamp": "2021-08-01T10:00:00+03:00",
+    } for number in range(count)] }
+
+
+def delivery_time(count: int) -> dict:
+    """ Payload of `/delivery/time` """
+    return { "items": [{
+        "code": 1000 + number,
+        "status": True,
+        "date_last": { "date": "2021-08-10T00:00:00+03:00", "amount": 10 },
+        "date_detail": [{ "date": f"2021-08-{day:02d}T00:00:00+03:00", "amount": 5 } for day in (5, 10)],
+    } for number in range(count)] }
+
+
+def file(size: int) -> dict:
+    """ Payload of `/file` with base64 content of `size` bytes """
+    return { "name": "Спецификация.txt", "value": "MUAy" * (size // 4) }
@@ -0,0 +1,220 @@
+""" Local stand-in of DKC API for benchmarks. Every endpoint answers pre-generated payload with configurable size
+and latency, so client can be measured offline:
+
+    with StandInServer(items=10000, latency=0.005) as server:
+        dkc_api = DkcAPI(master_key="benchmark", storage=MemoryTokenStorage(), url_domain=server.url)
+"""
+from __future__ import annotations
+from typing import Any, Callable, Optional
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlsplit
+
+from dkc_api.v1.storage import TokenStorage
+
+from . import payloads
+
+import gzip
+import json
+import time
+import threading
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+
+class MemoryTokenStorage(TokenStorage):
+    """ Token storage in memory, so benchmarks do not write token file """
+
+    def __init__(self) -> None:
+        self.access_token: Optional[str] = None
+
+    def get_access_token(self) -> Optional[str]:
+        return self.access_token
+
+    def save_token(self, access_token: str) -> bool:
+        self.access_token = access_token
+        return True
+
+
+def build_payloads(items: int, file_size: int) -> dict[str, Callable[[], Any]]:
+    """ Payload generators by endpoint path (without version prefix), "METHOD /path" key is used for only this method.
+    `items` is count of items in bulk responces """
+    page = 10
+    return {
+        "/auth.access.token": lambda: { "access_token": "benchmark-access-token" },
+        "/catalog/material": lambda: payloads.material(),
+        "/catalog/material/certificates": lambda: payloads.material_certificates(page),
+        "/catalog/material/stock": lambda: payloads.material_stock(items),
+        "/catalog/material/related": lambda: payloads.material_relation("related", items),
+        "/catalog/material/accessories": lambda: payloads.material_relation("accessories", items),
+        "/catalog/material/video": lambda: payloads.material_relation("video", items),
+        "/catalog/material/drawings/sketch": lambda: payloads.material_relation("drawings_sketch", items),
+        "/catalog/material/description": lambda: payloads.material_relation("description", items),
+        "/catalog/material/analogs": lambda: payloads.material_relation("analogs", items),
+        "/catalog/material/specification": lambda: payloads.material_relation("specification", items),
+        "/revisions/last/size": lambda: { "size": 67602981, "forced_update": False },
+        "/revisions/last": lambda: payloads.revisions_last(items),
+        "/revisions/drawings": lambda: payloads.revision_drawings(items),
+        "/revisions/certificates": lambda: payloads.revision_certificates(items),
+        "/revisions/materials": lambda: payloads.revision_materials(items),
+        "/news/company": lambda: payloads.news("company", page),
+        "/news/community": lambda: payloads.news("community", page),
+        "/news/products": lambda: payloads.news("products", page),
+        "/delivery/time": lambda: payloads.delivery_time(page),
+        "/file": lambda: payloads.file(file_size),
+        "POST /file": lambda: { "id": 889 },
+    }
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+    server: _Server
+
+    def log_message(self, format: str, *args) -> None:
+        pass
+
+    def _answer(self) -> None:
+        length = int(self.headers.get("Content-Length") or 0)
+        if length: self.rfile.read(length)
+
+        path = urlsplit(self.path).path.rstrip("/")
+        if path.startswith(self.server.prefix): path = path[len(self.server.prefix):]
+        if path.startswith("/auth.access.token/"): path = "/auth.access.token"
+
+        body = self.server.bodies.get(f"{self.command} {path}", self.server.bodies.get(path))
+        status = 200
+        if body is None:
+            status, body = 404, json.dumps({ "code": 404, "message": f"Not found {path}" }).encode("utf-8")
+
+        delay = self.server.latencies.get(path, self.server.latency)
+        if delay: time.sleep(delay)
+
+        encoding = self.server.encoding(self.headers.get("Accept-Encoding", ""))
+        if encoding: body = self.server.compressed(encoding, body)
+
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json; charset=utf-8")
+        if encoding: self.send_header("Content-Encoding", encoding)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+        with self.server.lock:
+            self.server.bytes_sent += len(body)
+
+    do_GET = _answer
+    do_POST = _answer
+
+
+class _Server(ThreadingHTTPServer):
+    daemon_threads = True
+    prefix: str
+    bodies: dict[str, bytes]
+    latency: float
+    latencies: dict[str, float]
+    compress: bool
+    lock: threading.Lock
+    bytes_sent: int
+    _compressed: dict[tuple[str, bytes], bytes]
+
+    def encoding(self, accept_encoding: str) -> Optional[str]:
+        """ Content-Encoding of responce: br (if `brotli` is installed) or gzip, None if compression is off """
+        if not self.compress: return None
+
+        accepted = { part.split(";")[0].strip() for part in accept_encoding.split(",") }
+        if "br" in accepted and brotli is not None: return "br"
+        if "gzip" in accepted: return "gzip"
+        return None
+
+    def compressed(self, encoding: str, body: bytes) -> bytes:
+        """ Compressed body, every payload is compressed once """
+        key = (encoding, body)
+        with self.lock:
+            cached = self._compressed.get(key)
+        if cached is not None: return cached
+
+        cached = brotli.compress(body, quality=5) if encoding == "br" else gzip.compress(body, compresslevel=6)
+        with self.lock:
+            self._compressed[key] = cached
+        return cached
+
+
+class StandInServer:
+    """ Local HTTP server emulating DKC API endpoints (auth, catalog, stock, revisions, news, delivery, file) """
+
+    def __init__(self, items: int=10000, latency: float=0.0, latencies: Optional[dict[str, float]]=None,
+                 file_size: int=1024 * 1024, host: str="127.0.0.1", port: int=0, prefix: str="/v1",
+                 compress: bool=False) -> None:
+        """ Local HTTP server emulating DKC API endpoints.
+
+            Args:
+                items (int, optional): Count of items in bulk responces (stock, revisions, relation dumps). Defaults to 10000.
+                latency (float, optional): Delay of every responce in seconds. Defaults to 0.
+                latencies (dict[str, float], optional): Delay by endpoint path, for example {"/catalog/material": 0.05}.
+                file_size (int, optional): Size of `/file` content in bytes. Defaults to 1 MB.
+                host (str, optional): Host. Defaults to "127.0.0.1".
+                port (int, optional): Port, 0 - any free port. Defaults to 0.
+                prefix (str, optional): Api version prefix. Defaults to "/v1".
+                compress (bool, optional): Compress responces by `Accept-Encoding` (br or gzip). Defaults to False.
+        """
+        self.items = items
+        self.latency = latency
+        self.latencies = latencies or {}
+        self.file_size = file_size
+        self.host = host
+        self.port = port
+        self.prefix = prefix
+        self.compress = compress
+
+        self._server: Optional[_Server] = None
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def url(self) -> str:
+        """ Url for `url_domain` variable of DkcAPI """
+        return f"http://{self.host}:{self.port}{self.prefix}"
+
+    def payload_sizes(self) -> dict[str, int]:
+        """ Size of responce body in bytes by endpoint path """
+        return { path: len(body) for path, body in self._server.bodies.items() } if self._server else {}
+
+    @property
+    def bytes_sent(self) -> int:
+        """ Count of sent bytes of responce bodies (compressed, if compression is on) """
+        return self._server.bytes_sent if self._server else 0
+
+    def start(self) -> StandInServer:
+        """ Generate payloads and start server in background thread """
+        server = _Server((self.host, self.port), _Handler)
+        server.prefix = self.prefix
+        server.latency = self.latency
+        server.latencies = self.latencies
+        server.compress = self.compress
+        server.lock = threading.Lock()
+        server.bytes_sent = 0
+        server._compressed = {}
+        server.bodies = {
+            path: json.dumps(generate(), ensure_ascii=False).encode("utf-8")
+            for path, generate in build_payloads(self.items, self.file_size).items()
+        }
+
+        self._server = server
+        self.port = server.server_address[1]
+        self._thread = threading.Thread(target=server.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        if self._server is None: return
+        self._server.shutdown()
+        self._server.server_close()
+        self._server = None
+
+    def __enter__(self) -> StandInServer:
+        return self.start()
+
+    def __exit__(self, *args) -> None:
+        self.stop()
@@ -0,0 +1,68 @@
+""" Measure startup of dkc-api in fresh interpreters: `import dkc_api.v1`, import of `DkcAPI`, construction of
+`DkcAPI` with first access of one object, and access of all objects (how every `DkcAPI()` did before lazy objects).
+Modules how are loaded after every step (loguru, pytz, models of objects) are reported too.
+
+    python -m benchmarks.startup --repeat 10
+    python -X importtime -c "import dkc_api.v1.dkc_api" 2> importtime.log   # details by module
+"""
+from __future__ import annotations
+
+import sys
+import json
+import argparse
+import statistics
+import subprocess
+
+
+# Step name -> code how is timed in fresh interpreter. Token is not got on init, so storage is not touched
+STEPS = (
+    ("import dkc_api.v1", "import dkc_api.v1"),
+    ("import DkcAPI", "from dkc_api.v1.dkc_api import DkcAPI"),
+    ("DkcAPI().Catalog", "from dkc_api.v1.dkc_api import DkcAPI\napi = DkcAPI(master_key='benchmark')\napi.Catalog"),
+    ("DkcAPI() all objects", "from dkc_api.v1.dkc_api import DkcAPI\napi = DkcAPI(master_key='benchmark')\n"
+                             "api.Catalog, api.News, api.Content, api.Delivery"),
+)
+
+WATCHED = {
+    "loguru": "loguru",
+    "pytz": "pytz",
+    "catalog": "dkc_api.v1.objects.catalog.models",
+    "news": "dkc_api.v1.objects.news.models",
+    "content": "dkc_api.v1.objects.content.models",
+    "delivery": "dkc_api.v1.objects.delivery.models",
+}
+
+SCRIPT = """
+import sys, time, json
+before = len(sys.modules)
+start = time.perf_counter()
+{code}
+seconds = time.perf_counter() - start
+print(json.dumps({{"seconds": seconds, "modules": len(sys.modules) - before,
+                  "loaded": [name for name, module in {watched!r}.items() if module in sys.modules]}}))
+"""
+
+
+def run_step(code: str) -> dict:
+    """ Run code in fresh interpreter and return his time, count of new modules and watched modules how are loaded """
+    script = SCRIPT.format(code=code, watched=WATCHED)
+    output = subprocess.run([sys.executable, "-c", script], capture_output=True, text=True, check=True).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--repeat", type=int, default=10, help="Count of fresh interpreters for every step, median is reported")
+    args = parser.parse_args()
+
+    print(f"{'step':<24}{'median ms':>11}{'min ms':>9}{'modules':>9}  loaded")
+    for name, code in STEPS:
+        results = [run_step(code) for _ in range(args.repeat)]
+        seconds = [result["seconds"] * 1000 for result in results]
+        last = results[-1]
+        print(f"{name:<24}{statistics.median(seconds):>11.1f}{min(seconds):>9.1f}{last['modules']:>9}  "
+              f"{', '.join(last['loaded']) or '-'}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,113 @@
+""" Compare transport backends: `Transport` (requests, HTTP/1.1) and `Http2Transport` (httpx, HTTP/1.1 or HTTP/2)
+on bulk endpoints (time, bytes on wire) and on many small parallel `getMaterial` calls (throughput, connections).
+
+    python -m benchmarks.transport --items 20000 --requests 500 --concurrency 32
+    python -m benchmarks.transport --no-compress
+    python -m benchmarks.transport --url https://api.dkc.ru/v1 --master-key $TOKEN   # HTTP/2 is negotiated on https only
+"""
+from __future__ import annotations
+from typing import Any, Callable, Optional
+from concurrent.futures import ThreadPoolExecutor
+
+from dkc_api.v1.dkc_api import DkcAPI
+from dkc_api.v1.transport import Transport
+from dkc_api.v1.http2_transport import Http2Transport, h2
+
+from .server import StandInServer, MemoryTokenStorage
+
+import time
+import argparse
+
+import loguru
+
+
+BULK_CASES: tuple[tuple[str, Callable[[DkcAPI], Any]], ...] = (
+    ("getRevisionsLast", lambda api: api.Content.getRevisionsLast()),
+    ("getRevisionMaterials", lambda api: api.Content.getRevisionMaterials()),
+    ("getMaterialStock", lambda api: api.Catalog.getMaterialStock()),
+    ("getMaterialRelated", lambda api: api.Catalog.getMaterialRelated()),
+    ("getMaterialAnalogs", lambda api: api.Catalog.getMaterialAnalogs()),
+)
+
+
+def backends(concurrency: int) -> dict[str, Callable[[], Transport]]:
+    """ Transport factories by name, HTTP/2 only if `h2` package is installed """
+    limits = { "max_connections": max(concurrency, 10), "max_keepalive_connections": max(concurrency, 10) }
+    result = {
+        "requests/1.1": lambda: Transport(pool_maxsize=max(concurrency, 10)),
+        "httpx/1.1": lambda: Http2Transport(http2=False, **limits),
+    }
+    if h2 is not None: result["httpx/2"] = lambda: Http2Transport(http2=True, **limits)
+    return result
+
+
+def run_bulk(api: DkcAPI, call: Callable[[DkcAPI], Any], repeat: int, server: Optional[StandInServer]) -> tuple[float, Optional[int]]:
+    """ Best time of call in seconds and bytes on wire of one call (only with stand-in server) """
+    call(api)  # warm up
+
+    best, sent = float("inf"), None
+    for _ in range(repeat):
+        before = server.bytes_sent if server else 0
+        start = time.perf_counter()
+        call(api)
+        best = min(best, time.perf_counter() - start)
+        if server: sent = server.bytes_sent - before
+    return best, sent
+
+
+def run_small(api: DkcAPI, requests: int, concurrency: int) -> float:
+    """ Throughput of parallel `getMaterial` calls, requests per second """
+    api.Catalog.getMaterial(code="R5CEB000000")  # warm up
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        list(executor.map(lambda _: api.Catalog.getMaterial(code="R5CEB000000"), range(requests)))
+    return requests / (time.perf_counter() - start)
+
+
+def run(url: str, master_key: str, server: Optional[StandInServer], args: argparse.Namespace, logger) -> None:
+    print(f"{'backend':<14}{'endpoint':<24}{'seconds':>10}{'wire MB':>10}")
+    small = {}
+    for name, factory in backends(args.concurrency).items():
+        storage = MemoryTokenStorage()
+        with factory() as transport:
+            api = DkcAPI(master_key=master_key, storage=storage, logger=logger, url_domain=url, transport=transport)
+            for endpoint, call in BULK_CASES:
+                seconds, sent = run_bulk(api, call, args.repeat, server)
+                wire = f"{sent / 1024 / 1024:>10.2f}" if sent is not None else f"{'-':>10}"
+                print(f"{name:<14}{endpoint:<24}{seconds:>10.3f}{wire}")
+
+            before = transport.stats
+            throughput = run_small(api, args.requests, args.concurrency)
+            small[name] = (throughput, transport.stats.connections - before.connections)
+
+    print(f"\n{'backend':<14}{'getMaterial req/s':>20}{'new connections':>18}")
+    for name, (throughput, connections) in small.items():
+        print(f"{name:<14}{throughput:>20.1f}{connections:>18}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--items", type=int, default=10000, help="Count of items in bulk responces of stand-in server")
+    parser.add_argument("--latency", type=float, default=0.005, help="Server delay of every responce in seconds")
+    parser.add_argument("--repeat", type=int, default=3, help="Count of calls of bulk endpoints, best is reported")
+    parser.add_argument("--requests", type=int, default=300, help="Count of small getMaterial calls")
+    parser.add_argument("--concurrency", type=int, default=32, help="Count of threads how send small calls")
+    parser.add_argument("--no-compress", action="store_true", help="Stand-in server answers without compression")
+    parser.add_argument("--url", help="Run against this api instead of stand-in server")
+    parser.add_argument("--master-key", help="Master key for --url")
+    args = parser.parse_args()
+
+    logger = loguru.logger
+    logger.remove()
+
+    if args.url:
+        run(args.url, args.master_key, None, args, logger)
+        return
+
+    with StandInServer(items=args.items, latency=args.latency, compress=not args.no_compress) as server:
+        run(server.url, "benchmark", server, args, logger)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,58 @@
+""" Compare "full", "sampled" and "trusted" validation modes on bulk payloads.
+
+    python -m benchmarks.validation --items 100000 --repeat 3 --sample-rate 100
+"""
+from __future__ import annotations
+
+from dkc_api.v1.records import construct, VALIDATION_MODES
+from dkc_api.v1.objects.catalog.models import GetMaterialStock
+from dkc_api.v1.objects.content.models import GetRevisionMaterials, GetRevisionLast
+
+from . import payloads
+
+import gc
+import json
+import time
+import argparse
+
+
+CASES = (
+    ("getMaterialStock", GetMaterialStock, payloads.material_stock),
+    ("getRevisionMaterials", GetRevisionMaterials, payloads.revision_materials),
+    ("getRevisionsLast", GetRevisionLast, payloads.revisions_last),
+)
+
+
+def measure(model, data, validation: str, sample_rate: int, repeat: int) -> float:
+    """ Best time of building responce object in seconds """
+    best = float("inf")
+    for _ in range(repeat):
+        gc.collect()
+        start = time.perf_counter()
+        result = construct(model, data, validation, sample_rate)
+        best = min(best, time.perf_counter() - start)
+        del result
+    return best
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--items", type=int, default=100000, help="Count of items in every payload")
+    parser.add_argument("--repeat", type=int, default=3, help="Count of runs, best is reported")
+    parser.add_argument("--sample-rate", type=int, default=100, help="1 in N items is validated in sampled mode")
+    args = parser.parse_args()
+
+    print(f"{'payload':<22}{'mode':<10}{'seconds':>10}{'items/s':>14}{'speedup':>10}")
+    for name, model, generate in CASES:
+        # Round trip through json, so payload has same types as decoded responce
+        data = json.loads(json.dumps(generate(args.items)))
+
+        full = None
+        for validation in VALIDATION_MODES:
+            seconds = measure(model, data, validation, args.sample_rate, args.repeat)
+            if full is None: full = seconds
+            print(f"{name:<22}{validation:<10}{seconds:>10.3f}{args.items / seconds:>14,.0f}{full / seconds:>9.1f}x")
+
+
+if __name__ == "__main__":
+    main()
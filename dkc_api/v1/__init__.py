@@ -1,11 +1,60 @@
-from .exceptions.exceptions import AuthError
+""" Names of package are imported on first access (PEP 562), so `import dkc_api.v1` not load pydantic models,
+requests and loguru. `from dkc_api.v1 import Catalog` works as before. """
+from __future__ import annotations
+from typing import TYPE_CHECKING, Any
 
-from .models.auth import AuthResponceError, AuthResponceSuccess
-from .models.error import ResponceError
+import importlib
 
-from .objects.catalog.catalog import Catalog
-from .objects.catalog.models import GetMaterial, GetMaterialDescription, GetMaterialAnalogs, GetMaterialSpecification, \
-                                    GetMaterialDrawingsSketch, GetMaterialVideo, GetMaterialRelated, GetMaterialStock, \
-                                    GetMaterialAccessories, GetMaterialCertificates
-                                    
-from .objects.news.news import News
+if TYPE_CHECKING:
+    from .exceptions.exceptions import AuthError
+
+    from .models.auth import AuthResponceError, AuthResponceSuccess
+    from .models.error import ResponceError
+
+    from .dkc_api import DkcAPI
+    from .async_dkc_api import AsyncDkcAPI
+
+    from .objects.catalog.catalog import Catalog
+    from .objects.catalog.models import GetMaterial, GetMaterialDescription, GetMaterialAnalogs, GetMaterialSpecification, \
+                                        GetMaterialDrawingsSketch, GetMaterialVideo, GetMaterialRelated, GetMaterialStock, \
+                                        GetMaterialAccessories, GetMaterialCertificates
+
+    from .objects.news.news import News
+
+
+# Name of export -> module (relative to package) how has it
+_EXPORTS = {
+    "AuthError": ".exceptions.exceptions",
+    "AuthResponceError": ".models.auth",
+    "AuthResponceSuccess": ".models.auth",
+    "ResponceError": ".models.error",
+    "DkcAPI": ".dkc_api",
+    "AsyncDkcAPI": ".async_dkc_api",
+    "Catalog": ".objects.catalog.catalog",
+    "GetMaterial": ".objects.catalog.models",
+    "GetMaterialDescription": ".objects.catalog.models",
+    "GetMaterialAnalogs": ".objects.catalog.models",
+    "GetMaterialSpecification": ".objects.catalog.models",
+    "GetMaterialDrawingsSketch": ".objects.catalog.models",
+    "GetMaterialVideo": ".objects.catalog.models",
+    "GetMaterialRelated": ".objects.catalog.models",
+    "GetMaterialStock": ".objects.catalog.models",
+    "GetMaterialAccessories": ".objects.catalog.models",
+    "GetMaterialCertificates": ".objects.catalog.models",
+    "News": ".objects.news.news",
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name: str) -> Any:
+    if name not in _EXPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(importlib.import_module(_EXPORTS[name], __name__), name)
+    globals()[name] = value  # Next access is usual attribute access
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(_EXPORTS))
@@ -0,0 +1,187 @@
+from __future__ import annotations
+from typing import TYPE_CHECKING, Optional, Union
+from json import JSONDecodeError
+
+from .exceptions.exceptions import AuthError
+from .lazy import logger as default_logger
+from .models.auth import AuthResponceSuccess, AuthResponceError
+from .storage import TokenStorage
+from .async_transport import AsyncTransport
+from .metrics import Metrics
+from .responce import decode_json, record_call, NOT_JSON_MESSAGE
+from .auth import AUTH_ERROR_STATUSES
+
+import time
+import asyncio
+import weakref
+
+from pydantic.error_wrappers import ValidationError
+
+if TYPE_CHECKING:
+    import httpx
+    import loguru
+
+
+# Renew lock of every storage, so AsyncDkcAPI clients how share one storage in one event loop renew token once
+_storage_locks: weakref.WeakKeyDictionary[TokenStorage, asyncio.Lock] = weakref.WeakKeyDictionary()
+
+
+class AsyncTokenManager:
+    """ Lazy access token of AsyncDkcAPI, asyncio version of `TokenManager`. Token is got from storage (or api)
+    on first request, and is renewed once for all coroutines when api answers 401/403 """
+
+    def __init__(self, master_key: str, storage: TokenStorage, transport: AsyncTransport, url_domain: str,
+                 debug: bool=False, logger: loguru.Logger = default_logger, min_renew_interval: float=10.0,
+                 metrics: Metrics = None) -> None:
+        """ Lazy access token of AsyncDkcAPI. Arguments are the same as in `TokenManager` """
+        self.master_key = master_key
+        self.storage = storage
+        self.transport = transport
+        self.url_domain = url_domain
+        self.debug = debug
+        self.logger = logger
+        self.min_renew_interval = min_renew_interval
+        self.metrics = metrics
+
+        self.access_token: Optional[str] = None
+        self.renewed_at: Optional[float] = None
+        self.expires_at: Optional[float] = None
+        self._lock: Optional[asyncio.Lock] = None
+
+    @property
+    def lock(self) -> asyncio.Lock:
+        """ Renew lock of storage, shared by all managers of this storage. Lock is created in running event loop """
+        if self._lock is None:
+            self._lock = _storage_locks.get(self.storage)
+            if self._lock is None: self._lock = _storage_locks[self.storage] = asyncio.Lock()
+        return self._lock
+
+    async def get(self) -> str:
+        """ Current access token. On first call token is read from storage, if storage is empty - got from api.
+
+        Raises:
+            AuthError: If api not give access token.
+        """
+        access_token = self.access_token
+        if access_token is not None and not self._is_expired(): return access_token
+
+        async with self.lock:
+            if self.access_token is None or self._is_expired():
+                self._set_token(await asyncio.to_thread(self.storage.get_access_token))
+                if self.access_token is None: await self._renew_shared(None)
+                elif self.debug: self.logger.debug("Access token success get from storage")
+            return self.access_token
+
+    def _is_expired(self) -> bool:
+        """ Expiry of storage (`SQLiteTokenStorage(token_ttl=...)`) is passed, token must be read from storage again """
+        return self.expires_at is not None and time.time() >= self.expires_at
+
+    def _set_token(self, access_token: Optional[str]) -> None:
+        """ Set token how is read from storage or saved to it, with expiry of storage (None if storage has no expiry) """
+        self.access_token = access_token
+        self.expires_at = getattr(self.storage, "expires_at", None) if access_token is not None else None
+
+    async def renew(self, stale_token: Optional[str]) -> str:
+        """ Get new access token if `stale_token` is still current one. Concurrent callers with same stale token
+        wait one request to api and get the same new token (single-flight).
+
+        Returns:
+            str: Current access token after renew.
+        """
+        async with self.lock:
+            if self.access_token != stale_token: return self.access_token
+            if self.renewed_at is not None and time.monotonic() - self.renewed_at < self.min_renew_interval:
+                return self.access_token
+
+            self.logger.warning("Token not work. Get new token and write to storage.")
+            await self._renew_shared(stale_token)
+            return self.access_token
+
+    async def _renew_shared(self, stale_token: Optional[str]) -> None:
+        """ Renew token. If other process already saved new token to storage - use it, not send request to api.
+        Storage is used in thread (its lock can wait other process), and lock of storage is not held while request
+        to api is awaited. Must be called with lock """
+        stored_token = await asyncio.to_thread(self._read_stored_token)
+        if stored_token is not None and stored_token != stale_token:
+            self._set_token(stored_token)
+            self.renewed_at = time.monotonic()
+            if self.debug: self.logger.debug("Access token success get from storage, renewed by other process")
+            return
+
+        await self._renew()
+
+    def _read_stored_token(self) -> Optional[str]:
+        """ Read token in lock of storage, so token how other process is saving now is got """
+        with self.storage.lock():
+            return self.storage.get_access_token()
+
+    async def _renew(self) -> None:
+        """ Get new token from api and save it. Must be called with lock """
+        model_access_token = await self.send_get_request_access_token()
+
+        if isinstance(model_access_token, AuthResponceError):
+            raise AuthError(f"Access token not get. Responce message -> `{model_access_token.message}`")
+
+        saved = await asyncio.to_thread(self.storage.save_token, model_access_token.access_token)
+        self._set_token(model_access_token.access_token)
+        if not saved: self.expires_at = None  # Expiry of storage is not of this token, token is used until 401/403
+        self.renewed_at = time.monotonic()
+
+        if self.debug: self.logger.debug("Access token success get from api")
+
+    async def send_get_request_access_token(self) -> Union[AuthResponceSuccess, AuthResponceError]:
+        """ Get access token for use master key.
+
+        Returns:
+            AuthResponce[Succces/Error]: Return acces token or error message
+        """
+        responce = await self.transport.get(f'{self.url_domain}/auth.access.token/{self.master_key}')
+
+        start = time.perf_counter()
+        try: data = decode_json(responce.content)
+        except JSONDecodeError: data = None
+        decoded = time.perf_counter()
+
+        if not isinstance(data, dict): result = AuthResponceError(code=responce.status_code, message=NOT_JSON_MESSAGE)
+        else:
+            try: result = AuthResponceSuccess(**{ 'code': responce.status_code, **data })
+            except ValidationError: result = AuthResponceError(**{ 'code': responce.status_code, **data })
+
+        record_call(self.metrics, "auth", responce, decoded - start, time.perf_counter() - decoded,
+                    isinstance(result, AuthResponceError))
+        return result
+
+
+class AsyncAuthorizedTransport:
+    """ Asyncio version of `AuthorizedTransport`: add access token to every request. If api answers 401/403,
+    token is renewed (once for all concurrent callers) and request is sent again one time. Other attributes
+    are taken from wrapped transport. """
+
+    def __init__(self, transport: AsyncTransport, auth: AsyncTokenManager) -> None:
+        self.transport = transport
+        self.auth = auth
+
+    async def request(self, method: str, url: str, **kwargs) -> httpx.Response:
+        """ Send request with access token, renew token and repeat request on 401/403 """
+        headers = kwargs.pop("headers", None) or {}
+
+        access_token = await self.auth.get()
+        responce = await self.transport.request(method, url, headers={ **headers, "AccessToken": access_token }, **kwargs)
+        if responce.status_code not in AUTH_ERROR_STATUSES: return responce
+
+        new_access_token = await self.auth.renew(access_token)
+        if new_access_token == access_token: return responce
+
+        await responce.aclose()
+        return await self.transport.request(method, url, headers={ **headers, "AccessToken": new_access_token }, **kwargs)
+
+    async def get(self, url: str, **kwargs) -> httpx.Response:
+        """ Send GET request with access token """
+        return await self.request("GET", url, **kwargs)
+
+    async def post(self, url: str, **kwargs) -> httpx.Response:
+        """ Send POST request with access token """
+        return await self.request("POST", url, **kwargs)
+
+    def __getattr__(self, name: str):
+        return getattr(self.transport, name)
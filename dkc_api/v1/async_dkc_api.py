@@ -0,0 +1,135 @@
+from __future__ import annotations
+from typing import TYPE_CHECKING, Union, Optional
+
+from .const import URL_DOMAIN, DEFAULT_HEADERS
+from .lazy import logger as default_logger, lazy_object
+
+from .exceptions.exceptions import AuthError
+
+from .storage import TokenStorage, FileTokenStorage
+from .async_transport import AsyncTransport
+from .async_auth import AsyncTokenManager, AsyncAuthorizedTransport
+from .metrics import Metrics
+from .records import check_validation, DEFAULT_SAMPLE_RATE
+
+if TYPE_CHECKING:
+    import loguru
+
+    from .models.auth import AuthResponceSuccess, AuthResponceError
+
+    # Modules of objects (with their models) are imported on first access of object, see `lazy_object`
+    from .objects.catalog.async_catalog import AsyncCatalog
+    from .objects.news.async_news import AsyncNews
+    from .objects.content.async_content import AsyncContent
+    from .objects.delivery.async_delivery import AsyncDelivery
+    from .objects.delivery.quotes import QuoteCache
+
+
+class AsyncDkcAPI:
+    def __init__(self, master_key: str, storage: TokenStorage = None, debug: bool = False,
+                 logger: loguru.Logger = default_logger, transport: AsyncTransport = None, validation: str = "full",
+                 sample_rate: int = DEFAULT_SAMPLE_RATE, url_domain: str = URL_DOMAIN,
+                 quote_cache: QuoteCache = None, metrics: Metrics = None) -> None:
+        """ AsyncDkcAPI - is asyncio connector to DKC api. Methods of objects are the same as in `DkcAPI`,
+            only they need to be awaited. Need `httpx` package (python -m pip install dkc-api[async]).
+
+            As in `DkcAPI`, access token is got on first request and renewed (once for all coroutines) when api
+            answers 401/403. For get token before first request call `await dkc_api.authorize()`.
+
+            >>> async with AsyncDkcAPI(master_key="xxxxxxxxxx") as dkc_api:
+            >>>     await dkc_api.Catalog.getMaterial(code="FKC600INOX316L")
+            >>>     await asyncio.gather(*[dkc_api.Catalog.getMaterial(code=code) for code in codes])
+
+            Count of requests in flight is bounded by `AsyncTransport(max_concurrency=...)`.
+            `validation`, `sample_rate`, `url_domain`, `quote_cache` and `metrics` are the same as in `DkcAPI`.
+        """
+        self.master_key = master_key
+        self.logger = logger
+        self.debug = debug
+        self.url_domain = url_domain
+
+        check_validation(validation, sample_rate)
+
+        self.storage = storage if storage is not None else FileTokenStorage()
+        self.headers = dict(DEFAULT_HEADERS)
+        self.transport = transport if transport is not None else AsyncTransport()
+        self.metrics = metrics if metrics is not None else Metrics(logger=self.logger)
+
+        # Token is got on first request and renewed on 401/403, objects send requests through auth middleware
+        self.auth = AsyncTokenManager(master_key, storage=self.storage, transport=self.transport, url_domain=url_domain,
+                                      debug=self.debug, logger=self.logger, metrics=self.metrics)
+        self.authorized_transport = AsyncAuthorizedTransport(self.transport, self.auth)
+
+        # Objects are built on first access, so short jobs load only models of objects how they use
+        self._validation = validation
+        self._sample_rate = sample_rate
+        self._quote_cache = quote_cache
+
+    @lazy_object
+    def Catalog(self) -> AsyncCatalog:
+        from .objects.catalog.async_catalog import AsyncCatalog
+        return AsyncCatalog(None, headers=self.headers, transport=self.authorized_transport, debug=self.debug,
+                            logger=self.logger, validation=self._validation, sample_rate=self._sample_rate,
+                            url_domain=self.url_domain, metrics=self.metrics)
+
+    @lazy_object
+    def News(self) -> AsyncNews:
+        from .objects.news.async_news import AsyncNews
+        return AsyncNews(None, headers=self.headers, transport=self.authorized_transport, debug=self.debug,
+                         logger=self.logger, url_domain=self.url_domain, metrics=self.metrics)
+
+    @lazy_object
+    def Content(self) -> AsyncContent:
+        from .objects.content.async_content import AsyncContent
+        return AsyncContent(None, headers=self.headers, transport=self.authorized_transport, debug=self.debug,
+                            logger=self.logger, validation=self._validation, sample_rate=self._sample_rate,
+                            url_domain=self.url_domain, metrics=self.metrics)
+
+    @lazy_object
+    def Delivery(self) -> AsyncDelivery:
+        from .objects.delivery.async_delivery import AsyncDelivery
+        return AsyncDelivery(None, headers=self.headers, transport=self.authorized_transport, debug=self.debug,
+                             logger=self.logger, url_domain=self.url_domain, quote_cache=self._quote_cache,
+                             metrics=self.metrics)
+
+    @property
+    def access_token(self) -> Optional[str]:
+        """ Current access token, None before first request """
+        return self.auth.access_token
+
+    async def authorize(self) -> str:
+        """ Get access token now, not on first request.
+
+        Raises:
+            AuthError: If api not give access token.
+
+        Returns:
+            str: Access token.
+        """
+        return await self.auth.get()
+
+    async def get_new_access_token_from_api(self) -> Optional[AuthError]:
+        """ Get new access token and chech his to error. Other save his to storage.
+
+        Raises:
+            AuthError: Auth error model
+        """
+        await self.auth.renew(self.auth.access_token)
+
+    async def send_get_request_access_token(self) -> Union[AuthResponceSuccess, AuthResponceError]:
+        """ Get access token for use master key.
+
+        Returns:
+            AuthResponce[Succces/Error]: Return acces token or error message
+        """
+        return await self.auth.send_get_request_access_token()
+
+    async def aclose(self) -> None:
+        """ Close transport connections """
+        await self.transport.aclose()
+
+    async def __aenter__(self) -> AsyncDkcAPI:
+        return self
+
+    async def __aexit__(self, *args) -> None:
+        await self.aclose()
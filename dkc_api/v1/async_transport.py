@@ -0,0 +1,78 @@
+from __future__ import annotations
+from typing import Optional
+
+import time
+import asyncio
+
+try:
+    import httpx
+except ImportError:
+    httpx = None
+
+
+class AsyncTransport:
+    """ Shared asyncio HTTP transport for AsyncDkcAPI objects. Keep-alive client with bounded concurrency """
+
+    def __init__(self, max_connections: int=100, max_keepalive_connections: int=20, max_concurrency: int=100,
+                 timeout: Optional[float]=None) -> None:
+        """ Shared asyncio HTTP transport for AsyncDkcAPI objects. Need `httpx` package
+            (python -m pip install dkc-api[async]).
+
+            Args:
+                max_connections (int, optional): Max count of opened connections. Defaults to 100.
+                max_keepalive_connections (int, optional): Max count of idle keep-alive connections. Defaults to 20.
+                max_concurrency (int, optional): Max count of requests in flight, other requests wait. Defaults to 100.
+                timeout (float, optional): Timeout for every request in seconds. Defaults to None (without timeout).
+        """
+        if httpx is None:
+            raise ImportError("AsyncTransport need `httpx` package. Install it: python -m pip install dkc-api[async]")
+
+        self.max_concurrency = max_concurrency
+        self.client = httpx.AsyncClient(
+            limits=httpx.Limits(max_connections=max_connections, max_keepalive_connections=max_keepalive_connections),
+            timeout=timeout
+        )
+        self._semaphore: Optional[asyncio.Semaphore] = None
+
+    @property
+    def semaphore(self) -> asyncio.Semaphore:
+        """ Semaphore how bound count requests in flight. Created in running event loop """
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+        return self._semaphore
+
+    async def request(self, method: str, url: str, **kwargs) -> httpx.Response:
+        """ Send request with shared client.
+
+        Args:
+            method (str): HTTP method.
+            url (str): Full url.
+            **kwargs: Other arguments for `httpx.AsyncClient.request`.
+
+        Returns:
+            httpx.Response: Responce from server. `network_time` attribute is time of request with body transfer
+            in seconds, as in `Transport`.
+        """
+        async with self.semaphore:
+            start = time.perf_counter()
+            responce = await self.client.request(method, url, **kwargs)
+            responce.network_time = time.perf_counter() - start
+            return responce
+
+    async def get(self, url: str, **kwargs) -> httpx.Response:
+        """ Send GET request with shared client """
+        return await self.request("GET", url, **kwargs)
+
+    async def post(self, url: str, **kwargs) -> httpx.Response:
+        """ Send POST request with shared client """
+        return await self.request("POST", url, **kwargs)
+
+    async def aclose(self) -> None:
+        """ Close all opened connections """
+        await self.client.aclose()
+
+    async def __aenter__(self) -> AsyncTransport:
+        return self
+
+    async def __aexit__(self, *args) -> None:
+        await self.aclose()
@@ -0,0 +1,184 @@
+from __future__ import annotations
+from typing import TYPE_CHECKING, Optional, Union
+from json import JSONDecodeError
+
+from .exceptions.exceptions import AuthError
+from .lazy import logger as default_logger
+from .models.auth import AuthResponceSuccess, AuthResponceError
+from .storage import TokenStorage
+from .transport import Transport
+from .metrics import Metrics
+from .responce import decode_json, record_call
+
+import time
+import threading
+
+import requests
+from pydantic.error_wrappers import ValidationError
+
+if TYPE_CHECKING:
+    import loguru
+
+
+# Statuses how mean that access token is not valid
+AUTH_ERROR_STATUSES = (401, 403)
+
+
+class TokenManager:
+    """ Lazy access token of DkcAPI. Token is got from storage (or api) on first request, and is renewed once
+    for all threads when api answers 401/403 """
+
+    def __init__(self, master_key: str, storage: TokenStorage, transport: Transport, url_domain: str,
+                 debug: bool=False, logger: loguru.Logger = default_logger, min_renew_interval: float=10.0,
+                 metrics: Metrics = None) -> None:
+        """ Lazy access token of DkcAPI.
+
+            Args:
+                master_key (str): Master key for get access token.
+                storage (TokenStorage): Storage of access token.
+                transport (Transport): Transport for auth requests.
+                url_domain (str): Api url.
+                debug (bool, optional): Debug log. Defaults to False.
+                logger (loguru.Logger, optional): Logger.
+                min_renew_interval (float, optional): Token is not renewed again earlier than this count of seconds,
+                    so 403 of not auth reason do not send auth request on every call. Defaults to 10.
+                metrics (Metrics, optional): Metrics for record auth requests (endpoint "auth"). Defaults to None.
+        """
+        self.master_key = master_key
+        self.storage = storage
+        self.transport = transport
+        self.url_domain = url_domain
+        self.debug = debug
+        self.logger = logger
+        self.min_renew_interval = min_renew_interval
+        self.metrics = metrics
+
+        self.access_token: Optional[str] = None
+        self.renewed_at: Optional[float] = None
+        self.expires_at: Optional[float] = None
+        self._lock = threading.Lock()
+
+    def get(self) -> str:
+        """ Current access token. On first call token is read from storage, if storage is empty - got from api.
+
+        Raises:
+            AuthError: If api not give access token.
+        """
+        access_token = self.access_token
+        if access_token is not None and not self._is_expired(): return access_token
+
+        with self._lock:
+            if self.access_token is None or self._is_expired():
+                self._set_token(self.storage.get_access_token())
+                if self.access_token is None: self._renew_shared(None)
+                elif self.debug: self.logger.debug("Access token success get from storage")
+            return self.access_token
+
+    def _is_expired(self) -> bool:
+        """ Expiry of storage (`SQLiteTokenStorage(token_ttl=...)`) is passed, token must be read from storage again """
+        return self.expires_at is not None and time.time() >= self.expires_at
+
+    def _set_token(self, access_token: Optional[str]) -> None:
+        """ Set token how is read from storage or saved to it, with expiry of storage (None if storage has no expiry) """
+        self.access_token = access_token
+        self.expires_at = getattr(self.storage, "expires_at", None) if access_token is not None else None
+
+    def renew(self, stale_token: Optional[str]) -> str:
+        """ Get new access token if `stale_token` is still current one. Concurrent callers with same stale token
+        wait one request to api and get the same new token (single-flight).
+
+        Returns:
+            str: Current access token after renew.
+        """
+        with self._lock:
+            if self.access_token != stale_token: return self.access_token
+            if self.renewed_at is not None and time.monotonic() - self.renewed_at < self.min_renew_interval:
+                return self.access_token
+
+            self.logger.warning("Token not work. Get new token and write to storage.")
+            self._renew_shared(stale_token)
+            return self.access_token
+
+    def _renew_shared(self, stale_token: Optional[str]) -> None:
+        """ Renew token in lock of storage. If other process already saved new token to storage - use it, not
+        send request to api. Must be called with lock """
+        with self.storage.lock():
+            stored_token = self.storage.get_access_token()
+            if stored_token is not None and stored_token != stale_token:
+                self._set_token(stored_token)
+                self.renewed_at = time.monotonic()
+                if self.debug: self.logger.debug("Access token success get from storage, renewed by other process")
+                return
+
+            self._renew()
+
+    def _renew(self) -> None:
+        """ Get new token from api and save it. Must be called with lock """
+        model_access_token = self.send_get_request_access_token()
+
+        if isinstance(model_access_token, AuthResponceError):
+            raise AuthError(f"Access token not get. Responce message -> `{model_access_token.message}`")
+
+        saved = self.storage.save_token(model_access_token.access_token)
+        self._set_token(model_access_token.access_token)
+        if not saved: self.expires_at = None  # Expiry of storage is not of this token, token is used until 401/403
+        self.renewed_at = time.monotonic()
+
+        if self.debug: self.logger.debug("Access token success get from api")
+
+    def send_get_request_access_token(self) -> Union[AuthResponceSuccess, AuthResponceError]:
+        """ Get access token for use master key.
+
+        Returns:
+            AuthResponce[Succces/Error]: Return acces token or error message
+        """
+        responce = self.transport.get(f'{self.url_domain}/auth.access.token/{self.master_key}')
+
+        start = time.perf_counter()
+        try: data = decode_json(responce.content)
+        except JSONDecodeError:
+            record_call(self.metrics, "auth", responce, time.perf_counter() - start, 0.0, True)
+            raise
+        decoded = time.perf_counter()
+
+        try: result = AuthResponceSuccess(**{ 'code': responce.status_code, **data })
+        except ValidationError: result = AuthResponceError(**{ 'code': responce.status_code, **data })
+
+        record_call(self.metrics, "auth", responce, decoded - start, time.perf_counter() - decoded,
+                    isinstance(result, AuthResponceError))
+        return result
+
+
+class AuthorizedTransport:
+    """ Transport middleware how add access token to every request. If api answers 401/403, token is renewed
+    (once for all concurrent callers) and request is sent again one time. Other attributes are taken from
+    wrapped transport. """
+
+    def __init__(self, transport: Transport, auth: TokenManager) -> None:
+        self.transport = transport
+        self.auth = auth
+
+    def request(self, method: str, url: str, **kwargs) -> requests.Response:
+        """ Send request with access token, renew token and repeat request on 401/403 """
+        headers = kwargs.pop("headers", None) or {}
+
+        access_token = self.auth.get()
+        responce = self.transport.request(method, url, headers={ **headers, "AccessToken": access_token }, **kwargs)
+        if responce.status_code not in AUTH_ERROR_STATUSES: return responce
+
+        new_access_token = self.auth.renew(access_token)
+        if new_access_token == access_token: return responce
+
+        responce.close()
+        return self.transport.request(method, url, headers={ **headers, "AccessToken": new_access_token }, **kwargs)
+
+    def get(self, url: str, **kwargs) -> requests.Response:
+        """ Send GET request with access token """
+        return self.request("GET", url, **kwargs)
+
+    def post(self, url: str, **kwargs) -> requests.Response:
+        """ Send POST request with access token """
+        return self.request("POST", url, **kwargs)
+
+    def __getattr__(self, name: str):
+        return getattr(self.transport, name)
@@ -0,0 +1,314 @@
+from __future__ import annotations
+from typing import Callable, Iterator, Optional
+from collections import OrderedDict
+
+from .models.cache import CacheStats
+
+import os
+import json
+import time
+import hashlib
+import threading
+
+import requests
+from requests.structures import CaseInsensitiveDict
+
+
+# Default time to live of catalog endpoints in seconds. Endpoint how absent here is not cached.
+DEFAULT_TTL = {
+    "getMaterial": 3600,
+    "getMaterialCertificates": 86400,
+    "getMaterialRelated": 86400,
+    "getMaterialAccessories": 86400,
+    "getMaterialVideo": 86400,
+    "getMaterialDrawingsSketch": 86400,
+    "getMaterialDescription": 86400,
+    "getMaterialAnalogs": 86400,
+    "getMaterialSpecification": 86400,
+}
+
+
+class CacheEntry:
+    """ Cached responce body with validators for conditional request """
+    __slots__ = ("endpoint", "url", "status_code", "content", "etag", "last_modified", "expires")
+
+    def __init__(self, endpoint: str, url: str, status_code: int, content: bytes, etag: Optional[str]=None,
+                 last_modified: Optional[str]=None, expires: float=0.0) -> None:
+        self.endpoint = endpoint
+        self.url = url
+        self.status_code = status_code
+        self.content = content
+        self.etag = etag
+        self.last_modified = last_modified
+        self.expires = expires
+
+    @classmethod
+    def from_responce(cls, endpoint: str, url: str, responce: requests.Response, expires: float) -> CacheEntry:
+        return cls(endpoint, url, responce.status_code, responce.content, responce.headers.get("ETag"),
+                   responce.headers.get("Last-Modified"), expires)
+
+    def to_responce(self) -> requests.Response:
+        """ Build `requests.Response` with cached body """
+        responce = requests.Response()
+        responce.status_code = self.status_code
+        responce.url = self.url
+        responce.encoding = "utf-8"
+        responce.headers = CaseInsensitiveDict({ "Content-Type": "application/json" })
+        responce._content = self.content
+        return responce
+
+    def meta(self) -> dict:
+        return { name: getattr(self, name) for name in self.__slots__ if name != "content" }
+
+
+class ResponseCache:
+    """ Base class of responce cache for Catalog endpoints. Subclass must implement `get`, `set`, `delete`, `entries` """
+
+    def __init__(self, ttl: Optional[dict[str, float]]=None, default_ttl: float=0) -> None:
+        """ Base class of responce cache.
+
+            Args:
+                ttl (dict[str, float], optional): Time to live in seconds by Catalog method name.
+                    Is merged with `DEFAULT_TTL`. Defaults to None.
+                default_ttl (float, optional): Time to live of methods absent in `ttl`. 0 - not cache. Defaults to 0.
+        """
+        self.ttl = { **DEFAULT_TTL, **(ttl or {}) }
+        self.default_ttl = default_ttl
+
+        self.hits = 0
+        self.misses = 0
+        self.revalidated = 0
+        self._lock = threading.RLock()
+
+    def get(self, key: str) -> Optional[CacheEntry]: ...
+
+    def set(self, key: str, entry: CacheEntry) -> None: ...
+
+    def delete(self, key: str) -> None: ...
+
+    def entries(self) -> Iterator[tuple[str, CacheEntry]]: ...
+
+    def size_bytes(self) -> int: ...
+
+    def meta_entries(self) -> Iterator[tuple[str, CacheEntry]]:
+        """ Entries without body (`content` may be empty), for `invalidate`. Subclass how store bodies out of
+        memory should override it, default is `entries` """
+        return self.entries()
+
+    def count(self) -> int:
+        """ Count of entries, for `stats` """
+        return sum(1 for _ in self.meta_entries())
+
+    def get_ttl(self, endpoint: str) -> float:
+        return self.ttl.get(endpoint, self.default_ttl)
+
+    def fetch(self, endpoint: str, url: str, send: Callable[[dict], requests.Response]) -> requests.Response:
+        """ Return cached responce or send request. Expired entry is revalidated by conditional request
+        (`If-None-Match` / `If-Modified-Since`) if server gave `ETag` / `Last-Modified`.
+
+        Args:
+            endpoint (str): Catalog method name, used for ttl.
+            url (str): Full url, used as key.
+            send (Callable[[dict], requests.Response]): Function how send request with additional headers.
+        """
+        ttl = self.get_ttl(endpoint)
+        if ttl <= 0: return send({})
+
+        entry = self.get(url)
+        now = time.time()
+
+        if entry is not None and entry.expires > now:
+            with self._lock: self.hits += 1
+            return entry.to_responce()
+
+        conditional_headers = {}
+        if entry is not None and entry.etag: conditional_headers["If-None-Match"] = entry.etag
+        if entry is not None and entry.last_modified: conditional_headers["If-Modified-Since"] = entry.last_modified
+
+        responce = send(conditional_headers)
+
+        if responce.status_code == 304 and entry is not None:
+            entry.expires = time.time() + ttl
+            self.set(url, entry)
+            with self._lock: self.revalidated += 1
+            return entry.to_responce()
+
+        with self._lock: self.misses += 1
+        if responce.status_code == 200:
+            self.set(url, CacheEntry.from_responce(endpoint, url, responce, time.time() + ttl))
+        return responce
+
+    def invalidate(self, endpoint: Optional[str]=None, url: Optional[str]=None) -> int:
+        """ Remove entries. Without arguments removes all entries.
+
+        Args:
+            endpoint (str, optional): Remove all entries of Catalog method.
+            url (str, optional): Remove entry of url.
+
+        Returns:
+            int: Count of removed entries.
+        """
+        removed = 0
+        for key, entry in list(self.meta_entries()):
+            if (endpoint is None or entry.endpoint == endpoint) and (url is None or entry.url == url):
+                self.delete(key)
+                removed += 1
+        return removed
+
+    @property
+    def stats(self) -> CacheStats:
+        """ Hit, miss and revalidation counters with current size """
+        with self._lock:
+            return CacheStats(hits=self.hits, misses=self.misses, revalidated=self.revalidated,
+                              entries=self.count(), size_bytes=self.size_bytes())
+
+
+class MemoryCache(ResponseCache):
+    """ In-memory LRU responce cache """
+
+    def __init__(self, max_entries: int=10000, max_bytes: int=256 * 1024 * 1024, ttl: Optional[dict[str, float]]=None,
+                 default_ttl: float=0) -> None:
+        """ In-memory LRU responce cache. Least recently used entries are evicted over `max_entries` or `max_bytes`.
+
+            Args:
+                max_entries (int, optional): Max count of entries. Defaults to 10000.
+                max_bytes (int, optional): Max size of cached bodies in bytes. Defaults to 256 MB.
+                ttl (dict[str, float], optional): Time to live in seconds by Catalog method name.
+                default_ttl (float, optional): Time to live of methods absent in `ttl`. Defaults to 0.
+        """
+        super().__init__(ttl=ttl, default_ttl=default_ttl)
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+
+        self._entries: OrderedDict[str, CacheEntry] = OrderedDict()
+        self._size = 0
+
+    def get(self, key: str) -> Optional[CacheEntry]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None: self._entries.move_to_end(key)
+            return entry
+
+    def set(self, key: str, entry: CacheEntry) -> None:
+        with self._lock:
+            self.delete(key)
+            self._entries[key] = entry
+            self._size += len(entry.content)
+
+            while self._entries and (len(self._entries) > self.max_entries or self._size > self.max_bytes):
+                _, evicted = self._entries.popitem(last=False)
+                self._size -= len(evicted.content)
+
+    def delete(self, key: str) -> None:
+        with self._lock:
+            entry = self._entries.pop(key, None)
+            if entry is not None: self._size -= len(entry.content)
+
+    def entries(self) -> Iterator[tuple[str, CacheEntry]]:
+        with self._lock:
+            return iter(list(self._entries.items()))
+
+    def size_bytes(self) -> int:
+        return self._size
+
+
+class DiskCache(ResponseCache):
+    """ Persistent on-disk responce cache. One file per entry """
+
+    def __init__(self, path: str, max_bytes: int=1024 * 1024 * 1024, ttl: Optional[dict[str, float]]=None,
+                 default_ttl: float=0) -> None:
+        """ Persistent on-disk responce cache. Least recently used files are evicted over `max_bytes`.
+
+            Args:
+                path (str): Directory of cache files. Created if not exists.
+                max_bytes (int, optional): Max size of cache files in bytes. Defaults to 1 GB.
+                ttl (dict[str, float], optional): Time to live in seconds by Catalog method name.
+                default_ttl (float, optional): Time to live of methods absent in `ttl`. Defaults to 0.
+        """
+        super().__init__(ttl=ttl, default_ttl=default_ttl)
+        self.path = path
+        self.max_bytes = max_bytes
+
+        os.makedirs(path, exist_ok=True)
+        self._size: Optional[int] = None
+
+    def _file(self, key: str) -> str:
+        return os.path.join(self.path, hashlib.sha256(key.encode("utf-8")).hexdigest() + ".cache")
+
+    def _read(self, file: str, content: bool=True) -> Optional[CacheEntry]:
+        """ Read entry of file, without `content` only first line (meta) is read and body is empty """
+        try:
+            with open(file, "rb") as f:
+                meta = json.loads(f.readline())
+                return CacheEntry(content=f.read() if content else b"", **meta)
+        except (OSError, ValueError, TypeError):
+            return None
+
+    def get(self, key: str) -> Optional[CacheEntry]:
+        file = self._file(key)
+        entry = self._read(file)
+        if entry is not None:
+            try: os.utime(file)
+            except OSError: pass
+        return entry
+
+    def set(self, key: str, entry: CacheEntry) -> None:
+        file = self._file(key)
+        temp_file = f"{file}.{os.getpid()}.{threading.get_ident()}.tmp"
+
+        with open(temp_file, "wb") as f:
+            f.write(json.dumps(entry.meta()).encode("utf-8") + b"\n")
+            f.write(entry.content)
+
+        with self._lock:
+            if self._size is None: self._size = self.size_bytes()
+            try: self._size -= os.path.getsize(file)
+            except OSError: pass
+
+            os.replace(temp_file, file)
+            self._size += os.path.getsize(file)
+
+            if self._size > self.max_bytes: self._evict()
+
+    def delete(self, key: str) -> None:
+        with self._lock:
+            file = self._file(key)
+            try:
+                size = os.path.getsize(file)
+                os.remove(file)
+            except FileNotFoundError:
+                return
+            if self._size is not None: self._size -= size
+
+    def _files(self) -> list[os.DirEntry]:
+        return [file for file in os.scandir(self.path) if file.name.endswith(".cache")]
+
+    def _evict(self) -> None:
+        """ Remove least recently used files while size is over `max_bytes` """
+        with self._lock:
+            files = sorted(self._files(), key=lambda file: file.stat().st_mtime)
+            size = sum(file.stat().st_size for file in files)
+
+            for file in files:
+                if size <= self.max_bytes: break
+                size -= file.stat().st_size
+                try: os.remove(file.path)
+                except FileNotFoundError: pass
+
+            self._size = size
+
+    def entries(self) -> Iterator[tuple[str, CacheEntry]]:
+        for file in self._files():
+            entry = self._read(file.path)
+            if entry is not None: yield entry.url, entry
+
+    def meta_entries(self) -> Iterator[tuple[str, CacheEntry]]:
+        for file in self._files():
+            entry = self._read(file.path, content=False)
+            if entry is not None: yield entry.url, entry
+
+    def count(self) -> int:
+        return len(self._files())
+
+    def size_bytes(self) -> int:
+        return sum(file.stat().st_size for file in self._files())
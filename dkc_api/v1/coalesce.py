@@ -0,0 +1,130 @@
+from __future__ import annotations
+from typing import Any, Callable, Hashable, Optional, TypeVar
+
+from .models.coalesce import CoalesceStats
+
+import datetime
+import functools
+import inspect
+import threading
+
+
+T = TypeVar("T")
+
+
+class _Call:
+    """ Call in flight, other callers with same key wait it """
+    __slots__ = ("event", "result", "error")
+
+    def __init__(self) -> None:
+        self.event = threading.Event()
+        self.result: Any = None
+        self.error: Optional[BaseException] = None
+
+
+class Coalescer:
+    """ Single-flight group: concurrent calls with same key share one call and one result """
+
+    def __init__(self) -> None:
+        """ Single-flight group of calls. If one thread already sends request with same key, other threads wait it
+            and get the same parsed result (or the same exception), so result must not be changed by caller.
+
+            Example:
+                >>> dkc_api = DkcAPI(master_key="xxxxxxxxxx", coalescer=Coalescer())
+                >>> dkc_api.Catalog.getMaterial("FKC600INOX316L")  # In 16 threads at once - one request
+                >>> dkc_api.Catalog.coalescer.stats
+                > CoalesceStats(calls=16, shared=15, in_flight=0)
+        """
+        self._calls: dict[Hashable, _Call] = {}
+        self._lock = threading.Lock()
+        self._count_calls = 0
+        self._count_shared = 0
+
+    def do(self, key: Hashable, function: Callable[[], T]) -> T:
+        """ Call `function` or wait result of same call in flight.
+
+        Args:
+            key (Hashable): Key of call, for example (endpoint, params).
+            function (Callable[[], T]): Function how send request and parse it.
+
+        Returns:
+            T: Result of function.
+        """
+        with self._lock:
+            self._count_calls += 1
+            call = self._calls.get(key)
+            leader = call is None
+            if leader: call = self._calls[key] = _Call()
+            else: self._count_shared += 1
+
+        if not leader:
+            call.event.wait()
+            if call.error is not None: raise call.error
+            return call.result
+
+        try:
+            call.result = function()
+            return call.result
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.event.set()
+
+    @property
+    def stats(self) -> CoalesceStats:
+        """ Statistic of coalescing.
+
+        Returns:
+            CoalesceStats: Count of calls, calls how got result of other call and calls in flight now.
+        """
+        with self._lock:
+            return CoalesceStats(calls=self._count_calls, shared=self._count_shared, in_flight=len(self._calls))
+
+
+def normalize(value: Any) -> Hashable:
+    """ Normalize parameter for key: ["1", "2"] and ("1", 2) give the same key, datetime is iso string. String is
+    kept as is (not split by comma), so path or name with comma is not taken as list """
+    if value is None: return None
+    if isinstance(value, str): return value
+    if isinstance(value, (list, tuple, set, frozenset)):
+        return tuple(str(part).strip() for part in value if str(part).strip())
+    if isinstance(value, bool): return value
+    if isinstance(value, int): return (str(value),)
+    if isinstance(value, datetime.datetime): return value.isoformat()
+    if isinstance(value, Hashable): return value
+    return repr(value)
+
+
+def coalesced(endpoint: str, side_effects: tuple[str, ...]=()) -> Callable[[Callable[..., T]], Callable[..., T]]:
+    """ Decorator of api object method: if object has `coalescer`, concurrent calls of same object with same endpoint
+    and same normalized arguments share one request. Object is part of key, so clients how share one `Coalescer`
+    (other master key, `url_domain` or validation mode) never get result of each other. Without `coalescer` method
+    is called as is.
+
+    Args:
+        endpoint (str): Method name, part of key, for example "getMaterial".
+        side_effects (tuple[str, ...], optional): Arguments with side effect (for example `target` file of download).
+            Call where any of them is not None is not coalesced. Defaults to ().
+    """
+    def decorator(method: Callable[..., T]) -> Callable[..., T]:
+        signature = inspect.signature(method)
+
+        @functools.wraps(method)
+        def wrapper(self, *args, **kwargs) -> T:
+            coalescer: Optional[Coalescer] = getattr(self, "coalescer", None)
+            if coalescer is None: return method(self, *args, **kwargs)
+
+            bound = signature.bind(self, *args, **kwargs)
+            bound.apply_defaults()
+            if any(bound.arguments.get(name) is not None for name in side_effects): return method(self, *args, **kwargs)
+
+            # Object is alive while its call is in flight, so its id is not reused by other object for this key
+            key = (id(self), endpoint,
+                   *((name, normalize(value)) for name, value in bound.arguments.items() if name != "self"))
+
+            return coalescer.do(key, lambda: method(self, *args, **kwargs))
+        return wrapper
+    return decorator
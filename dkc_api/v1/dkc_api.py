@@ -1,28 +1,39 @@
 
 from __future__ import annotations
-from typing import Union, Optional
+from typing import TYPE_CHECKING, Union, Optional
 
 from .const import URL_DOMAIN, DEFAULT_HEADERS
-
-from .objects.catalog.catalog import Catalog
-from .objects.news.news import News
-from .objects.content.content import Content
-from .objects.delivery.delivery import Delivery
+from .lazy import logger as default_logger, lazy_object
 
 from .exceptions.exceptions import AuthError
 
-from .models.auth import AuthResponceSuccess, AuthResponceError
-from .models.error import ResponceError
-
 from .storage import TokenStorage, FileTokenStorage
+from .transport import Transport
+from .auth import TokenManager, AuthorizedTransport
+from .metrics import Metrics
+from .records import check_validation, DEFAULT_SAMPLE_RATE
+
+if TYPE_CHECKING:
+    import loguru
+
+    # Modules of objects (with their models) are imported on first access of object, see `lazy_object`
+    from .objects.catalog.catalog import Catalog
+    from .objects.news.news import News
+    from .objects.content.content import Content
+    from .objects.delivery.delivery import Delivery
+    from .objects.delivery.quotes import QuoteCache
+
+    from .models.auth import AuthResponceSuccess, AuthResponceError
+    from .cache import ResponseCache
+    from .coalesce import Coalescer
 
-import loguru
-import requests
-from pydantic.error_wrappers import ValidationError
 
 class DkcAPI:
-    def __init__(self, master_key: str, storage: TokenStorage = FileTokenStorage(), debug: bool = False, 
-                 logger: loguru.Logger = loguru.logger) -> None:
+    def __init__(self, master_key: str, storage: TokenStorage = None, debug: bool = False, 
+                 logger: loguru.Logger = default_logger, transport: Transport = None,
+                 cache: ResponseCache = None, validation: str = "full", sample_rate: int = DEFAULT_SAMPLE_RATE,
+                 url_domain: str = URL_DOMAIN, metrics: Metrics = None, coalescer: Coalescer = None,
+                 quote_cache: QuoteCache = None) -> None:
         """ DkcAPI - is connector to DKC api. How use need get master key and send his to 'master_key' variable.
 
             For get data you need call one from methods: 
@@ -40,38 +51,117 @@ class DkcAPI:
             >>> dkc_api.Delivery.* # Get delivery method
             
             Class Catalog (and other) is interface for work with fuction how get data. If you want read code, you need
-            check file in objects/*name class*/*name class*.py.
+            check file in objects/*name class*/*name class*.py. Objects are built on first access, so models of
+            objects how are not used are not imported.
+            
+            All objects send requests through one shared `transport` (keep-alive session with connection pool). 
+            If you want change pool size or timeout, create Transport and send his to 'transport' variable:
+            
+            >>> dkc_api = DkcAPI(master_key="xxxxxxxxxx", transport=Transport(pool_maxsize=32, timeout=30))
+            >>> dkc_api.transport.stats  # Get connection reuse statistic
+            
+            Catalog responces can be cached, for this send MemoryCache or DiskCache to 'cache' variable:
+            
+            >>> dkc_api = DkcAPI(master_key="xxxxxxxxxx", cache=MemoryCache(ttl={"getMaterial": 600}))
+            >>> dkc_api.Catalog.cache.stats  # Get hit/miss statistic
+            
+            Bulk responces (getMaterialStock, getRevisionsLast, getRevisionMaterials) with hundreds of thousands items
+            can be built without pydantic validation. For this send "trusted" (lightweight records, no validation) or
+            "sampled" (records, 1 in `sample_rate` items is validated) to 'validation' variable:
+            
+            >>> dkc_api = DkcAPI(master_key="xxxxxxxxxx", validation="sampled", sample_rate=100)
+            
+            Requests are sent to `url_domain` (https://api.dkc.ru/v1 by default). Change it for work with
+            local stand-in server, for example in benchmarks:
+            
+            >>> dkc_api = DkcAPI(master_key="xxxxxxxxxx", url_domain="http://127.0.0.1:8080/v1")
+            
+            Every call is recorded to `metrics` (endpoint, status, received bytes, network, json decode and
+            validation time). Add hook for get every call or export counters and histograms:
+            
+            >>> dkc_api.metrics.add_hook(lambda call: print(call))
+            >>> dkc_api.metrics.stats  # Totals by endpoint, slowest first
+            >>> dkc_api.metrics.prometheus()  # Prometheus text format
+            
+            Concurrent calls of Catalog, Content and News with same arguments can share one request and one result,
+            for this send Coalescer to 'coalescer' variable (result is shared, so do not change it):
+            
+            >>> dkc_api = DkcAPI(master_key="xxxxxxxxxx", coalescer=Coalescer())
+            
+            Quotes of `Delivery.getDeliveryTimeBatch` are cached for 60 seconds, for change it send QuoteCache to
+            'quote_cache' variable:
+            
+            >>> dkc_api = DkcAPI(master_key="xxxxxxxxxx", quote_cache=QuoteCache(ttl=300))
         """
         self.master_key = master_key
         self.logger = logger
         self.debug = debug
+        self.url_domain = url_domain
         
-        self.storage = storage
-        self.headers = DEFAULT_HEADERS
+        check_validation(validation, sample_rate)
         
-        self.access_token = self._get_access_token_from_store()
-        if self.debug: self.logger.debug("Access token success get")
+        self.storage = storage if storage is not None else FileTokenStorage()
+        self.headers = dict(DEFAULT_HEADERS)
+        self.transport = transport if transport is not None else Transport()
+        self.metrics = metrics if metrics is not None else Metrics(logger=self.logger)
+        self.coalescer = coalescer
         
-        # SET MODEL WORK
-        self.Catalog: Catalog = Catalog(self.access_token, headers=self.headers, debug=self.debug, logger=self.logger)
-        self.News: News = News(self.access_token, headers=self.headers, debug=self.debug, logger=self.logger)
-        self.Content: Content = Content(self.access_token, headers=self.headers, debug=self.debug, logger=self.logger)
-        self.Delivery: Delivery = Delivery(self.access_token, headers=self.headers, debug=self.debug, logger=self.logger)
-
-    def _get_access_token_from_store(self) -> None:
-        """ Get access token from storage"""
-        if self.storage.get_access_token() is not None:
-            access_token = self.storage.get_access_token()
-            self.headers |= { "AccessToken": access_token }
-            
-            is_auth_not_success = self._check_auth_work()
-            if is_auth_not_success:
-                self.logger.warning(f"Token not work. Responce message -> {is_auth_not_success}")
-                self.logger.warning(f"Get new token and write to file.")
-                self.get_new_access_token_from_api()
-        else:
-            self.get_new_access_token_from_api()
-            
+        # Token is got on first request and renewed on 401/403, objects send requests through auth middleware
+        self.auth = TokenManager(master_key, storage=self.storage, transport=self.transport, url_domain=url_domain,
+                                 debug=self.debug, logger=self.logger, metrics=self.metrics)
+        self.authorized_transport = AuthorizedTransport(self.transport, self.auth)
+
+        # Objects are built on first access, so short jobs load only models of objects how they use
+        self._cache = cache
+        self._validation = validation
+        self._sample_rate = sample_rate
+        self._quote_cache = quote_cache
+
+    @lazy_object
+    def Catalog(self) -> Catalog:
+        from .objects.catalog.catalog import Catalog
+        return Catalog(None, headers=self.headers, debug=self.debug, logger=self.logger,
+                       transport=self.authorized_transport, cache=self._cache, validation=self._validation,
+                       sample_rate=self._sample_rate, url_domain=self.url_domain, metrics=self.metrics,
+                       coalescer=self.coalescer)
+
+    @lazy_object
+    def News(self) -> News:
+        from .objects.news.news import News
+        return News(None, headers=self.headers, debug=self.debug, logger=self.logger,
+                    transport=self.authorized_transport, url_domain=self.url_domain, metrics=self.metrics,
+                    coalescer=self.coalescer)
+
+    @lazy_object
+    def Content(self) -> Content:
+        from .objects.content.content import Content
+        return Content(None, headers=self.headers, debug=self.debug, logger=self.logger,
+                       transport=self.authorized_transport, validation=self._validation, sample_rate=self._sample_rate,
+                       url_domain=self.url_domain, metrics=self.metrics, coalescer=self.coalescer)
+
+    @lazy_object
+    def Delivery(self) -> Delivery:
+        from .objects.delivery.delivery import Delivery
+        return Delivery(None, headers=self.headers, debug=self.debug, logger=self.logger,
+                        transport=self.authorized_transport, url_domain=self.url_domain, metrics=self.metrics,
+                        quote_cache=self._quote_cache)
+
+    @property
+    def access_token(self) -> Optional[str]:
+        """ Current access token, None before first request """
+        return self.auth.access_token
+
+    def authorize(self) -> str:
+        """ Get access token now, not on first request.
+
+        Raises:
+            AuthError: If api not give access token.
+
+        Returns:
+            str: Access token.
+        """
+        return self.auth.get()
+
     def get_new_access_token_from_api(self) -> Optional[AuthError]:
         """ Get new access token and chech his to error. Other save his to storage.
 
@@ -81,15 +171,7 @@ class DkcAPI:
         Returns:
             Optional[AuthError]: If responce None - is success get token and seve to storage.
         """
-        model_access_token = self.send_get_request_access_token()
-        
-        if isinstance(model_access_token, AuthResponceError):
-            raise AuthError(f"Access token not get. Responce message -> `{model_access_token.message}`")
-        
-        access_token = model_access_token.access_token
-        self.storage.save_token(access_token)
-        
-        self.headers |= { "AccessToken": access_token}
+        self.auth.renew(self.auth.access_token)
 
     def send_get_request_access_token(self) -> Union[AuthResponceSuccess, AuthResponceError]:
         """ Get access token for use master key.
@@ -97,12 +179,4 @@ class DkcAPI:
         Returns:
             AuthResponce[Succces/Error]: Return acces token or error message
         """
-        responce = requests.get(f'{URL_DOMAIN}/auth.access.token/{self.master_key}', headers=self.headers)
-        
-        try: return AuthResponceSuccess(**{ 'code': responce.status_code, **responce.json() })
-        except ValidationError: return AuthResponceError(**{ 'code': responce.status_code, **responce.json() })
-        
-    def _check_auth_work(self) -> Optional[str]:
-        " Send responce for check work access token"
-        responce = requests.get(f'{URL_DOMAIN}/news/company/', headers=self.headers)
-        return responce.json().get('message', None)
+        return self.auth.send_get_request_access_token()
@@ -0,0 +1,276 @@
+from __future__ import annotations
+from typing import TYPE_CHECKING, Any, Iterable, Iterator, NamedTuple, Optional, Union
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urlsplit
+
+from .transport import Transport
+from .lazy import logger as default_logger
+from .models.downloader import AssetError, DownloadResult
+
+import os
+import time
+import sqlite3
+import hashlib
+import threading
+
+import requests
+
+if TYPE_CHECKING:
+    import loguru
+
+
+# Sections of revisions how have assets, and fields of their items with url (or list of urls / links with `src`)
+ASSET_SECTIONS = ("drawings", "certificates", "materials", "products", "catalogues", "booklets", "instructions")
+ASSET_FIELDS = ("src", "thumbnail_url", "additional_images", "links", "drawables")
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS asset (
+    url TEXT PRIMARY KEY,
+    sha256 TEXT NOT NULL,
+    size INTEGER NOT NULL,
+    etag TEXT,
+    last_modified TEXT,
+    fetched_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS asset_sha256 ON asset (sha256);
+"""
+
+
+class Asset(NamedTuple):
+    """ Remote file of revision item: drawing, certificate, image, catalogue, booklet, instruction """
+    url: str
+    section: str
+    item_id: str
+
+
+def _field_urls(value: Any) -> Iterator[str]:
+    if value is None: return
+    if isinstance(value, str):
+        if value: yield str(value)
+        return
+    if isinstance(value, (list, tuple)):
+        for part in value: yield from _field_urls(part)
+        return
+
+    src = getattr(value, "src", None)
+    if src is not None: yield from _field_urls(src)
+    else: yield str(value)
+
+
+def iter_assets(revision: Any) -> Iterator[Asset]:
+    """ Assets of updated items of revision: `getRevisionDrawings`, `getRevisionCertificates`, `getRevisionMaterials`
+    or `getRevisionsLast` responce (model or record of "trusted" mode), or `RevisionLastItem` of stream.
+
+    Example:
+        >>> list(iter_assets(dkc_api.Content.getRevisionDrawings(last_updated=watermark)))
+        > [Asset(url='https://www.dkc.ru/upload/drawings/1.dwg', section='drawings', item_id='1052191'), ...]
+    """
+    if hasattr(revision, "section") and hasattr(revision, "kind"):
+        if revision.kind == "updated":
+            yield from _item_assets(revision.section, revision.value)
+        return
+
+    revision = getattr(revision, "revision", revision)
+    for section in ASSET_SECTIONS:
+        updated = getattr(getattr(revision, section, None), "updated", None) or []
+        for item in updated: yield from _item_assets(section, item)
+
+
+def _item_assets(section: str, item: Any) -> Iterator[Asset]:
+    item_id = str(getattr(item, "id", ""))
+    for field in ASSET_FIELDS:
+        for url in _field_urls(getattr(item, field, None)):
+            yield Asset(url, section, item_id)
+
+
+class AssetDownloader:
+    """ Parallel downloader of revision assets to content-addressed disk cache """
+
+    def __init__(self, path: str, transport: Optional[Transport]=None, workers: int=16, per_host: int=4,
+                 chunk_size: int=64 * 1024, logger: loguru.Logger = default_logger) -> None:
+        """ Parallel downloader of revision assets. File content is saved once by sha256 (`objects/ab/abcdef...`), so
+            same file on many urls takes place once. Index `url -> sha256` is kept in SQLite, url how is already
+            downloaded is skipped (or revalidated by ETag / Last-Modified with `revalidate=True`). Broken download
+            is kept in `partial` directory and is resumed with Range request.
+
+            Args:
+                path (str): Directory of cache. Created if not exists.
+                transport (Transport, optional): Transport for downloads (without access token). Defaults to new
+                    Transport with `per_host` keep-alive connections to every host.
+                workers (int, optional): Count of parallel downloads. Defaults to 16.
+                per_host (int, optional): Max count of parallel downloads from one host. Defaults to 4.
+                chunk_size (int, optional): Size of read chunk in bytes, broken download is resumed from last saved
+                    chunk. Defaults to 64 KB.
+                logger (loguru.Logger, optional): Logger.
+
+            Example:
+                >>> downloader = AssetDownloader("/var/lib/dkc/assets", workers=32, per_host=8)
+                >>> downloader.download_revision(dkc_api.Content.getRevisionDrawings(last_updated=watermark))
+                > DownloadResult(downloaded=120, resumed=1, skipped=3410, not_modified=0, failed=0, received_bytes=..., errors=[])
+                >>> downloader.path_of("https://www.dkc.ru/upload/drawings/1.dwg")
+                > '/var/lib/dkc/assets/objects/3f/3fa2...'
+        """
+        self.path = path
+        self.transport = transport if transport is not None else Transport(pool_maxsize=per_host)
+        self.workers = workers
+        self.per_host = per_host
+        self.chunk_size = chunk_size
+        self.logger = logger
+
+        os.makedirs(os.path.join(path, "objects"), exist_ok=True)
+        os.makedirs(os.path.join(path, "partial"), exist_ok=True)
+
+        self._lock = threading.RLock()
+        self._hosts: dict[str, threading.Semaphore] = {}
+        self.connection = sqlite3.connect(os.path.join(path, "index.sqlite3"), check_same_thread=False)
+        self.connection.executescript(SCHEMA)
+
+    def download_revision(self, revision: Any, revalidate: bool=False) -> DownloadResult:
+        """ Download assets of updated items of revision, see `iter_assets` """
+        return self.download(iter_assets(revision), revalidate=revalidate)
+
+    def download(self, assets: Iterable[Union[Asset, str]], revalidate: bool=False) -> DownloadResult:
+        """ Download assets (or urls) in parallel. Every url is downloaded once, url how is in index is skipped.
+
+        Args:
+            assets (Iterable[Union[Asset, str]]): Assets or urls.
+            revalidate (bool, optional): Send conditional request for urls in index, for find changed files.
+                Defaults to False.
+
+        Returns:
+            DownloadResult: Count of downloaded, resumed, skipped, not modified and failed urls, received bytes and
+            errors. Error of one url does not abort others.
+        """
+        urls = list(dict.fromkeys(asset.url if isinstance(asset, Asset) else str(asset) for asset in assets))
+        result = DownloadResult()
+
+        with ThreadPoolExecutor(max_workers=max(self.workers, 1)) as executor:
+            for url, status, received, error in executor.map(lambda url: self._download_safe(url, revalidate), urls):
+                setattr(result, status, getattr(result, status) + 1)
+                result.received_bytes += received
+                if error is not None: result.errors.append(AssetError(url=url, error=error))
+
+        return result
+
+    def _download_safe(self, url: str, revalidate: bool) -> tuple[str, str, int, Optional[str]]:
+        try:
+            status, received = self._download(url, revalidate)
+            return url, status, received, None
+        except (requests.RequestException, OSError, ValueError) as e:
+            self.logger.warning(f"Asset {url} not downloaded -> {type(e).__name__}: {e}")
+            return url, "failed", 0, f"{type(e).__name__}: {e}"
+
+    def _host(self, url: str) -> threading.Semaphore:
+        host = urlsplit(url).netloc
+        with self._lock:
+            semaphore = self._hosts.get(host)
+            if semaphore is None: semaphore = self._hosts[host] = threading.BoundedSemaphore(max(self.per_host, 1))
+            return semaphore
+
+    def _download(self, url: str, revalidate: bool) -> tuple[str, int]:
+        """ Download one url. Return status (field of DownloadResult) and count of received bytes """
+        known = self._get(url)
+        if known is not None and not revalidate and os.path.exists(self._object_path(known[0])): return "skipped", 0
+
+        part_path = os.path.join(self.path, "partial", hashlib.sha256(url.encode("utf-8")).hexdigest())
+        offset = os.path.getsize(part_path) if os.path.exists(part_path) else 0
+        part_meta = self._read_meta(part_path) if offset else {}
+
+        headers = {}
+        if offset and (part_meta.get("etag") or part_meta.get("last_modified")):
+            headers["Range"] = f"bytes={offset}-"
+            headers["If-Range"] = part_meta.get("etag") or part_meta.get("last_modified")
+        elif known is not None and os.path.exists(self._object_path(known[0])):
+            if known[1]: headers["If-None-Match"] = known[1]
+            if known[2]: headers["If-Modified-Since"] = known[2]
+
+        with self._host(url):
+            responce = self.transport.get(url, headers=headers, stream=True)
+            try:
+                if responce.status_code == 304: return "not_modified", 0
+                if responce.status_code == 416:
+                    # Partial file is not part of current file on server, it is downloaded again on next sync
+                    os.remove(part_path)
+                    self._remove_meta(part_path)
+                if responce.status_code not in (200, 206):
+                    raise ValueError(f"Status {responce.status_code}")
+
+                resumed = responce.status_code == 206
+                etag, last_modified = responce.headers.get("ETag"), responce.headers.get("Last-Modified")
+                self._write_meta(part_path, etag, last_modified)
+
+                received = 0
+                with open(part_path, "ab" if resumed else "wb") as file:
+                    for chunk in responce.iter_content(chunk_size=self.chunk_size):
+                        file.write(chunk)
+                        received += len(chunk)
+            finally:
+                responce.close()
+
+        sha256 = self._hash_file(part_path)
+        object_path = self._object_path(sha256)
+        os.makedirs(os.path.dirname(object_path), exist_ok=True)
+
+        # Same content of other url is already saved, so keep one copy
+        if os.path.exists(object_path): os.remove(part_path)
+        else: os.replace(part_path, object_path)
+        self._remove_meta(part_path)
+
+        self._set(url, sha256, os.path.getsize(object_path), etag, last_modified)
+        return ("resumed" if resumed else "downloaded"), received
+
+    def _hash_file(self, path: str) -> str:
+        digest = hashlib.sha256()
+        with open(path, "rb") as file:
+            for chunk in iter(lambda: file.read(self.chunk_size), b""): digest.update(chunk)
+        return digest.hexdigest()
+
+    def _object_path(self, sha256: str) -> str:
+        return os.path.join(self.path, "objects", sha256[:2], sha256)
+
+    def _read_meta(self, part_path: str) -> dict:
+        try:
+            with open(f"{part_path}.meta", "r", encoding="utf-8") as file:
+                etag, last_modified = (file.read().split("\n") + ["", ""])[:2]
+                return { "etag": etag or None, "last_modified": last_modified or None }
+        except OSError:
+            return {}
+
+    def _write_meta(self, part_path: str, etag: Optional[str], last_modified: Optional[str]) -> None:
+        with open(f"{part_path}.meta", "w", encoding="utf-8") as file:
+            file.write(f"{etag or ''}\n{last_modified or ''}")
+
+    def _remove_meta(self, part_path: str) -> None:
+        try: os.remove(f"{part_path}.meta")
+        except OSError: pass
+
+    def _get(self, url: str) -> Optional[tuple[str, Optional[str], Optional[str]]]:
+        with self._lock:
+            return self.connection.execute(
+                "SELECT sha256, etag, last_modified FROM asset WHERE url = ?", (url,)
+            ).fetchone()
+
+    def _set(self, url: str, sha256: str, size: int, etag: Optional[str], last_modified: Optional[str]) -> None:
+        with self._lock, self.connection:
+            self.connection.execute(
+                "INSERT OR REPLACE INTO asset (url, sha256, size, etag, last_modified, fetched_at) VALUES (?, ?, ?, ?, ?, ?)",
+                (url, sha256, size, etag, last_modified, time.time())
+            )
+
+    def path_of(self, url: str) -> Optional[str]:
+        """ Path to downloaded file of url or None if url is not downloaded """
+        known = self._get(url)
+        if known is None: return None
+
+        path = self._object_path(known[0])
+        return path if os.path.exists(path) else None
+
+    def close(self) -> None:
+        with self._lock:
+            self.connection.close()
+
+    def __enter__(self) -> AssetDownloader:
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
@@ -4,4 +4,7 @@ class AuthError(Exception):
     ...
     
 class NotValidVariables(Exception):
+    ...
+    
+class NewsPageError(Exception):
     ...
\ No newline at end of file
@@ -0,0 +1,169 @@
+from __future__ import annotations
+from typing import TYPE_CHECKING, Iterable, Union
+
+from .models.error import ResponceError, ResponceErrorAlternative
+
+import gzip
+import json
+
+if TYPE_CHECKING:
+    from .objects.catalog.catalog import Catalog
+
+
+RELATIONS = ("related", "accessories", "analogs")
+
+
+class MaterialGraph:
+    """ Index of material relations (related, accessories, analogs) built once from full dumps of
+    `getMaterialRelated`, `getMaterialAccessories` and `getMaterialAnalogs`. Codes are interned to integers and
+    every relation has forward and reverse adjacency, so lookups do not need requests to api. """
+
+    def __init__(self) -> None:
+        self.codes: list[str] = []
+        self.index: dict[str, int] = {}
+        self.forward: dict[str, dict[int, tuple[int, ...]]] = { relation: {} for relation in RELATIONS }
+        self.reverse: dict[str, dict[int, tuple[int, ...]]] = { relation: {} for relation in RELATIONS }
+
+    def _intern(self, code: str) -> int:
+        number = self.index.get(code)
+        if number is None:
+            number = self.index[code] = len(self.codes)
+            self.codes.append(code)
+        return number
+
+    def add(self, relation: str, mapping: dict[str, list[str]]) -> None:
+        """ Add relation map ("code" -> ["code", ...]) how returned by catalog dumps """
+        if relation not in RELATIONS:
+            raise ValueError(f"Unknown relation `{relation}`. Available: {', '.join(RELATIONS)}")
+
+        forward = self.forward[relation]
+        reverse: dict[int, list[int]] = { key: list(value) for key, value in self.reverse[relation].items() }
+
+        for code, targets in mapping.items():
+            source = self._intern(code)
+            for old_target in forward.get(source, ()): reverse[old_target].remove(source)
+
+            target_numbers = tuple(dict.fromkeys(self._intern(target) for target in targets))
+            forward[source] = target_numbers
+            for target in target_numbers: reverse.setdefault(target, []).append(source)
+
+        self.reverse[relation] = { key: tuple(value) for key, value in reverse.items() }
+
+    @classmethod
+    def from_catalog(cls, catalog: Catalog) -> Union[MaterialGraph, ResponceError, ResponceErrorAlternative]:
+        """ Build graph from full dumps. Makes three requests with very long responce.
+
+        Example:
+            >>> graph = MaterialGraph.from_catalog(dkc_api.Catalog)
+            >>> graph.save("materials.graph.json.gz")
+        """
+        graph = cls()
+
+        for relation, method in (("related", catalog.getMaterialRelated),
+                                 ("accessories", catalog.getMaterialAccessories),
+                                 ("analogs", catalog.getMaterialAnalogs)):
+            responce = method()
+            if isinstance(responce, (ResponceError, ResponceErrorAlternative)): return responce
+            graph.add(relation, getattr(responce, relation))
+
+        return graph
+
+    def save(self, path: str) -> None:
+        """ Save graph to file. If path ends with ".gz" file is compressed """
+        data = {
+            "codes": self.codes,
+            "forward": { relation: { str(key): value for key, value in edges.items() }
+                         for relation, edges in self.forward.items() },
+        }
+        if path.endswith(".gz"): file = gzip.open(path, "wt", encoding="utf-8", compresslevel=6)
+        else: file = open(path, "w", encoding="utf-8")
+
+        with file:
+            json.dump(data, file, separators=(",", ":"))
+
+    @classmethod
+    def load(cls, path: str) -> MaterialGraph:
+        """ Load graph saved by `save`. Reverse adjacency is rebuilt """
+        opener = gzip.open if path.endswith(".gz") else open
+        with opener(path, "rt", encoding="utf-8") as file:
+            data = json.load(file)
+
+        graph = cls()
+        graph.codes = data["codes"]
+        graph.index = { code: number for number, code in enumerate(graph.codes) }
+
+        for relation, edges in data["forward"].items():
+            forward = graph.forward[relation] = { int(key): tuple(value) for key, value in edges.items() }
+
+            reverse: dict[int, list[int]] = {}
+            for source, targets in forward.items():
+                for target in targets: reverse.setdefault(target, []).append(source)
+            graph.reverse[relation] = { key: tuple(value) for key, value in reverse.items() }
+
+        return graph
+
+    def _lookup(self, edges: dict[int, tuple[int, ...]], code: str) -> list[str]:
+        number = self.index.get(str(code))
+        if number is None: return []
+        return [self.codes[target] for target in edges.get(number, ())]
+
+    def get(self, code: str, relation: str="related") -> list[str]:
+        """ Codes how material `code` lists in `relation`.
+
+        Example:
+            >>> graph.get("R5CEB03311", "accessories")
+            > ["R5STX0442", "R5STX0446", ...]
+        """
+        return self._lookup(self.forward[relation], code)
+
+    def get_reverse(self, code: str, relation: str="related") -> list[str]:
+        """ Codes of materials how list `code` in `relation`.
+
+        Example:
+            >>> graph.get_reverse("R5STX0442", "accessories")  # Which materials list R5STX0442 as an accessory
+            > ["R5CEB03311", ...]
+        """
+        return self._lookup(self.reverse[relation], code)
+
+    def get_many(self, codes: Iterable[str], relation: str="related", reverse: bool=False) -> dict[str, list[str]]:
+        """ Batch lookup for all codes, for example for whole BOM """
+        lookup = self.get_reverse if reverse else self.get
+        return { str(code): lookup(code, relation) for code in codes }
+
+    def traverse(self, code: str, relations: Iterable[str]=RELATIONS, depth: int=1,
+                 reverse: bool=False) -> dict[str, int]:
+        """ Breadth-first traversal from `code` over `relations` not deeper than `depth`.
+
+        Returns:
+            dict[str, int]: Found codes with their distance from `code` (start code is not included).
+
+        Example:
+            >>> graph.traverse("R5CEB03311", relations=["accessories", "analogs"], depth=2)
+            > {"R5STX0442": 1, "R5STX0446": 1, "R5STX0450": 2, ...}
+        """
+        start = self.index.get(str(code))
+        if start is None: return {}
+
+        edges = [(self.reverse if reverse else self.forward)[relation] for relation in relations]
+        found: dict[int, int] = { start: 0 }
+        frontier = [start]
+
+        for distance in range(1, depth + 1):
+            next_frontier = []
+            for number in frontier:
+                for relation_edges in edges:
+                    for target in relation_edges.get(number, ()):
+                        if target not in found:
+                            found[target] = distance
+                            next_frontier.append(target)
+            if not next_frontier: break
+            frontier = next_frontier
+
+        del found[start]
+        return { self.codes[number]: distance for number, distance in found.items() }
+
+    def __len__(self) -> int:
+        return len(self.codes)
+
+    def __contains__(self, code: str) -> bool:
+        return str(code) in self.index
@@ -0,0 +1,194 @@
+from __future__ import annotations
+from typing import Any, Iterator, Optional
+
+from .models.transport import TransportStats
+from .limiter import RateLimiter
+from .transport import Transport
+
+import time
+import threading
+
+import requests
+from requests.adapters import HTTPAdapter
+from requests.models import RequestEncodingMixin
+from requests.structures import CaseInsensitiveDict
+from requests.utils import get_encoding_from_headers
+
+try:
+    import httpx
+except ImportError:
+    httpx = None
+
+try:
+    import h2
+except ImportError:
+    h2 = None
+
+
+def _translate_error(error: Exception) -> requests.RequestException:
+    """ Error of httpx as error of requests, so objects and RateLimiter handle both transports the same way """
+    if isinstance(error, httpx.TimeoutException): return requests.Timeout(str(error))
+    if isinstance(error, (httpx.NetworkError, httpx.RemoteProtocolError)): return requests.ConnectionError(str(error))
+    if isinstance(error, httpx.DecodingError): return requests.exceptions.ContentDecodingError(str(error))
+    return requests.RequestException(str(error))
+
+
+class _HttpxRaw:
+    """ Body of httpx responce for `requests.Response.raw`. Content (gzip, br, deflate) is decoded part by part """
+
+    def __init__(self, responce: httpx.Response) -> None:
+        self._responce = responce
+        self._parts: Iterator[bytes] = responce.iter_bytes()
+        self._buffer = bytearray()
+
+    def read(self, amt: Optional[int]=None) -> bytes:
+        try:
+            while amt is None or len(self._buffer) < amt:
+                part = next(self._parts, None)
+                if part is None: break
+                self._buffer += part
+        except httpx.HTTPError as e:
+            raise _translate_error(e) from e
+
+        size = len(self._buffer) if amt is None else min(amt, len(self._buffer))
+        data = bytes(self._buffer[:size])
+        del self._buffer[:size]
+        return data
+
+    def close(self) -> None:
+        self._responce.close()
+
+
+class Http2Transport(Transport):
+    """ Shared HTTP transport on httpx: HTTP/2 multiplexing and gzip / brotli with streaming decompression """
+
+    def __init__(self, http2: Optional[bool]=None, max_connections: int=100, max_keepalive_connections: int=20,
+                 timeout: Optional[float]=None, limiter: Optional[RateLimiter]=None) -> None:
+        """ Shared HTTP transport on httpx, other backend for `Transport`. Need `httpx` package, HTTP/2 need `h2`
+            and brotli need `brotli` package (python -m pip install dkc-api[http2]).
+
+            With HTTP/2 parallel requests of all objects go through one connection to api.dkc.ru as streams
+            (protocol is negotiated with ALPN, so it is used for https only). Responce body is asked compressed
+            (`Accept-Encoding: gzip, deflate, br`) and is decoded part by part, so streamed methods
+            (`getRevisionsLastStream`, `getMaterialStockStream`, `getFile`) keep memory flat.
+
+            Responces are `requests.Response`, so objects, cache, metrics and RateLimiter work the same as
+            with `Transport`.
+
+            Args:
+                http2 (bool, optional): Use HTTP/2. Defaults to None (HTTP/2 if `h2` package is installed).
+                max_connections (int, optional): Max count of opened connections. Defaults to 100.
+                max_keepalive_connections (int, optional): Max count of idle keep-alive connections. Defaults to 20.
+                timeout (float, optional): Timeout for every request in seconds. Defaults to None (without timeout).
+                limiter (RateLimiter, optional): Rate limit, adaptive concurrency and retries of requests.
+                    Defaults to None (requests are sent at once, without retries).
+
+            Example:
+                >>> dkc_api = DkcAPI(master_key="xxxxxxxxxx", transport=Http2Transport(timeout=30))
+                >>> dkc_api.transport.stats
+                > TransportStats(requests=120, connections=1, reused=119, reuse_ratio=0.991)
+        """
+        if httpx is None:
+            raise ImportError("Http2Transport need `httpx` package. Install it: python -m pip install dkc-api[http2]")
+        if http2 and h2 is None:
+            raise ImportError("HTTP/2 need `h2` package. Install it: python -m pip install dkc-api[http2]")
+
+        self.timeout = timeout
+        self.limiter = limiter
+        self.http2 = h2 is not None if http2 is None else http2
+
+        self.client = httpx.Client(
+            http2=self.http2,
+            limits=httpx.Limits(max_connections=max_connections, max_keepalive_connections=max_keepalive_connections),
+            timeout=timeout
+        )
+        # Requests are sent by httpx `client`, requests session and its pool adapter of `Transport` are not created
+        self.session: Optional[requests.Session] = None
+        self.adapter: Optional[HTTPAdapter] = None
+
+        self._lock = threading.Lock()
+        self._count_requests = 0
+        self._count_connections = 0
+
+    def _trace(self, event: str, info: dict) -> None:
+        if event == "connection.connect_tcp.complete":
+            with self._lock:
+                self._count_connections += 1
+
+    def _build_request(self, method: str, url: str, params: Any=None, data: Any=None, headers: Optional[dict]=None,
+                       json: Any=None, timeout: Optional[float]=None, **kwargs) -> httpx.Request:
+        headers = dict(headers or {})
+        content = None
+
+        if isinstance(data, (dict, list, tuple)):
+            # Form is encoded by requests, so body is the same as with `Transport`
+            content = RequestEncodingMixin._encode_params(data)
+            headers.setdefault("Content-Type", "application/x-www-form-urlencoded")
+        elif data is not None:
+            content = data
+
+        return self.client.build_request(
+            method, url, params=params, content=content, json=json, headers=headers,
+            timeout=timeout if timeout is not None else httpx.USE_CLIENT_DEFAULT,
+            extensions={ "trace": self._trace }
+        )
+
+    def _send(self, method: str, url: str, stream: bool=False, allow_redirects: bool=True, **kwargs) -> requests.Response:
+        start = time.perf_counter()
+        try:
+            request = self._build_request(method, url, **kwargs)
+            origin = self.client.send(request, stream=True, follow_redirects=allow_redirects)
+            if not stream: origin.read()
+        except httpx.HTTPError as e:
+            raise _translate_error(e) from e
+
+        responce = requests.Response()
+        responce.status_code = origin.status_code
+        responce.headers = CaseInsensitiveDict(origin.headers.multi_items())
+        responce.url = str(origin.url)
+        responce.reason = origin.reason_phrase
+        responce.encoding = get_encoding_from_headers(responce.headers)
+        responce.http_version = origin.http_version
+        responce.raw = _HttpxRaw(origin)
+
+        if not stream:
+            responce._content = origin.content
+            responce._content_consumed = True
+            origin.close()
+
+        responce.network_time = time.perf_counter() - start
+
+        with self._lock:
+            self._count_requests += 1
+
+        return responce
+
+    @property
+    def stats(self) -> TransportStats:
+        """ Statistic of connection reuse. With HTTP/2 every connection carries many requests.
+
+        Returns:
+            TransportStats: Count of sent requests, opened connections and reused connections.
+        """
+        with self._lock:
+            count_requests, count_connections = self._count_requests, self._count_connections
+
+        # Connections how are opened now in pool of client are opened connections too (if trace is not got)
+        count_connections = max(count_connections, len(self.open_connections))
+        reused = max(count_requests - count_connections, 0)
+        return TransportStats(
+            requests=count_requests,
+            connections=count_connections,
+            reused=reused,
+            reuse_ratio=reused / count_requests if count_requests else 0.0
+        )
+
+    @property
+    def open_connections(self) -> list:
+        """ Connections how are opened now in connection pool of httpx client """
+        pool = getattr(getattr(self.client, "_transport", None), "_pool", None)
+        return list(getattr(pool, "connections", []))
+
+    def close(self) -> None:
+        """ Close all opened connections """
+        self.client.close()
@@ -0,0 +1,64 @@
+from __future__ import annotations
+from typing import TYPE_CHECKING, Any, Callable, Generic, Optional, TypeVar
+
+import threading
+
+if TYPE_CHECKING:
+    import loguru
+
+
+T = TypeVar("T")
+
+
+class LazyLogger:
+    """ Proxy of `loguru.logger`. Loguru is imported on first call of logger, not on import of dkc_api,
+    settings of `loguru.logger` (`remove`, `add`) work for proxy too """
+
+    def __getattr__(self, name: str) -> Any:
+        from loguru import logger
+        return getattr(logger, name)
+
+    def __repr__(self) -> str:
+        from loguru import logger
+        return f"LazyLogger({logger!r})"
+
+
+# Default logger of all objects
+logger: loguru.Logger = LazyLogger()
+
+
+class lazy_object(Generic[T]):
+    """ Attribute how is built by method on first access and kept in instance. Module of object (with his models)
+    is imported in method, so objects how are not used are not loaded. Built value is saved to `__dict__` of
+    instance, so next access is usual attribute access. Every instance has own lock of attribute, so clients
+    how are built in other threads do not wait each other.
+
+    Example:
+        >>> class DkcAPI:
+        >>>     @lazy_object
+        >>>     def Catalog(self) -> Catalog:
+        >>>         from .objects.catalog.catalog import Catalog
+        >>>         return Catalog(...)
+    """
+
+    def __init__(self, build: Callable[[Any], T]) -> None:
+        self.build = build
+        self.name = build.__name__
+        self.__doc__ = build.__doc__
+        self.lock_name = f"_{self.name}_lock"
+
+    def __set_name__(self, owner: type, name: str) -> None:
+        self.name = name
+        self.lock_name = f"_{name}_lock"
+
+    def __get__(self, instance: Optional[Any], owner: type) -> T:
+        if instance is None: return self
+
+        value = instance.__dict__.get(self.name)
+        if value is not None: return value
+
+        # setdefault is atomic, so all threads get the same lock of this instance
+        with instance.__dict__.setdefault(self.lock_name, threading.Lock()):
+            value = instance.__dict__.get(self.name)
+            if value is None: value = instance.__dict__[self.name] = self.build(instance)
+        return value
@@ -0,0 +1,268 @@
+from __future__ import annotations
+from typing import TYPE_CHECKING, Callable, Optional, Sequence
+from email.utils import parsedate_to_datetime
+
+from .models.limiter import LimiterStats
+from .lazy import logger as default_logger
+
+import time
+import random
+import datetime
+import threading
+
+import requests
+
+if TYPE_CHECKING:
+    import loguru
+
+
+# Statuses how mean that server is overloaded or throttle client
+OVERLOAD_STATUSES = (429, 500, 502, 503, 504)
+
+
+class TokenBucket:
+    """ Token bucket rate limiter, thread safe. `rate` requests per second with bursts up to `burst` requests """
+
+    def __init__(self, rate: float, burst: Optional[int]=None) -> None:
+        """ Token bucket rate limiter.
+
+            Args:
+                rate (float): Count of requests per second.
+                burst (int, optional): Max count of requests sent at once. Defaults to None (equal `rate`, min 1).
+        """
+        if rate <= 0: raise ValueError("rate must be > 0")
+
+        self.rate = rate
+        self.burst = burst if burst is not None else max(int(rate), 1)
+        self._tokens = float(self.burst)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> float:
+        """ Take one token, wait if bucket is empty.
+
+        Returns:
+            float: Time of wait in seconds.
+        """
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+
+            # Token is reserved right now (count can be negative), so waiting threads are served in order
+            self._tokens -= 1
+            wait = -self._tokens / self.rate if self._tokens < 0 else 0.0
+
+        if wait: time.sleep(wait)
+        return wait
+
+
+class AdaptiveConcurrency:
+    """ AIMD limit of requests in flight: limit grows by `increase` per round of success requests and is multiplied
+    by `decrease` on overload signal (overload status or latency above `latency_target`) """
+
+    def __init__(self, initial: int=4, min_limit: int=1, max_limit: int=64, increase: float=1.0,
+                 decrease: float=0.5, latency_target: Optional[float]=None) -> None:
+        """ AIMD limit of requests in flight.
+
+            Args:
+                initial (int, optional): Limit on start. Defaults to 4.
+                min_limit (int, optional): Min limit. Defaults to 1.
+                max_limit (int, optional): Max limit. Defaults to 64.
+                increase (float, optional): Additive increase of limit per round (`limit` success requests). Defaults to 1.
+                decrease (float, optional): Multiplicative decrease of limit on overload. Defaults to 0.5.
+                latency_target (float, optional): Request slower this count of seconds is overload signal.
+                    Defaults to None (only statuses and connection errors).
+        """
+        self.min_limit = min_limit
+        self.max_limit = max_limit
+        self.increase = increase
+        self.decrease = decrease
+        self.latency_target = latency_target
+
+        self.limit = float(min(max(initial, min_limit), max_limit))
+        self.in_flight = 0
+
+        self._decreased_at = 0.0
+        self._condition = threading.Condition()
+
+    def acquire(self) -> float:
+        """ Wait free slot.
+
+        Returns:
+            float: Start time of request, send it to `release`.
+        """
+        with self._condition:
+            while self.in_flight >= int(self.limit):
+                self._condition.wait()
+            self.in_flight += 1
+        return time.monotonic()
+
+    def release(self, started: float, overload: bool, latency: float=0.0) -> None:
+        """ Free slot and change limit.
+
+        Args:
+            started (float): Start time of request from `acquire`.
+            overload (bool): Server answered overload status or connection is failed.
+            latency (float, optional): Time of request in seconds. Defaults to 0.
+        """
+        if self.latency_target is not None and latency > self.latency_target: overload = True
+
+        with self._condition:
+            self.in_flight -= 1
+
+            if overload:
+                # Requests how were sent before last decrease saw old limit, so decrease only once per round
+                if started >= self._decreased_at:
+                    self.limit = max(self.min_limit, self.limit * self.decrease)
+                    self._decreased_at = time.monotonic()
+            else:
+                self.limit = min(self.max_limit, self.limit + self.increase / self.limit)
+
+            self._condition.notify_all()
+
+
+class RetryPolicy:
+    """ Retry of idempotent requests with exponential backoff and full jitter """
+
+    def __init__(self, retries: int=3, backoff: float=0.5, max_backoff: float=30.0, jitter: bool=True,
+                 statuses: Sequence[int]=OVERLOAD_STATUSES, methods: Sequence[str]=("GET",)) -> None:
+        """ Retry of idempotent requests.
+
+            Args:
+                retries (int, optional): Max count of retries. Defaults to 3.
+                backoff (float, optional): Delay before first retry in seconds, doubled every retry. Defaults to 0.5.
+                max_backoff (float, optional): Max delay in seconds. Defaults to 30.
+                jitter (bool, optional): Random delay from 0 to backoff (full jitter), so clients do not retry at once.
+                    Defaults to True.
+                statuses (Sequence[int], optional): Statuses for retry. Defaults to OVERLOAD_STATUSES.
+                methods (Sequence[str], optional): Methods for retry. Defaults to ("GET",).
+        """
+        self.retries = retries
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+        self.jitter = jitter
+        self.statuses = frozenset(statuses)
+        self.methods = frozenset(method.upper() for method in methods)
+
+    def is_retryable(self, method: str, attempt: int) -> bool:
+        return attempt < self.retries and method.upper() in self.methods
+
+    def delay(self, attempt: int, responce: Optional[requests.Response]=None) -> float:
+        """ Delay before retry number `attempt` (from 0). `Retry-After` header of responce is used if it is set """
+        retry_after = _retry_after(responce) if responce is not None else None
+        if retry_after is not None: return min(retry_after, self.max_backoff)
+
+        delay = min(self.max_backoff, self.backoff * 2 ** attempt)
+        return random.uniform(0, delay) if self.jitter else delay
+
+
+def _retry_after(responce: requests.Response) -> Optional[float]:
+    value = responce.headers.get("Retry-After")
+    if not value: return None
+
+    try: return max(float(value), 0.0)
+    except ValueError: pass
+
+    try: return max((parsedate_to_datetime(value) - datetime.datetime.now(datetime.timezone.utc)).total_seconds(), 0.0)
+    except (TypeError, ValueError): return None
+
+
+class RateLimiter:
+    """ Pacing of requests of Transport: token bucket, adaptive concurrency and retry policy. Every part is optional """
+
+    def __init__(self, rate: Optional[float]=None, burst: Optional[int]=None,
+                 concurrency: Optional[AdaptiveConcurrency]=None, retry: Optional[RetryPolicy]=None,
+                 overload_statuses: Sequence[int]=OVERLOAD_STATUSES, logger: loguru.Logger = default_logger) -> None:
+        """ Pacing of requests of Transport. One instance is shared by Catalog, News, Content and Delivery.
+
+            Args:
+                rate (float, optional): Max count of requests per second. Defaults to None (without limit).
+                burst (int, optional): Max count of requests sent at once. Defaults to None (equal `rate`).
+                concurrency (AdaptiveConcurrency, optional): Limit of requests in flight. Defaults to None (without limit).
+                retry (RetryPolicy, optional): Retry policy. Defaults to None (without retries).
+                overload_statuses (Sequence[int], optional): Statuses how decrease concurrency. Defaults to OVERLOAD_STATUSES.
+                logger (loguru.Logger, optional): Logger for retries.
+
+            Example:
+                >>> limiter = RateLimiter(rate=20, concurrency=AdaptiveConcurrency(max_limit=16), retry=RetryPolicy())
+                >>> dkc_api = DkcAPI(master_key="xxxxxxxxxx", transport=Transport(limiter=limiter))
+                >>> dkc_api.transport.limiter.stats
+                > LimiterStats(requests=1200, retries=14, overloaded=17, failed=0, waited_seconds=3.2, limit=11.4, in_flight=0)
+        """
+        self.bucket = TokenBucket(rate, burst) if rate is not None else None
+        self.concurrency = concurrency
+        self.retry = retry
+        self.overload_statuses = frozenset(overload_statuses)
+        self.logger = logger
+
+        self._lock = threading.Lock()
+        self._count_requests = 0
+        self._count_retries = 0
+        self._count_overloaded = 0
+        self._count_failed = 0
+        self._waited = 0.0
+
+    def call(self, method: str, send: Callable[[], requests.Response]) -> requests.Response:
+        """ Send request with pacing, retry it if policy allows.
+
+        Args:
+            method (str): HTTP method, for check of retry policy.
+            send (Callable[[], requests.Response]): Function how send request.
+
+        Raises:
+            requests.ConnectionError, requests.Timeout: If request is failed and retries are over.
+        """
+        attempt = 0
+        while True:
+            waited = self.bucket.acquire() if self.bucket is not None else 0.0
+            started = self.concurrency.acquire() if self.concurrency is not None else 0.0
+
+            responce, error = None, None
+            try: responce = send()
+            except (requests.ConnectionError, requests.Timeout) as e: error = e
+            finally:
+                overload = responce is None or responce.status_code in self.overload_statuses
+                if self.concurrency is not None:
+                    self.concurrency.release(started, overload, getattr(responce, "network_time", 0.0))
+
+            retry = (self.retry is not None and self.retry.is_retryable(method, attempt) and
+                     (error is not None or responce.status_code in self.retry.statuses))
+
+            with self._lock:
+                self._count_requests += 1
+                self._count_overloaded += overload
+                self._count_retries += retry
+                self._count_failed += error is not None and not retry
+                self._waited += waited
+
+            if not retry:
+                if error is not None: raise error
+                return responce
+
+            delay = self.retry.delay(attempt, responce)
+            self.logger.warning(f"Retry {method} {attempt + 1}/{self.retry.retries} in {delay:.2f}s -> "
+                                f"{error if error is not None else responce.status_code}")
+            if responce is not None: responce.close()
+
+            time.sleep(delay)
+            attempt += 1
+
+    @property
+    def stats(self) -> LimiterStats:
+        """ Statistic of pacing.
+
+        Returns:
+            LimiterStats: Count of sent requests, retries, overload answers, failed requests, time of wait in bucket,
+            current concurrency limit and requests in flight.
+        """
+        with self._lock:
+            return LimiterStats(
+                requests=self._count_requests,
+                retries=self._count_retries,
+                overloaded=self._count_overloaded,
+                failed=self._count_failed,
+                waited_seconds=self._waited,
+                limit=self.concurrency.limit if self.concurrency is not None else None,
+                in_flight=self.concurrency.in_flight if self.concurrency is not None else None,
+            )
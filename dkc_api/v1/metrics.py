@@ -0,0 +1,191 @@
+from __future__ import annotations
+from typing import TYPE_CHECKING, Callable, NamedTuple, Sequence
+
+from .models.metrics import EndpointMetrics
+from .lazy import logger as default_logger
+
+import bisect
+import threading
+
+if TYPE_CHECKING:
+    import loguru
+
+
+# Buckets of time histograms in seconds, same as default buckets of Prometheus clients
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+
+
+class CallRecord(NamedTuple):
+    """ Measurement of one api call """
+    endpoint: str
+    status: int
+    received_bytes: int
+    network: float
+    decode: float
+    validate: float
+    error: bool
+
+
+class Histogram:
+    """ Histogram with fixed buckets, how in Prometheus. Not thread safe, is guarded by `Metrics` lock """
+    __slots__ = ("buckets", "counts", "count", "sum")
+
+    def __init__(self, buckets: Sequence[float]=DEFAULT_BUCKETS) -> None:
+        self.buckets = tuple(buckets)
+        self.counts = [0] * (len(self.buckets) + 1)
+        self.count = 0
+        self.sum = 0.0
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect.bisect_left(self.buckets, value)] += 1
+        self.count += 1
+        self.sum += value
+
+    def quantile(self, q: float) -> float:
+        """ Upper bound of bucket how contains quantile `q` (0..1). Inf if it is in last bucket """
+        if not self.count: return 0.0
+
+        rank, seen = q * self.count, 0
+        for bound, count in zip(self.buckets, self.counts):
+            seen += count
+            if seen >= rank: return bound
+        return float("inf")
+
+
+class _EndpointState:
+    __slots__ = ("calls", "errors", "statuses", "received_bytes", "network", "decode", "validate", "total")
+
+    def __init__(self, buckets: Sequence[float]) -> None:
+        self.calls = 0
+        self.errors = 0
+        self.statuses: dict[int, int] = {}
+        self.received_bytes = 0
+        self.network = Histogram(buckets)
+        self.decode = Histogram(buckets)
+        self.validate = Histogram(buckets)
+        self.total = Histogram(buckets)
+
+
+class Metrics:
+    """ In-process counters and histograms of api calls by endpoint (Catalog/News/Content/Delivery method name) """
+
+    def __init__(self, buckets: Sequence[float]=DEFAULT_BUCKETS, logger: loguru.Logger = default_logger) -> None:
+        """ In-process counters and histograms of api calls.
+
+            Args:
+                buckets (Sequence[float], optional): Bounds of time histograms in seconds. Defaults to DEFAULT_BUCKETS.
+                logger (loguru.Logger, optional): Logger for errors of hooks.
+
+            Example:
+                >>> dkc_api.metrics.add_hook(lambda call: print(call.endpoint, call.network, call.validate))
+                >>> dkc_api.metrics.stats["getMaterialStock"]
+                > EndpointMetrics(endpoint='getMaterialStock', calls=3, errors=0, received_bytes=361038241, ...)
+                >>> print(dkc_api.metrics.prometheus())
+        """
+        self.buckets = tuple(sorted(buckets))
+        self.logger = logger
+
+        self._endpoints: dict[str, _EndpointState] = {}
+        self._hooks: list[Callable[[CallRecord], None]] = []
+        self._lock = threading.Lock()
+
+    def add_hook(self, hook: Callable[[CallRecord], None]) -> None:
+        """ Add function how is called with `CallRecord` after every api call """
+        self._hooks = [*self._hooks, hook]
+
+    def remove_hook(self, hook: Callable[[CallRecord], None]) -> None:
+        self._hooks = [h for h in self._hooks if h is not hook]
+
+    def record(self, call: CallRecord) -> None:
+        """ Add measurement of call to counters and histograms and send it to hooks """
+        with self._lock:
+            state = self._endpoints.get(call.endpoint)
+            if state is None: state = self._endpoints[call.endpoint] = _EndpointState(self.buckets)
+
+            state.calls += 1
+            state.errors += call.error
+            state.statuses[call.status] = state.statuses.get(call.status, 0) + 1
+            state.received_bytes += call.received_bytes
+            state.network.observe(call.network)
+            state.decode.observe(call.decode)
+            state.validate.observe(call.validate)
+            state.total.observe(call.network + call.decode + call.validate)
+
+        for hook in self._hooks:
+            try: hook(call)
+            except Exception as e:
+                self.logger.error(f"Metrics hook {hook} failed -> {e}")
+
+    def reset(self) -> None:
+        """ Remove all measurements """
+        with self._lock:
+            self._endpoints = {}
+
+    @property
+    def stats(self) -> dict[str, EndpointMetrics]:
+        """ Totals by endpoint, sorted by total time (endpoint how take most of time is first) """
+        with self._lock:
+            stats = [EndpointMetrics(
+                endpoint=endpoint,
+                calls=state.calls,
+                errors=state.errors,
+                received_bytes=state.received_bytes,
+                network_seconds=state.network.sum,
+                decode_seconds=state.decode.sum,
+                validate_seconds=state.validate.sum,
+                total_seconds=state.total.sum,
+            ) for endpoint, state in self._endpoints.items()]
+
+        return { stat.endpoint: stat for stat in sorted(stats, key=lambda stat: stat.total_seconds, reverse=True) }
+
+    def quantile(self, endpoint: str, q: float, phase: str="total") -> float:
+        """ Estimated quantile of time (upper bound of histogram bucket).
+
+        Args:
+            endpoint (str): Method name, for example "getMaterial".
+            q (float): Quantile 0..1, for example 0.99.
+            phase (str, optional): "network", "decode", "validate" or "total". Defaults to "total".
+        """
+        with self._lock:
+            state = self._endpoints.get(endpoint)
+            return getattr(state, phase).quantile(q) if state is not None else 0.0
+
+    def prometheus(self, prefix: str="dkc_api") -> str:
+        """ All metrics in Prometheus text exposition format """
+        lines = [
+            f"# HELP {prefix}_calls_total Count of api calls.",
+            f"# TYPE {prefix}_calls_total counter",
+        ]
+        with self._lock:
+            endpoints = sorted(self._endpoints.items())
+
+            for endpoint, state in endpoints:
+                for status, count in sorted(state.statuses.items()):
+                    lines.append(f'{prefix}_calls_total{{endpoint="{endpoint}",status="{status}"}} {count}')
+
+            lines += [f"# HELP {prefix}_errors_total Count of calls how returned error model.",
+                      f"# TYPE {prefix}_errors_total counter"]
+            lines += [f'{prefix}_errors_total{{endpoint="{endpoint}"}} {state.errors}' for endpoint, state in endpoints]
+
+            lines += [f"# HELP {prefix}_received_bytes_total Size of received responce bodies.",
+                      f"# TYPE {prefix}_received_bytes_total counter"]
+            lines += [f'{prefix}_received_bytes_total{{endpoint="{endpoint}"}} {state.received_bytes}'
+                      for endpoint, state in endpoints]
+
+            for phase, description in (("network", "Time of request and body transfer."),
+                                       ("decode", "Time of json decode."),
+                                       ("validate", "Time of model validation.")):
+                name = f"{prefix}_{phase}_seconds"
+                lines += [f"# HELP {name} {description}", f"# TYPE {name} histogram"]
+
+                for endpoint, state in endpoints:
+                    histogram: Histogram = getattr(state, phase)
+                    cumulative = 0
+                    for bound, count in zip(histogram.buckets, histogram.counts):
+                        cumulative += count
+                        lines.append(f'{name}_bucket{{endpoint="{endpoint}",le="{bound}"}} {cumulative}')
+                    lines.append(f'{name}_bucket{{endpoint="{endpoint}",le="+Inf"}} {histogram.count}')
+                    lines.append(f'{name}_sum{{endpoint="{endpoint}"}} {histogram.sum}')
+                    lines.append(f'{name}_count{{endpoint="{endpoint}"}} {histogram.count}')
+
+        return "\n".join(lines) + "\n"
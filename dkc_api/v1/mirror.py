@@ -0,0 +1,242 @@
+from __future__ import annotations
+from typing import TYPE_CHECKING, Iterable, Iterator, Optional
+
+from .models.error import ResponceError, ResponceErrorAlternative
+from .models.mirror import MirrorSyncResult
+
+from .objects.content.models import RevisionMaterialsMaterialsUpdated, RevisionDrawingsDrawingsUpdated, \
+    RevisionCertificatesCertificatesUpdated
+from .objects.content.stream import REVISION_LAST_SECTIONS
+
+import sqlite3
+import datetime
+import threading
+
+from pydantic import BaseModel
+
+if TYPE_CHECKING:
+    from .dkc_api import DkcAPI
+
+
+SECTIONS: dict[str, type[BaseModel]] = {
+    "materials": RevisionMaterialsMaterialsUpdated,
+    "drawings": RevisionDrawingsDrawingsUpdated,
+    "certificates": RevisionCertificatesCertificatesUpdated,
+    **{ f"last.{section}": model for section, model in REVISION_LAST_SECTIONS.items() },
+}
+
+BATCH_SIZE = 1000
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS watermark (
+    name TEXT PRIMARY KEY,
+    last_updated INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS item (
+    section TEXT NOT NULL,
+    id TEXT NOT NULL,
+    code TEXT,
+    data TEXT NOT NULL,
+    PRIMARY KEY (section, id)
+);
+CREATE INDEX IF NOT EXISTS item_code ON item (section, code);
+"""
+
+
+class RevisionMirror:
+    """ Local SQLite mirror of revision data. Keep materials, drawings, certificates and all sections of full revision
+    (countries, cities, nodes, products, ...) and update them by deltas from the `last_updated` watermark. """
+
+    def __init__(self, dkc_api: DkcAPI, path: str="dkc_mirror.sqlite3") -> None:
+        """ Local SQLite mirror of revision data.
+
+            Args:
+                dkc_api (DkcAPI): Connector how used for get revisions.
+                path (str, optional): Path to SQLite database file. Defaults to "dkc_mirror.sqlite3".
+
+            Example:
+                >>> mirror = RevisionMirror(dkc_api, path="/var/lib/dkc/mirror.sqlite3")
+                >>> mirror.sync()
+                > [MirrorSyncResult(name='materials', full=False, updated=12, removed=1), ...]
+                >>> mirror.get_by_code("materials", "FKC600INOX316L")
+                > RevisionMaterialsMaterialsUpdated(id='1052191', code='FKC600INOX316L', ...)
+        """
+        self.dkc_api = dkc_api
+        self.path = path
+
+        self._lock = threading.RLock()
+        self.connection = sqlite3.connect(path, check_same_thread=False)
+        self.connection.executescript(SCHEMA)
+
+    def sync(self) -> list[MirrorSyncResult]:
+        """ Sync all revisions: materials, drawings, certificates and full revision """
+        return [self.sync_materials(), self.sync_drawings(), self.sync_certificates(), self.sync_revisions_last()]
+
+    def sync_materials(self) -> MirrorSyncResult:
+        """ Get changes of materials from watermark and apply them """
+        return self._sync_revision("materials", self.dkc_api.Content.getRevisionMaterials)
+
+    def sync_drawings(self) -> MirrorSyncResult:
+        """ Get changes of drawings from watermark and apply them """
+        return self._sync_revision("drawings", self.dkc_api.Content.getRevisionDrawings)
+
+    def sync_certificates(self) -> MirrorSyncResult:
+        """ Get changes of certificates from watermark and apply them """
+        return self._sync_revision("certificates", self.dkc_api.Content.getRevisionCertificates)
+
+    def sync_revisions_last(self) -> MirrorSyncResult:
+        """ Sync full revision. Fetch is skipped if `getRevisionsLastSize` returns zero size, full upload is loaded
+        if it returns `forced_update`. Body is applied while it is streamed. """
+        result = MirrorSyncResult(name="last")
+        last_updated = self.get_watermark("last")
+        started = datetime.datetime.now(datetime.timezone.utc)
+
+        if last_updated is not None:
+            size = self.dkc_api.Content.getRevisionsLastSize(last_updated=last_updated)
+            if isinstance(size, (ResponceError, ResponceErrorAlternative)):
+                result.error = size
+                return result
+
+            if size.size == 0 and not size.forced_update:
+                result.skipped = True
+                return result
+
+            if size.forced_update: last_updated = None
+
+        stream = self.dkc_api.Content.getRevisionsLastStream(last_updated=last_updated)
+        if isinstance(stream, (ResponceError, ResponceErrorAlternative)):
+            result.error = stream
+            return result
+
+        # `delta` can follow sections in body, then it is not known before items and is resolved after them
+        resolved = last_updated is None or stream.delta is not None
+        result.full = last_updated is None or stream.delta is False
+
+        with stream, self._lock, self.connection:
+            if result.full:
+                self.connection.execute("DELETE FROM item WHERE section LIKE 'last.%'")
+            if not resolved:
+                self.connection.execute(
+                    "CREATE TEMP TABLE IF NOT EXISTS last_seen (section TEXT, id TEXT, PRIMARY KEY (section, id))"
+                )
+                self.connection.execute("DELETE FROM last_seen")
+
+            batch, batch_key = [], None
+            for item in stream:
+                if (item.section, item.kind) != batch_key or len(batch) >= BATCH_SIZE:
+                    self._apply_batch(batch_key, batch, result, track_seen=not resolved)
+                    batch, batch_key = [], (item.section, item.kind)
+                batch.append(item.value)
+            self._apply_batch(batch_key, batch, result, track_seen=not resolved)
+
+            if not resolved and stream.delta is False:
+                # Full upload: items how are not in it are removed, as if table was cleared before
+                result.full = True
+                self.connection.execute(
+                    "DELETE FROM item WHERE section LIKE 'last.%' "
+                    "AND (section, id) NOT IN (SELECT section, id FROM last_seen)"
+                )
+            if not resolved: self.connection.execute("DELETE FROM last_seen")
+
+            self._set_watermark("last", started)
+
+        return result
+
+    def _apply_batch(self, batch_key: Optional[tuple[str, str]], batch: list, result: MirrorSyncResult,
+                     track_seen: bool=False) -> None:
+        """ Apply batch of items of one section and kind from revision stream. With `track_seen` ids of updated
+        items are kept in `last_seen` table """
+        if not batch: return
+
+        section, kind = batch_key
+        if kind == "updated":
+            result.updated += self._upsert(f"last.{section}", batch)
+            if track_seen:
+                self.connection.executemany("INSERT OR IGNORE INTO last_seen (section, id) VALUES (?, ?)",
+                                            ((f"last.{section}", str(item.id)) for item in batch))
+        else:
+            result.removed += self._remove(f"last.{section}", batch)
+
+    def _sync_revision(self, name: str, method) -> MirrorSyncResult:
+        """ Get revision `name` by `method` from watermark and apply it in one transaction """
+        result = MirrorSyncResult(name=name)
+        last_updated = self.get_watermark(name)
+        started = datetime.datetime.now(datetime.timezone.utc)
+
+        responce = method(last_updated=last_updated)
+        if isinstance(responce, (ResponceError, ResponceErrorAlternative)):
+            result.error = responce
+            return result
+
+        revision = responce.revision
+        data = getattr(revision, name)
+        result.full = last_updated is None or not revision.delta
+
+        with self._lock, self.connection:
+            if result.full:
+                self.connection.execute("DELETE FROM item WHERE section = ?", (name,))
+
+            result.updated = self._upsert(name, data.updated)
+            result.removed = self._remove(name, data.removed)
+            self._set_watermark(name, started)
+
+        return result
+
+    def _upsert(self, section: str, items: Iterable[BaseModel]) -> int:
+        """ Insert or replace items of section """
+        cursor = self.connection.executemany(
+            "INSERT OR REPLACE INTO item (section, id, code, data) VALUES (?, ?, ?, ?)",
+            ((section, str(item.id), getattr(item, "code", None), item.json()) for item in items)
+        )
+        return cursor.rowcount
+
+    def _remove(self, section: str, ids: Iterable[str]) -> int:
+        """ Remove items of section by ids """
+        cursor = self.connection.executemany(
+            "DELETE FROM item WHERE section = ? AND id = ?", ((section, str(id)) for id in ids)
+        )
+        return cursor.rowcount
+
+    def get_watermark(self, name: str) -> Optional[datetime.datetime]:
+        """ Get time of last success sync of revision `name` """
+        with self._lock:
+            row = self.connection.execute("SELECT last_updated FROM watermark WHERE name = ?", (name,)).fetchone()
+        return datetime.datetime.fromtimestamp(row[0], datetime.timezone.utc) if row else None
+
+    def _set_watermark(self, name: str, last_updated: datetime.datetime) -> None:
+        self.connection.execute(
+            "INSERT OR REPLACE INTO watermark (name, last_updated) VALUES (?, ?)", (name, int(last_updated.timestamp()))
+        )
+
+    def get(self, section: str, id: str) -> Optional[BaseModel]:
+        """ Get item of section by id.
+
+        Args:
+            section (str): "materials", "drawings", "certificates" or "last.<section>" (for example "last.products").
+            id (str): Item id.
+        """
+        with self._lock:
+            row = self.connection.execute("SELECT data FROM item WHERE section = ? AND id = ?", (section, str(id))).fetchone()
+        return SECTIONS[section].parse_raw(row[0]) if row else None
+
+    def get_by_code(self, section: str, code: str) -> Optional[BaseModel]:
+        """ Get item of section by material code. Only for "materials" and "last.products" """
+        with self._lock:
+            row = self.connection.execute("SELECT data FROM item WHERE section = ? AND code = ?", (section, str(code))).fetchone()
+        return SECTIONS[section].parse_raw(row[0]) if row else None
+
+    def iter_section(self, section: str) -> Iterator[BaseModel]:
+        """ Iterate over all items of section """
+        with self._lock:
+            rows = self.connection.execute("SELECT data FROM item WHERE section = ?", (section,)).fetchall()
+        for row in rows:
+            yield SECTIONS[section].parse_raw(row[0])
+
+    def count(self, section: str) -> int:
+        """ Count of items in section """
+        with self._lock:
+            return self.connection.execute("SELECT COUNT(*) FROM item WHERE section = ?", (section,)).fetchone()[0]
+
+    def close(self) -> None:
+        """ Close database connection """
+        self.connection.close()
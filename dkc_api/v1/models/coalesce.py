@@ -0,0 +1,6 @@
+from pydantic import BaseModel
+
+class CoalesceStats(BaseModel):
+    calls: int
+    shared: int
+    in_flight: int
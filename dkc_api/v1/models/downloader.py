@@ -0,0 +1,14 @@
+from pydantic import BaseModel
+
+class AssetError(BaseModel):
+    url: str
+    error: str
+
+class DownloadResult(BaseModel):
+    downloaded: int = 0
+    resumed: int = 0
+    skipped: int = 0
+    not_modified: int = 0
+    failed: int = 0
+    received_bytes: int = 0
+    errors: list[AssetError] = []
\ No newline at end of file
@@ -0,0 +1,11 @@
+from typing import Optional
+from pydantic import BaseModel
+
+class LimiterStats(BaseModel):
+    requests: int
+    retries: int
+    overloaded: int
+    failed: int
+    waited_seconds: float
+    limit: Optional[float]
+    in_flight: Optional[int]
@@ -0,0 +1,11 @@
+from pydantic import BaseModel
+
+class EndpointMetrics(BaseModel):
+    endpoint: str
+    calls: int
+    errors: int
+    received_bytes: int
+    network_seconds: float
+    decode_seconds: float
+    validate_seconds: float
+    total_seconds: float
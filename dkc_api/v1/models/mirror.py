@@ -0,0 +1,12 @@
+from typing import Optional, Union
+from pydantic import BaseModel
+
+from .error import ResponceError, ResponceErrorAlternative
+
+class MirrorSyncResult(BaseModel):
+    name: str
+    skipped: bool = False
+    full: bool = False
+    updated: int = 0
+    removed: int = 0
+    error: Optional[Union[ResponceError, ResponceErrorAlternative]] = None
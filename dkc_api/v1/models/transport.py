@@ -0,0 +1,7 @@
+from pydantic import BaseModel
+
+class TransportStats(BaseModel):
+    requests: int
+    connections: int
+    reused: int
+    reuse_ratio: float
@@ -0,0 +1,239 @@
+from __future__ import annotations
+from typing import TYPE_CHECKING, Iterable, Union
+from json import JSONDecodeError
+
+from dkc_api.v1.const import URL_DOMAIN
+from dkc_api.v1.async_transport import AsyncTransport
+from dkc_api.v1.metrics import Metrics
+from dkc_api.v1.records import construct, DEFAULT_SAMPLE_RATE
+from dkc_api.v1.models.error import ResponceError, ResponceErrorAlternative
+from dkc_api.v1.responce import parse_responce
+from dkc_api.v1.lazy import logger as default_logger
+
+from .models import GetMaterial, GetMaterials, GetMaterialCertificates, GetMaterialStock, GetMaterialRelated, GetMaterialAccessories, \
+    GetMaterialVideo, GetMaterialDrawingsSketch, GetMaterialDescription, GetMaterialAnalogs, GetMaterialSpecification
+from .chunks import MAX_STOCK_QUERY_LENGTH, StockChunk, stock_query, split_stock_query, stale_stock_chunks, \
+    merge_stock_chunks
+
+import time
+import asyncio
+
+import httpx
+from pydantic.error_wrappers import ValidationError
+
+if TYPE_CHECKING:
+    import loguru
+
+
+class AsyncCatalog:
+    """ Asyncio class for interacting with "MaterialData". Methods are the same as in `Catalog` """
+
+    def __init__(self, access_token: str, headers: dict, transport: AsyncTransport, debug: bool=False,
+                 logger: loguru.Logger = default_logger, validation: str = "full", sample_rate: int = DEFAULT_SAMPLE_RATE,
+                 url_domain: str = URL_DOMAIN, metrics: Metrics = None):
+        """ Asyncio class for interacting with "MaterialData". Methods are the same as in `Catalog` """
+        self.access_token = access_token
+        self.headers = headers
+        self.transport = transport
+        self.logger = logger
+        self.debug = debug
+        self.url_domain = url_domain
+        self.validation = validation
+        self.sample_rate = sample_rate
+        self.metrics = metrics if metrics is not None else Metrics()
+
+    async def getMaterial(self, code: str) -> Union[GetMaterial, ResponceError, ResponceErrorAlternative]:
+        """ Async version of `Catalog.getMaterial`. An array containing complete data for one material.
+
+        Example:
+            >>> await dkc_api.Catalog.getMaterial(code='FKC600INOX316L')
+            > getMaterial(material={id=1052191, node_id=1319, etim_class_id='EC002403', ...})
+        """
+
+        responce = await self.transport.get(f"{self.url_domain}/catalog/material?code={code}", headers=self.headers)
+
+        return parse_responce(responce, GetMaterial, "getMaterial", self.metrics)
+
+    async def getMaterials(self, codes: Iterable[str], workers: int=8) -> GetMaterials:
+        """ Async version of `Catalog.getMaterials`. Complete data for many materials, `workers` requests in flight.
+
+        Example:
+            >>> await dkc_api.Catalog.getMaterials(codes=['FKC600INOX316L', '1200', ...], workers=64)
+            > GetMaterials(codes=['FKC600INOX316L', '1200', ...], materials=[GetMaterial(...), ...], elapsed=3.1, throughput=1612.9)
+        """
+        codes = [str(code) for code in codes]
+        semaphore = asyncio.Semaphore(max(workers, 1))
+
+        async def getMaterialSafe(code: str) -> Union[GetMaterial, ResponceError, ResponceErrorAlternative]:
+            async with semaphore:
+                try: return await self.getMaterial(code)
+                except (httpx.HTTPError, ValidationError) as e:
+                    return ResponceError(code=0, message=f"{type(e).__name__}: {e}")
+
+        start = time.perf_counter()
+        materials = await asyncio.gather(*[getMaterialSafe(code) for code in codes])
+        elapsed = time.perf_counter() - start
+
+        if self.debug: self.logger.debug(f"getMaterials -> {len(codes)} codes for {elapsed:.3f} sec.")
+
+        return GetMaterials(
+            codes=codes,
+            materials=materials,
+            elapsed=elapsed,
+            throughput=len(codes) / elapsed if elapsed else 0.0
+        )
+
+    async def getMaterialCertificates(self, code: str) -> Union[GetMaterialCertificates, ResponceError, ResponceErrorAlternative]:
+        """ Async version of `Catalog.getMaterialCertificates`. An array containing certificates for one material.
+
+        Example:
+            >>> await dkc_api.Catalog.getMaterialCertificates(code='FKC600INOX316L')
+            > getMaterialCertificates(certificates=[{id=810932, name="«F5 Combitech» ...", src='https://...', ...}])
+        """
+
+        responce = await self.transport.get(f"{self.url_domain}/catalog/material/certificates?code={code}", headers=self.headers)
+
+        return parse_responce(responce, GetMaterialCertificates, "getMaterialCertificates", self.metrics,
+                              build=lambda data: GetMaterialCertificates(certificates=data))
+
+    async def getMaterialStock(self, code: Union[list[str], str, int]=[], id: Union[list[str], str, int]=[],
+                               max_query_length: int=MAX_STOCK_QUERY_LENGTH) -> Union[GetMaterialStock, ResponceError, ResponceErrorAlternative]:
+        """ Async version of `Catalog.getMaterialStock`. An array containing stock balances.
+        If there is no ‘Material code’ or ‘Material ID’, it returns all data. Long code (or id) list is split to chunks
+        with query not longer `max_query_length`, chunks are fetched concurrently (limited by `max_concurrency`
+        of transport) and merged to one responce.
+
+        Example:
+            >>> await dkc_api.Catalog.getMaterialStock(code=['1100, 1000', ...], id=['1','2', ...])
+            > GetMaterialStock(create=datetime.datetime(2021, 7, 19, 21, 0, tzinfo=datetime.timezone.utc), materials=[...])
+        """
+        chunks = split_stock_query(code, id, max_query_length)
+        if chunks is None: return await self._getMaterialStockQuery(stock_query(code, id))
+
+        results = list(await asyncio.gather(*(self._getMaterialStockChunk(chunk) for chunk in chunks)))
+
+        stale = stale_stock_chunks(results)
+        if stale:
+            if self.debug: self.logger.debug(f"getMaterialStock -> revision changed, fetch again {len(stale)} chunks")
+            for index, result in zip(stale, await asyncio.gather(*(self._getMaterialStockChunk(chunks[index]) for index in stale))):
+                results[index] = result
+
+        return merge_stock_chunks(chunks, results)
+
+    async def _getMaterialStockChunk(self, chunk: StockChunk) -> Union[GetMaterialStock, ResponceError, ResponceErrorAlternative]:
+        """ Get stock of one chunk, convert network error to ResponceError, for not abort other chunks """
+        try: return await self._getMaterialStockQuery(chunk.query)
+        except (httpx.HTTPError, ValidationError, JSONDecodeError) as e:
+            return ResponceError(code=0, message=f"{type(e).__name__}: {e}")
+
+    async def _getMaterialStockQuery(self, query: str) -> Union[GetMaterialStock, ResponceError, ResponceErrorAlternative]:
+        responce = await self.transport.get(f"{self.url_domain}/catalog/material/stock?{query}", headers=self.headers)
+        if self.debug: self.logger.debug(responce.url)
+
+        return parse_responce(responce, GetMaterialStock, "getMaterialStock", self.metrics,
+                              build=lambda data: construct(GetMaterialStock, data, self.validation, self.sample_rate))
+
+    async def getMaterialRelated(self, code: str = None) -> Union[GetMaterialRelated, ResponceError, ResponceErrorAlternative]:
+        """ Async version of `Catalog.getMaterialRelated`. Without material code method very long response.
+
+        Example:
+            >>> await dkc_api.Catalog.getMaterialRelated(code="FKC600INOX316L")
+            > GetMaterialRelated(related={ "FKC600INOX316L": [...] })
+        """
+
+        send_code = ""
+        if code: send_code = f'code={code}'
+
+        responce = await self.transport.get(f"{self.url_domain}/catalog/material/related?{send_code}", headers=self.headers)
+
+        return parse_responce(responce, GetMaterialRelated, "getMaterialRelated", self.metrics)
+
+    async def getMaterialAccessories(self, code: str = None) -> Union[GetMaterialAccessories, ResponceError, ResponceErrorAlternative]:
+        """ Async version of `Catalog.getMaterialAccessories`.
+
+        Example:
+            >>> await dkc_api.Catalog.getMaterialAccessories(code="FKC600INOX316L")
+            > GetMaterialAccessories(accessories={ "FKC600INOX316L": [...] })
+        """
+
+        send_code = ""
+        if code: send_code = f'code={code}'
+
+        responce = await self.transport.get(f"{self.url_domain}/catalog/material/accessories?{send_code}", headers=self.headers)
+
+        return parse_responce(responce, GetMaterialAccessories, "getMaterialAccessories", self.metrics)
+
+    async def getMaterialVideo(self, code: str = None) -> Union[GetMaterialVideo, ResponceError, ResponceErrorAlternative]:
+        """ Async version of `Catalog.getMaterialVideo`.
+
+        Example:
+            >>> await dkc_api.Catalog.getMaterialVideo()
+            > GetMaterialVideo(video={ "R5CEB03311": ["R5STX0442", "R5STX0446", ...], ... })
+        """
+
+        send_code = ""
+        if code: send_code = f'code={code}'
+
+        responce = await self.transport.get(f"{self.url_domain}/catalog/material/video?{send_code}", headers=self.headers)
+
+        return parse_responce(responce, GetMaterialVideo, "getMaterialVideo", self.metrics)
+
+    async def getMaterialDrawingsSketch(self, code: str = None) -> Union[GetMaterialDrawingsSketch, ResponceError, ResponceErrorAlternative]:
+        """ Async version of `Catalog.getMaterialDrawingsSketch`.
+
+        Example:
+            >>> await dkc_api.Catalog.getMaterialDrawingsSketch()
+            > GetMaterialDrawingsSketch(drawings_sketch={ "R5CEB03311": ["R5STX0442", "R5STX0446", ...], ... })
+        """
+
+        send_code = ""
+        if code: send_code = f'code={code}'
+
+        responce = await self.transport.get(f"{self.url_domain}/catalog/material/drawings/sketch?{send_code}", headers=self.headers)
+
+        return parse_responce(responce, GetMaterialDrawingsSketch, "getMaterialDrawingsSketch", self.metrics)
+
+    async def getMaterialDescription(self, code: str = None) -> Union[GetMaterialDescription, ResponceError, ResponceErrorAlternative]:
+        """ Async version of `Catalog.getMaterialDescription`.
+
+        Example:
+            >>> await dkc_api.Catalog.getMaterialDescription()
+            > GetMaterialDescription(description={ "R5CEB03311": ["R5STX0442", "R5STX0446", ...], ... })
+        """
+
+        send_code = ""
+        if code: send_code = f'code={code}'
+
+        responce = await self.transport.get(f"{self.url_domain}/catalog/material/description?{send_code}", headers=self.headers)
+
+        return parse_responce(responce, GetMaterialDescription, "getMaterialDescription", self.metrics)
+
+    async def getMaterialAnalogs(self, code: str = None) -> Union[GetMaterialAnalogs, ResponceError, ResponceErrorAlternative]:
+        """ Async version of `Catalog.getMaterialAnalogs`.
+
+        Example:
+            >>> await dkc_api.Catalog.getMaterialAnalogs()
+            > GetMaterialAnalogs(analogs={ "R5CEB03311": ["R5STX0442", "R5STX0446", ...], ... })
+        """
+
+        send_code = ""
+        if code: send_code = f'code={code}'
+
+        responce = await self.transport.get(f"{self.url_domain}/catalog/material/analogs?{send_code}", headers=self.headers)
+
+        return parse_responce(responce, GetMaterialAnalogs, "getMaterialAnalogs", self.metrics)
+
+    async def getMaterialSpecification(self, code: str = None) -> Union[GetMaterialSpecification, ResponceError, ResponceErrorAlternative]:
+        """ Async version of `Catalog.getMaterialSpecification`.
+
+        Example:
+            >>> await dkc_api.Catalog.getMaterialSpecification()
+            > GetMaterialSpecification(specification={ "R5CEB03311": ["R5STX0442", "R5STX0446", ...], ... })
+        """
+
+        send_code = ""
+        if code: send_code = f'code={code}'
+
+        responce = await self.transport.get(f"{self.url_domain}/catalog/material/specification?{send_code}", headers=self.headers)
+
+        return parse_responce(responce, GetMaterialSpecification, "getMaterialSpecification", self.metrics)
@@ -1,28 +1,62 @@
 from __future__ import annotations
-from typing import Union
+from typing import TYPE_CHECKING, Iterable, Union
 from json import JSONDecodeError
+from concurrent.futures import ThreadPoolExecutor
 
 from dkc_api.v1.const import URL_DOMAIN
+from dkc_api.v1.transport import Transport
+from dkc_api.v1.metrics import Metrics
+from dkc_api.v1.coalesce import Coalescer, coalesced
+from dkc_api.v1.responce import parse_responce, parse_error, MeteredStream
+from dkc_api.v1.cache import ResponseCache
+from dkc_api.v1.records import construct, DEFAULT_SAMPLE_RATE
 from dkc_api.v1.models.error import ResponceError, ResponceErrorAlternative
+from dkc_api.v1.lazy import logger as default_logger
 
-from .models import GetMaterial, GetMaterialCertificates, GetMaterialStock, GetMaterialRelated, GetMaterialAccessories, \
+from .models import GetMaterial, GetMaterials, GetMaterialCertificates, GetMaterialStock, GetMaterialRelated, GetMaterialAccessories, \
     GetMaterialVideo, GetMaterialDrawingsSketch, GetMaterialDescription, GetMaterialAnalogs, GetMaterialSpecification
+from .stream import MaterialStockStream
+from .chunks import MAX_STOCK_QUERY_LENGTH, StockChunk, stock_query, split_stock_query, stale_stock_chunks, \
+    merge_stock_chunks
+
+import time
 
-import loguru
 import requests
 from pydantic.error_wrappers import ValidationError
 
+if TYPE_CHECKING:
+    import loguru
+
 
 class Catalog:
     """ Class for interacting with "MaterialData" """
     
-    def __init__(self, access_token: str, headers: dict, debug: bool=False, logger: loguru.Logger = loguru.logger):
-        """ Class for interacting with "MaterialData" """
+    def __init__(self, access_token: str, headers: dict, debug: bool=False, logger: loguru.Logger = default_logger,
+                 transport: Transport = None, cache: ResponseCache = None, validation: str = "full",
+                 sample_rate: int = DEFAULT_SAMPLE_RATE, url_domain: str = URL_DOMAIN, metrics: Metrics = None,
+                 coalescer: Coalescer = None):
+        """ Class for interacting with "MaterialData". If `cache` is set (MemoryCache, DiskCache), 
+        responces are cached by time to live of every method. `validation` is mode of building `getMaterialStock`
+        responce ("full", "trusted", "sampled"), see `dkc_api.v1.records`. If `coalescer` is set, concurrent calls
+        with same arguments share one request, see `dkc_api.v1.coalesce`. """
         self.access_token = access_token
         self.headers = headers
         self.logger = logger
         self.debug = debug
-
+        self.url_domain = url_domain
+        self.metrics = metrics if metrics is not None else Metrics()
+        self.transport = transport if transport is not None else Transport()
+        self.coalescer = coalescer
+        self.cache = cache
+        self.validation = validation
+        self.sample_rate = sample_rate
+
+    def _get(self, endpoint: str, url: str) -> requests.Response:
+        """ Send GET request through the cache if it is set """
+        if self.cache is None: return self.transport.get(url, headers=self.headers)
+        return self.cache.fetch(endpoint, url, lambda headers: self.transport.get(url, headers={ **self.headers, **headers }))
+
+    @coalesced("getMaterial")
     def getMaterial(self, code: str) -> Union[GetMaterial, ResponceError, ResponceErrorAlternative]:
         """An array containing complete data for one material.
 
@@ -37,16 +71,50 @@ class Catalog:
             > getMaterial(material={id=1052191, node_id=1319, etim_class_id='EC002403', ...})
         """
         
-        responce = requests.get(f"{URL_DOMAIN}/catalog/material?code={code}", headers=self.headers)
+        responce = self._get("getMaterial", f"{self.url_domain}/catalog/material?code={code}")
+
+        return parse_responce(responce, GetMaterial, "getMaterial", self.metrics)
+
+    def getMaterials(self, codes: Iterable[str], workers: int=8) -> GetMaterials:
+        """Complete data for many materials. Materials are fetched in parallel by `workers` threads
+        through the shared transport, so set `Transport(pool_maxsize=...)` not less than `workers`.
 
-        try: return GetMaterial(**responce.json())
-        except ValidationError:
-            if responce.status_code == 500 or responce.status_code == 403:
-                return ResponceErrorAlternative(**responce.json())
-            return ResponceError(**{"code": responce.status_code, **responce.json() })
-        except JSONDecodeError:
-            return ResponceError(code="JsonDecodeError", message="With converting json request excaption error!")
+        Args:
+            codes (Iterable[str]): Material codes.
+            workers (int, optional): Count of parallel requests. Defaults to 8.
+
+        Returns:
+            GetMaterials: Return material or error for every code in input order, wall time of the batch in seconds
+            and throughput in materials per second. An error of one code does not abort the batch.
 
+        Example:
+            >>> dkc_api.Catalog.getMaterials(codes=['FKC600INOX316L', '1200', ...], workers=16)
+            > GetMaterials(codes=['FKC600INOX316L', '1200', ...], materials=[GetMaterial(...), ResponceError(...), ...],
+                           elapsed=12.4, throughput=403.2)
+        """
+        codes = [str(code) for code in codes]
+
+        start = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=max(workers, 1)) as executor:
+            materials = list(executor.map(self._getMaterialSafe, codes))
+        elapsed = time.perf_counter() - start
+
+        if self.debug: self.logger.debug(f"getMaterials -> {len(codes)} codes for {elapsed:.3f} sec.")
+
+        return GetMaterials(
+            codes=codes,
+            materials=materials,
+            elapsed=elapsed,
+            throughput=len(codes) / elapsed if elapsed else 0.0
+        )
+
+    def _getMaterialSafe(self, code: str) -> Union[GetMaterial, ResponceError, ResponceErrorAlternative]:
+        """ Call `getMaterial` and convert network error to ResponceError, for not abort batch """
+        try: return self.getMaterial(code)
+        except (requests.RequestException, ValidationError) as e:
+            return ResponceError(code=0, message=f"{type(e).__name__}: {e}")
+
+    @coalesced("getMaterialCertificates")
     def getMaterialCertificates(self, code: str) -> Union[GetMaterialCertificates, ResponceError, ResponceErrorAlternative]:
         """An array containing certificates for one material.
 
@@ -61,21 +129,26 @@ class Catalog:
             > getMaterialCertificates(certificates=[{id=810932, name="«F5 Combitech» ...", src='https://...', ...}])
         """
         
-        responce = requests.get(f"{URL_DOMAIN}/catalog/material/certificates?code={code}", headers=self.headers)
+        responce = self._get("getMaterialCertificates", f"{self.url_domain}/catalog/material/certificates?code={code}")
 
-        try: return GetMaterialCertificates(**{ 'certificates': responce.json() })
-        except ValidationError: 
-            if responce.status_code == 500 or responce.status_code == 403:
-                return ResponceErrorAlternative(**responce.json())
-            return ResponceError(**{"code": responce.status_code, **responce.json() })
+        return parse_responce(responce, GetMaterialCertificates, "getMaterialCertificates", self.metrics,
+                              build=lambda data: GetMaterialCertificates(certificates=data))
 
-    def getMaterialStock(self, code: Union[list[str], str, int]=[], id: Union[list[str], str, int]=[]) -> Union[GetMaterialStock, ResponceError, ResponceErrorAlternative]:
+    @coalesced("getMaterialStock")
+    def getMaterialStock(self, code: Union[list[str], str, int]=[], id: Union[list[str], str, int]=[],
+                         max_query_length: int=MAX_STOCK_QUERY_LENGTH, workers: int=8) -> Union[GetMaterialStock, ResponceError, ResponceErrorAlternative]:
         """ An array containing stock balances. The revision is formed 1 time per hour. 
         If there is no ‘Material code’ or ‘Material ID’, it returns all data.
+        
+        Long code (or id) list is split to chunks with query not longer `max_query_length`, chunks are fetched in
+        parallel by `workers` threads and merged to one responce. If chunks got different revisions, chunks with old
+        revision are fetched again once. Errors of chunks are in `errors` of responce.
 
         Args:
             code (list[str], optional): Material code list. If present, ‘Material ID’ is not taken into account. Defaults to [].
             id (list[str], optional): Material id list. Defaults to [].
+            max_query_length (int, optional): Max length of code/id query of one request. Defaults to 2000.
+            workers (int, optional): Count of parallel requests of chunks. Defaults to 8.
 
         Returns:
             Union[GetMaterialStock, ResponceError, ResponceErrorAlternative]: Return all material stock list.
@@ -101,27 +174,74 @@ class Catalog:
             
             >>> dkc_api.Catalog.getMaterialStock()
             > GetMaterialStock(create=datetime.datetime(2021, 7, 19, 21, 0, tzinfo=datetime.timezone.utc), materials=[*All data*])
+            
+            How get stock of long code list:
+            >>> dkc_api.Catalog.getMaterialStock(code=[*10000 codes*], workers=16)
+            > GetMaterialStock(create=datetime.datetime(2021, 7, 19, 21, 0, tzinfo=datetime.timezone.utc), materials=[...],
+                               errors=[MaterialStockChunkError(index=3, field='code', values=[...], error=ResponceError(...))])
         """
-        send_code = ""
-        send_id = ""
+        chunks = split_stock_query(code, id, max_query_length)
+        if chunks is None: return self._getMaterialStockQuery(stock_query(code, id))
 
-        if isinstance(code, list) and code != []: send_code = "code=" + ",".join(code)
-        elif isinstance(code, str): send_code = "code=" + code
-        elif isinstance(code, int): send_code = "code=" + str(code)
-        
-        if isinstance(id, list) and id != []: send_id = "&id=" + ",".join(id)
-        elif isinstance(id, str): send_id = "&id=" + id
-        elif isinstance(id, int): send_id = "&id=" +str(id)
+        start = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=max(min(workers, len(chunks)), 1)) as executor:
+            results = list(executor.map(self._getMaterialStockChunk, chunks))
 
-        responce = requests.get(f"{URL_DOMAIN}/catalog/material/stock?{send_code}{send_id}", headers=self.headers)
+            stale = stale_stock_chunks(results)
+            if stale:
+                if self.debug: self.logger.debug(f"getMaterialStock -> revision changed, fetch again {len(stale)} chunks")
+                for index, result in zip(stale, executor.map(self._getMaterialStockChunk, [chunks[index] for index in stale])):
+                    results[index] = result
+
+        if self.debug: 
+            self.logger.debug(f"getMaterialStock -> {len(chunks)} chunks for {time.perf_counter() - start:.3f} sec.")
+        return merge_stock_chunks(chunks, results)
+
+    def _getMaterialStockQuery(self, query: str) -> Union[GetMaterialStock, ResponceError, ResponceErrorAlternative]:
+        responce = self._get("getMaterialStock", f"{self.url_domain}/catalog/material/stock?{query}")
         if self.debug: self.logger.debug(responce.url)
 
-        try: return GetMaterialStock(**responce.json())
-        except ValidationError: 
-            if responce.status_code == 500 or responce.status_code == 403:
-                return ResponceErrorAlternative(**responce.json())
-            return ResponceError(**{"code": responce.status_code, **responce.json() })
-        
+        return parse_responce(responce, GetMaterialStock, "getMaterialStock", self.metrics,
+                              build=lambda data: construct(GetMaterialStock, data, self.validation, self.sample_rate))
+
+    def _getMaterialStockChunk(self, chunk: StockChunk) -> Union[GetMaterialStock, ResponceError, ResponceErrorAlternative]:
+        """ Get stock of one chunk, convert network error to ResponceError, for not abort other chunks """
+        try: return self._getMaterialStockQuery(chunk.query)
+        except (requests.RequestException, ValidationError, JSONDecodeError) as e:
+            return ResponceError(code=0, message=f"{type(e).__name__}: {e}")
+
+    def getMaterialStockStream(self, code: Union[list[str], str, int]=[], id: Union[list[str], str, int]=[],
+                               chunk_size: int=65536) -> Union[MaterialStockStream, ResponceError, ResponceErrorAlternative]:
+        """ Streaming version of `getMaterialStock`. Body is parsed incrementally and materials are yielded 
+        one by one, so memory does not depend on size of catalog. Use it for get all data.
+
+        Args:
+            code (list[str], optional): Material code list. If present, ‘Material ID’ is not taken into account. Defaults to [].
+            id (list[str], optional): Material id list. Defaults to [].
+            chunk_size (int, optional): Size of read chunk in bytes. Defaults to 65536.
+
+        Returns:
+            Union[MaterialStockStream, ResponceError, ResponceErrorAlternative]: Return stream of `MaterialStock` 
+            with `create` attribute.
+
+        Example:
+            >>> with dkc_api.Catalog.getMaterialStockStream() as stream:
+            >>>     stream.create
+            >>>     for material in stream: ...
+            > datetime.datetime(2021, 7, 19, 21, 0, tzinfo=datetime.timezone.utc)
+            > MaterialStock(id=81, status=True, code='1200', warehouse=[...])
+        """
+        responce = self.transport.get(f"{self.url_domain}/catalog/material/stock?{stock_query(code, id)}", 
+                                      headers=self.headers, stream=True)
+        if self.debug: self.logger.debug(responce.url)
+
+        if responce.status_code == 200:
+            return MaterialStockStream(MeteredStream(responce, "getMaterialStockStream", self.metrics), chunk_size=chunk_size)
+
+        try: return parse_error(responce, "getMaterialStockStream", self.metrics)
+        finally: responce.close()
+
+    @coalesced("getMaterialRelated")
     def getMaterialRelated(self, code: str = None) -> Union[GetMaterialRelated, ResponceError, ResponceErrorAlternative]:
         """ Get related materials for or a complete list of related materials for materials without specifying.
         Without material code method very long response.
@@ -143,14 +263,11 @@ class Catalog:
         send_code = ""
         if code: send_code = f'code={code}'
 
-        responce = requests.get(f"{URL_DOMAIN}/catalog/material/related?{send_code}", headers=self.headers)
+        responce = self._get("getMaterialRelated", f"{self.url_domain}/catalog/material/related?{send_code}")
         
-        try: return GetMaterialRelated(**responce.json())
-        except ValidationError:
-            if responce.status_code == 500 or responce.status_code == 403:
-                return ResponceErrorAlternative(**responce.json())
-            return ResponceError(**{"code": responce.status_code, **responce.json() })
+        return parse_responce(responce, GetMaterialRelated, "getMaterialRelated", self.metrics)
         
+    @coalesced("getMaterialAccessories")
     def getMaterialAccessories(self, code: str = None) -> Union[GetMaterialAccessories, ResponceError, ResponceErrorAlternative]:
         """Get accessories by material `code` or a complete list of accessories by materials without specifying material `code`.
 
@@ -171,14 +288,11 @@ class Catalog:
         send_code = ""
         if code: send_code = f'code={code}'
 
-        responce = requests.get(f"{URL_DOMAIN}/catalog/material/accessories?{send_code}", headers=self.headers)
+        responce = self._get("getMaterialAccessories", f"{self.url_domain}/catalog/material/accessories?{send_code}")
 
-        try: return GetMaterialAccessories(**responce.json())
-        except ValidationError: 
-            if responce.status_code == 500 or responce.status_code == 403:
-                return ResponceErrorAlternative(**responce.json())
-            return ResponceError(**{"code": responce.status_code, **responce.json() })
+        return parse_responce(responce, GetMaterialAccessories, "getMaterialAccessories", self.metrics)
         
+    @coalesced("getMaterialVideo")
     def getMaterialVideo(self, code: str = None) -> Union[GetMaterialVideo, ResponceError, ResponceErrorAlternative]:
         """Get video by material `code` or a complete list of video by materials without specifying material `code`.
 
@@ -196,14 +310,11 @@ class Catalog:
         send_code = ""
         if code: send_code = f'code={code}'
 
-        responce = requests.get(f"{URL_DOMAIN}/catalog/material/video?{send_code}", headers=self.headers)
+        responce = self._get("getMaterialVideo", f"{self.url_domain}/catalog/material/video?{send_code}")
 
-        try: return GetMaterialVideo(**responce.json())
-        except ValidationError:
-            if responce.status_code == 500 or responce.status_code == 403:
-                return ResponceErrorAlternative(**responce.json())
-            return ResponceError(**{"code": responce.status_code, **responce.json() })
+        return parse_responce(responce, GetMaterialVideo, "getMaterialVideo", self.metrics)
         
+    @coalesced("getMaterialDrawingsSketch")
     def getMaterialDrawingsSketch(self, code: str = None) -> Union[GetMaterialDrawingsSketch, ResponceError, ResponceErrorAlternative]:
         """Get sketches of drawings by material `code` or a complete list of sketches of 
         drawings by materials without specifying material `code` 
@@ -222,14 +333,11 @@ class Catalog:
         send_code = ""
         if code: send_code = f'code={code}'
 
-        responce = requests.get(f"{URL_DOMAIN}/catalog/material/drawings/sketch?{send_code}", headers=self.headers)
+        responce = self._get("getMaterialDrawingsSketch", f"{self.url_domain}/catalog/material/drawings/sketch?{send_code}")
 
-        try: return GetMaterialDrawingsSketch(**responce.json())
-        except ValidationError: 
-            if responce.status_code == 500 or responce.status_code == 403:
-                return ResponceErrorAlternative(**responce.json())
-            return ResponceError(**{"code": responce.status_code, **responce.json() })
+        return parse_responce(responce, GetMaterialDrawingsSketch, "getMaterialDrawingsSketch", self.metrics)
         
+    @coalesced("getMaterialDescription")
     def getMaterialDescription(self, code: str = None) -> Union[GetMaterialDescription, ResponceError, ResponceErrorAlternative]:
         """Get material description by material `code` or a complete list of material description 
         by materials without specifying material `code`
@@ -248,14 +356,11 @@ class Catalog:
         send_code = ""
         if code: send_code = f'code={code}'
 
-        responce = requests.get(f"{URL_DOMAIN}/catalog/material/description?{send_code}", headers=self.headers)
+        responce = self._get("getMaterialDescription", f"{self.url_domain}/catalog/material/description?{send_code}")
 
-        try: return GetMaterialDescription(**responce.json())
-        except ValidationError: 
-            if responce.status_code == 500 or responce.status_code == 403:
-                return ResponceErrorAlternative(**responce.json())
-            return ResponceError(**{"code": responce.status_code, **responce.json() })
+        return parse_responce(responce, GetMaterialDescription, "getMaterialDescription", self.metrics)
         
+    @coalesced("getMaterialAnalogs")
     def getMaterialAnalogs(self, code: str = None) -> Union[GetMaterialAnalogs, ResponceError, ResponceErrorAlternative]:
         """Get material analogs by material `code` or a complete list of material analogs 
         by materials without specifying material `code`
@@ -274,14 +379,11 @@ class Catalog:
         send_code = ""
         if code: send_code = f'code={code}'
 
-        responce = requests.get(f"{URL_DOMAIN}/catalog/material/analogs?{send_code}", headers=self.headers)
+        responce = self._get("getMaterialAnalogs", f"{self.url_domain}/catalog/material/analogs?{send_code}")
 
-        try: return GetMaterialAnalogs(**responce.json())
-        except ValidationError: 
-            if responce.status_code == 500 or responce.status_code == 403:
-                return ResponceErrorAlternative(**responce.json())
-            return ResponceError(**{"code": responce.status_code, **responce.json() })
+        return parse_responce(responce, GetMaterialAnalogs, "getMaterialAnalogs", self.metrics)
     
+    @coalesced("getMaterialSpecification")
     def getMaterialSpecification(self, code: str = None) -> Union[GetMaterialSpecification, ResponceError, ResponceErrorAlternative]:
         """Get material specification by material `code` or a complete list of material specification 
         by materials without specifying material `code`
@@ -300,10 +402,6 @@ class Catalog:
         send_code = ""
         if code: send_code = f'code={code}'
 
-        responce = requests.get(f"{URL_DOMAIN}/catalog/material/specification?{send_code}", headers=self.headers)
+        responce = self._get("getMaterialSpecification", f"{self.url_domain}/catalog/material/specification?{send_code}")
 
-        try: return GetMaterialSpecification(**responce.json())
-        except ValidationError: 
-            if responce.status_code == 500 or responce.status_code == 403:
-                return ResponceErrorAlternative(**responce.json())
-            return ResponceError(**{"code": responce.status_code, **responce.json() })
\ No newline at end of file
+        return parse_responce(responce, GetMaterialSpecification, "getMaterialSpecification", self.metrics)
\ No newline at end of file
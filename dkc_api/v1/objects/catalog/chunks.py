@@ -0,0 +1,96 @@
+from __future__ import annotations
+from typing import NamedTuple, Optional, Sequence, Union
+from urllib.parse import quote
+
+from dkc_api.v1.models.error import ResponceError, ResponceErrorAlternative
+
+from .models import GetMaterialStock, MaterialStockChunkError
+
+
+# Max length of `code=...` / `id=...` query of one stock request. Longer lists are split to chunks
+MAX_STOCK_QUERY_LENGTH = 2000
+
+
+class StockChunk(NamedTuple):
+    """ Part of `code` or `id` list of one stock request """
+    index: int
+    field: str
+    values: list[str]
+    query: str
+
+
+def _values(value: Union[list[str], str, int]) -> list[str]:
+    if isinstance(value, list): return [str(part).strip() for part in value if str(part).strip()]
+    if isinstance(value, str): return [part.strip() for part in value.split(",") if part.strip()]
+    return []
+
+
+def stock_query(code: Union[list[str], str, int]=[], id: Union[list[str], str, int]=[]) -> str:
+    """ Convert `code` and `id` variables to query string of one stock request (Catalog and AsyncCatalog) """
+    send_code = ""
+    send_id = ""
+
+    if isinstance(code, list) and code != []: send_code = "code=" + ",".join(code)
+    elif isinstance(code, str): send_code = "code=" + code
+    elif isinstance(code, int): send_code = "code=" + str(code)
+
+    if isinstance(id, list) and id != []: send_id = "&id=" + ",".join(id)
+    elif isinstance(id, str): send_id = "&id=" + id
+    elif isinstance(id, int): send_id = "&id=" + str(id)
+
+    return f"{send_code}{send_id}"
+
+
+def split_stock_query(code: Union[list[str], str, int]=[], id: Union[list[str], str, int]=[],
+                      max_query_length: int=MAX_STOCK_QUERY_LENGTH) -> Optional[list[StockChunk]]:
+    """ Split `code` (or `id`, if there is no code) list to chunks with url-encoded query not longer `max_query_length`.
+
+    Returns:
+        Optional[list[StockChunk]]: Chunks or None if list is short and is sent by one request.
+    """
+    field, values = ("code", _values(code)) if _values(code) else ("id", _values(id))
+    # Length of value in url: not ascii letters and spaces are percent-encoded when request is sent
+    lengths = [len(quote(value)) for value in values]
+    if len(field) + 1 + sum(length + 1 for length in lengths) <= max_query_length: return None
+
+    chunks, part, length = [], [], len(field) + 1
+    for value, value_length in zip(values, lengths):
+        if part and length + value_length + 1 > max_query_length:
+            chunks.append(StockChunk(len(chunks), field, part, f"{field}=" + ",".join(part)))
+            part, length = [], len(field) + 1
+        part.append(value)
+        length += value_length + 1
+
+    if part: chunks.append(StockChunk(len(chunks), field, part, f"{field}=" + ",".join(part)))
+    return chunks
+
+
+def stale_stock_chunks(results: Sequence[Union[GetMaterialStock, ResponceError, ResponceErrorAlternative]]) -> list[int]:
+    """ Indexes of chunks how got older revision (`create`) than other chunks, they must be fetched again """
+    creates = [result.create for result in results if not isinstance(result, (ResponceError, ResponceErrorAlternative))]
+    if not creates: return []
+
+    newest = max(creates)
+    return [index for index, result in enumerate(results)
+            if not isinstance(result, (ResponceError, ResponceErrorAlternative)) and result.create < newest]
+
+
+def merge_stock_chunks(chunks: Sequence[StockChunk],
+                       results: Sequence[Union[GetMaterialStock, ResponceError, ResponceErrorAlternative]]
+                       ) -> Union[GetMaterialStock, ResponceError, ResponceErrorAlternative]:
+    """ Merge responces of chunks to one `GetMaterialStock`. `create` is the oldest revision of chunks (so it is
+    the same for all materials if every chunk got one revision), errors of chunks are in `errors`.
+    If every chunk is failed, error of first chunk is returned. """
+    errors = [
+        MaterialStockChunkError(index=chunk.index, field=chunk.field, values=chunk.values, error=result)
+        for chunk, result in zip(chunks, results) if isinstance(result, (ResponceError, ResponceErrorAlternative))
+    ]
+    successes = [result for result in results if not isinstance(result, (ResponceError, ResponceErrorAlternative))]
+    if not successes: return results[0]
+
+    # Chunks are already validated (or built in trusted mode), so merged model is not validated again
+    return GetMaterialStock.construct(
+        create=min(result.create for result in successes),
+        materials=[material for result in successes for material in result.materials],
+        errors=errors,
+    )
\ No newline at end of file
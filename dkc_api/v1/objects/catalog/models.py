@@ -1,7 +1,9 @@
-from typing import Any, Optional
+from typing import Any, Optional, Union
 from pydantic import BaseModel, HttpUrl
 from datetime import datetime
 
+from dkc_api.v1.models.error import ResponceError, ResponceErrorAlternative
+
 
 class WarehouseReceipt(BaseModel):
     date: datetime
@@ -18,9 +20,16 @@ class MaterialStock(BaseModel):
     code: str
     warehouse: list[Warehouse]
 
+class MaterialStockChunkError(BaseModel):
+    index: int
+    field: str
+    values: list[str]
+    error: Union[ResponceError, ResponceErrorAlternative]
+
 class GetMaterialStock(BaseModel):
     create: datetime
     materials: list[MaterialStock] 
+    errors: list[MaterialStockChunkError] = []
 
 
 class Material(BaseModel):
@@ -51,6 +60,12 @@ class Material(BaseModel):
 class GetMaterial(BaseModel):
     material: Material
 
+class GetMaterials(BaseModel):
+    codes: list[str]
+    materials: list[Union[GetMaterial, ResponceError, ResponceErrorAlternative]]
+    elapsed: float
+    throughput: float
+
 
 class MaterialCertificate(BaseModel):
     id: int
@@ -0,0 +1,62 @@
+from __future__ import annotations
+from typing import Iterator, Optional
+from datetime import datetime
+
+from dkc_api.v1.streaming import JsonStreamReader
+
+from .models import MaterialStock
+
+import requests
+from pydantic import parse_obj_as
+
+
+class MaterialStockStream:
+    """ Stream of stock balances. Parse responce body incrementally and yield validated `MaterialStock` one by one """
+
+    def __init__(self, responce: requests.Response, chunk_size: int=65536) -> None:
+        """ Stream of stock balances. Read body of `responce` while `create` is not got and `materials` is not started.
+
+            Args:
+                responce (requests.Response): Responce opened with `stream=True`.
+                chunk_size (int, optional): Size of read chunk in bytes. Defaults to 65536.
+        """
+        self.responce = responce
+        self.create: Optional[datetime] = None
+
+        self._reader = JsonStreamReader(responce.iter_content(chunk_size=chunk_size))
+        self._keys = self._reader.iter_object()
+        self._materials_started = False
+
+        for key in self._keys:
+            if key == "materials":
+                self._materials_started = True
+                break
+            self._read_field(key)
+
+    def _read_field(self, key: str) -> None:
+        """ Read value of not streamed field """
+        value = self._reader.read_value()
+        if key == "create": self.create = parse_obj_as(datetime, value)
+
+    def __iter__(self) -> Iterator[MaterialStock]:
+        """ Yield `MaterialStock` one by one. After last material `create` is available in any case """
+        try:
+            if self._materials_started:
+                self._materials_started = False
+                for item in self._reader.iter_array():
+                    yield MaterialStock(**item)
+
+            for key in self._keys:
+                self._read_field(key)
+        finally:
+            self.close()
+
+    def close(self) -> None:
+        """ Close responce connection """
+        self.responce.close()
+
+    def __enter__(self) -> MaterialStockStream:
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
@@ -0,0 +1,146 @@
+from __future__ import annotations
+from typing import TYPE_CHECKING, Union
+
+from dkc_api.v1.const import URL_DOMAIN
+from dkc_api.v1.async_transport import AsyncTransport
+from dkc_api.v1.metrics import Metrics
+from dkc_api.v1.records import construct, DEFAULT_SAMPLE_RATE
+from dkc_api.v1.models.error import ResponceError
+from dkc_api.v1.responce import parse_responce
+from dkc_api.v1.exceptions.exceptions import NotValidVariables
+from dkc_api.v1.lazy import logger as default_logger
+
+from .models import GetRevisionLastSize, GetRevisionLast, GetRevisionDrawings, GetRevisionCertificates, GetRevisionMaterials, \
+    GetFile, PostFile, PostFileContent
+
+import datetime
+
+if TYPE_CHECKING:
+    import loguru
+
+
+class AsyncContent:
+    """ Asyncio class for interacting with site content. Methods are the same as in `Content` """
+
+    def __init__(self, access_token: str, headers: dict, transport: AsyncTransport, debug: bool=False,
+                 logger: loguru.Logger = default_logger, validation: str = "full", sample_rate: int = DEFAULT_SAMPLE_RATE,
+                 url_domain: str = URL_DOMAIN, metrics: Metrics = None):
+        """ Asyncio class for interacting with site content. Methods are the same as in `Content` """
+        self.access_token = access_token
+        self.headers = headers
+        self.transport = transport
+        self.logger = logger
+        self.debug = debug
+        self.url_domain = url_domain
+        self.validation = validation
+        self.sample_rate = sample_rate
+        self.metrics = metrics if metrics is not None else Metrics()
+
+    def _get_send_last_updated(self, last_updated: datetime.datetime=None) -> str:
+        """ Check and convert `last_updated` variable to query string """
+        send_last_updated = ""
+
+        if last_updated is not None and isinstance(last_updated, datetime.datetime):
+            send_last_updated = f"last_updated={int(last_updated.timestamp())}"
+        elif last_updated is not None and not isinstance(last_updated, datetime.datetime):
+            raise NotValidVariables(f"Variables last_updated not valid datetime class. Getting {type(last_updated)} class.")
+
+        if self.debug: self.logger.debug(f"send_last_updated -> {send_last_updated}")
+        return send_last_updated
+
+    async def getRevisionsLastSize(self, last_updated: datetime.datetime=None) -> Union[GetRevisionLastSize, ResponceError]:
+        """ Async version of `Content.getRevisionsLastSize`. Get data about the size of the update in bytes.
+
+        Example:
+            >>> await dkc_api.Content.getRevisionsLastSize()
+            > getRevisionsLastSize({"size": 67602981, "forced_update": false})
+        """
+        send_last_updated = self._get_send_last_updated(last_updated)
+
+        responce = await self.transport.get(f"{self.url_domain}/revisions/last/size?{send_last_updated}", headers=self.headers)
+
+        return parse_responce(responce, GetRevisionLastSize, "getRevisionsLastSize", self.metrics)
+
+    async def getRevisionsLast(self, last_updated: datetime.datetime=None) -> Union[GetRevisionLast, ResponceError]:
+        """ Async version of `Content.getRevisionsLast`. A complete data upload or delta of changes.
+
+        Example:
+            >>> await dkc_api.Content.getRevisionsLast()
+            > GetRevisionLast(revision={delta=false, countries={updated=[{...}], removed=[{...}]}, ...})
+        """
+        send_last_updated = self._get_send_last_updated(last_updated)
+
+        responce = await self.transport.get(f"{self.url_domain}/revisions/last?{send_last_updated}", headers=self.headers)
+
+        return parse_responce(responce, GetRevisionLast, "getRevisionsLast", self.metrics,
+                              build=lambda data: construct(GetRevisionLast, data, self.validation, self.sample_rate))
+
+    async def getRevisionDrawings(self, last_updated: datetime.datetime=None) -> Union[GetRevisionDrawings, ResponceError]:
+        """ Async version of `Content.getRevisionDrawings`.
+
+        Example:
+            >>> await dkc_api.Content.getRevisionDrawings()
+            > GetRevisionDrawings(revision={delta=false, drawings={updated=[{...}], removed=[{...}]}})
+        """
+        send_last_updated = self._get_send_last_updated(last_updated)
+
+        responce = await self.transport.get(f"{self.url_domain}/revisions/drawings?{send_last_updated}", headers=self.headers)
+
+        return parse_responce(responce, GetRevisionDrawings, "getRevisionDrawings", self.metrics)
+
+    async def getRevisionCertificates(self, last_updated: datetime.datetime=None) -> Union[GetRevisionCertificates, ResponceError]:
+        """ Async version of `Content.getRevisionCertificates`.
+
+        Example:
+            >>> await dkc_api.Content.getRevisionCertificates()
+            > GetRevisionCertificates(revision={delta=false, certificates={updated=[{...}], removed=[{...}]}})
+        """
+        send_last_updated = self._get_send_last_updated(last_updated)
+
+        responce = await self.transport.get(f"{self.url_domain}/revisions/certificates?{send_last_updated}", headers=self.headers)
+
+        return parse_responce(responce, GetRevisionCertificates, "getRevisionCertificates", self.metrics)
+
+    async def getRevisionMaterials(self, last_updated: datetime.datetime=None) -> Union[GetRevisionMaterials, ResponceError]:
+        """ Async version of `Content.getRevisionMaterials`.
+
+        Example:
+            >>> await dkc_api.Content.getRevisionMaterials()
+            > GetRevisionMaterials(revision={delta=false, materials={updated=[{...}], removed=[{...}]}})
+        """
+        send_last_updated = self._get_send_last_updated(last_updated)
+
+        responce = await self.transport.get(f"{self.url_domain}/revisions/materials?{send_last_updated}", headers=self.headers)
+
+        return parse_responce(responce, GetRevisionMaterials, "getRevisionMaterials", self.metrics,
+                              build=lambda data: construct(GetRevisionMaterials, data, self.validation, self.sample_rate))
+
+    async def getFile(self, file_id: int) -> Union[GetFile, ResponceError]:
+        """ Async version of `Content.getFile`. Method for getting files via API.
+
+        Example:
+            >>> await dkc_api.Content.getFile(file_id=1)
+            > getFile({name="Спецификация.txt", content="MUAyODExMjAxOUBAMzYwNTA1QDEwQNCo0KJADQoyQDI4MTEyM..."})
+        """
+
+        if not isinstance(file_id, int):
+            raise NotValidVariables(f"Variables id not valid int class. Getting {type(file_id)} class.")
+
+        responce = await self.transport.get(f"{self.url_domain}/file?id={file_id}", headers=self.headers)
+
+        return parse_responce(responce, GetFile, "getFile", self.metrics)
+
+    async def postFile(self, file_content: PostFileContent) -> Union[PostFile, ResponceError]:
+        """ Async version of `Content.postFile`. Method for upload files via API.
+
+        Example:
+            >>> await dkc_api.Content.postFile(PostFileContent(name="file_with_key.txt", value="8-khkjgj7hgJHGJHG97jhHKJ"))
+            > PostFile({id=889})
+        """
+
+        if not isinstance(file_content, PostFileContent):
+            raise NotValidVariables(f"Variables file_content not valid PostFileContent class. Getting {type(file_content)} class.")
+
+        responce = await self.transport.post(f"{self.url_domain}/file", data=file_content.dict(), headers=self.headers)
+
+        return parse_responce(responce, PostFile, "postFile", self.metrics)
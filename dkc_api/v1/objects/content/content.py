@@ -1,31 +1,48 @@
 from __future__ import annotations
-from typing import Union
+from typing import TYPE_CHECKING, BinaryIO, Optional, Union
 
 from dkc_api.v1.const import URL_DOMAIN
+from dkc_api.v1.transport import Transport
+from dkc_api.v1.metrics import Metrics
+from dkc_api.v1.coalesce import Coalescer, coalesced
+from dkc_api.v1.responce import parse_responce, parse_error, MeteredStream
+from dkc_api.v1.records import construct, DEFAULT_SAMPLE_RATE
 from dkc_api.v1.models.error import ResponceError, ResponceErrorAlternative
 from dkc_api.v1.exceptions.exceptions import NotValidVariables
+from dkc_api.v1.lazy import logger as default_logger
 
 from .models import GetRevisionLastSize, GetRevisionLast, GetRevisionDrawings, GetRevisionCertificates, GetRevisionMaterials, \
-    GetFile, PostFile, PostFileContent
-
-import loguru
-import requests
+    GetFile, GetFileDownload, PostFile, PostFileContent
+from .stream import RevisionLastStream, Base64FormBody, write_file_stream
 
+import os
 import datetime
 
-from pydantic.error_wrappers import ValidationError
+if TYPE_CHECKING:
+    import loguru
 
 
 class Content:
     """ Class for interacting with available operations for working with site news """
     
-    def __init__(self, access_token: str, headers: dict, debug: bool=False, logger: loguru.Logger = loguru.logger):
-        """ Class for interacting with available operations for working with site news """
+    def __init__(self, access_token: str, headers: dict, debug: bool=False, logger: loguru.Logger = default_logger,
+                 transport: Transport = None, validation: str = "full", sample_rate: int = DEFAULT_SAMPLE_RATE,
+                 url_domain: str = URL_DOMAIN, metrics: Metrics = None,
+                 coalescer: Coalescer = None):
+        """ Class for interacting with available operations for working with site news. `validation` is mode of building
+        `getRevisionsLast` and `getRevisionMaterials` responces ("full", "trusted", "sampled"), see `dkc_api.v1.records`. """
         self.access_token = access_token
         self.headers = headers
         self.logger = logger
         self.debug = debug
+        self.url_domain = url_domain
+        self.metrics = metrics if metrics is not None else Metrics()
+        self.transport = transport if transport is not None else Transport()
+        self.coalescer = coalescer
+        self.validation = validation
+        self.sample_rate = sample_rate
         
+    @coalesced("getRevisionsLastSize")
     def getRevisionsLastSize(self, last_updated: datetime.datetime=None) -> Union[GetRevisionLastSize, ResponceError]:
         """ Get data about the size of the update in bytes. If 0 - there are no updates hour.
 
@@ -51,14 +68,11 @@ class Content:
         
         if self.debug: self.logger.debug(f"send_last_updated -> {send_last_updated}")
 
-        responce = requests.get(f"{URL_DOMAIN}/revisions/last/size?{send_last_updated}", headers=self.headers)
+        responce = self.transport.get(f"{self.url_domain}/revisions/last/size?{send_last_updated}", headers=self.headers)
 
-        try: return GetRevisionLastSize(**responce.json())
-        except ValidationError: 
-            if responce.status_code == 500 or responce.status_code == 403:
-                return ResponceErrorAlternative(**responce.json())
-            return ResponceError(**{"code": responce.status_code, **responce.json() })
+        return parse_responce(responce, GetRevisionLastSize, "getRevisionsLastSize", self.metrics)
         
+    @coalesced("getRevisionsLast")
     def getRevisionsLast(self, last_updated: datetime.datetime=None) -> Union[GetRevisionLast, ResponceError]:
         """ An array containing a complete data upload or delta of changes, if the last_updated parameter is specified.
 
@@ -81,14 +95,48 @@ class Content:
         
         if self.debug: self.logger.debug(f"send_last_updated -> {send_last_updated}")
 
-        responce = requests.get(f"{URL_DOMAIN}/revisions/last?{send_last_updated}", headers=self.headers)
+        responce = self.transport.get(f"{self.url_domain}/revisions/last?{send_last_updated}", headers=self.headers)
         
-        try: return GetRevisionLast(**responce.json())
-        except ValidationError: 
-            if responce.status_code == 500 or responce.status_code == 403:
-                return ResponceErrorAlternative(**responce.json())
-            return ResponceError(**{"code": responce.status_code, **responce.json() })
+        return parse_responce(responce, GetRevisionLast, "getRevisionsLast", self.metrics,
+                              build=lambda data: construct(GetRevisionLast, data, self.validation, self.sample_rate))
+
+    def getRevisionsLastStream(self, last_updated: datetime.datetime=None, 
+                               chunk_size: int=65536) -> Union[RevisionLastStream, ResponceError, ResponceErrorAlternative]:
+        """ Streaming version of `getRevisionsLast`. Body is parsed incrementally and items are yielded section by section 
+        (countries, cities, nodes, products, ...) as they arrive, so full upload is never held in memory.
+
+        Args:
+            last_updated (datetime, optional): if specified, only processes changes from the specified date. Timestamp format.
+            chunk_size (int, optional): Size of read chunk in bytes. Defaults to 65536.
+
+        Returns:
+            Union[RevisionLastStream, ResponceError, ResponceErrorAlternative]: Return stream of `RevisionLastItem` 
+            with `delta` attribute.
+
+        Example:
+            >>> with dkc_api.Content.getRevisionsLastStream() as stream:
+            >>>     for item in stream: ...
+            > RevisionLastItem(section='products', kind='updated', value=RevisionLastNodesProducts(id='1052191', ...))
+            > RevisionLastItem(section='products', kind='removed', value='1052190')
+        """
+        send_last_updated = ""
 
+        if last_updated is not None and isinstance(last_updated, datetime.datetime):
+            send_last_updated = f"last_updated={int(last_updated.timestamp())}"
+        elif last_updated is not None and not isinstance(last_updated, datetime.datetime):
+            raise NotValidVariables(f"Variables last_updated not valid datetime class. Getting {type(last_updated)} class.")
+        
+        if self.debug: self.logger.debug(f"send_last_updated -> {send_last_updated}")
+
+        responce = self.transport.get(f"{self.url_domain}/revisions/last?{send_last_updated}", headers=self.headers, stream=True)
+
+        if responce.status_code == 200:
+            return RevisionLastStream(MeteredStream(responce, "getRevisionsLastStream", self.metrics), chunk_size=chunk_size)
+
+        try: return parse_error(responce, "getRevisionsLastStream", self.metrics)
+        finally: responce.close()
+
+    @coalesced("getRevisionDrawings")
     def getRevisionDrawings(self, last_updated: datetime.datetime=None) -> Union[GetRevisionDrawings, ResponceError]:
         """ An array containing the complete data upload or delta of changes, if the last_updated by drawings parameter is specified.
 
@@ -111,14 +159,11 @@ class Content:
         
         if self.debug: self.logger.debug(f"send_last_updated -> {send_last_updated}")
 
-        responce = requests.get(f"{URL_DOMAIN}/revisions/drawings?{send_last_updated}", headers=self.headers)
+        responce = self.transport.get(f"{self.url_domain}/revisions/drawings?{send_last_updated}", headers=self.headers)
         
-        try: return GetRevisionDrawings(**responce.json())
-        except ValidationError: 
-            if responce.status_code == 500 or responce.status_code == 403:
-                return ResponceErrorAlternative(**responce.json())
-            return ResponceError(**{"code": responce.status_code, **responce.json() })
+        return parse_responce(responce, GetRevisionDrawings, "getRevisionDrawings", self.metrics)
         
+    @coalesced("getRevisionCertificates")
     def getRevisionCertificates(self, last_updated: datetime.datetime=None) -> Union[GetRevisionCertificates, ResponceError]:
         """ An array containing the complete data upload or delta of changes, if the last_updated by drawings parameter is specified.
 
@@ -141,14 +186,11 @@ class Content:
         
         if self.debug: self.logger.debug(f"send_last_updated -> {send_last_updated}")
 
-        responce = requests.get(f"{URL_DOMAIN}/revisions/certificates?{send_last_updated}", headers=self.headers)
+        responce = self.transport.get(f"{self.url_domain}/revisions/certificates?{send_last_updated}", headers=self.headers)
         
-        try: return GetRevisionCertificates(**responce.json())
-        except ValidationError: 
-            if responce.status_code == 500 or responce.status_code == 403:
-                return ResponceErrorAlternative(**responce.json())
-            return ResponceError(**{"code": responce.status_code, **responce.json() })
+        return parse_responce(responce, GetRevisionCertificates, "getRevisionCertificates", self.metrics)
         
+    @coalesced("getRevisionMaterials")
     def getRevisionMaterials(self, last_updated: datetime.datetime=None) -> Union[GetRevisionMaterials, ResponceError]:
         """ An array containing the complete data upload or delta of changes, if the last_updated by drawings parameter is specified.
 
@@ -171,46 +213,58 @@ class Content:
         
         if self.debug: self.logger.debug(f"send_last_updated -> {send_last_updated}")
 
-        responce = requests.get(f"{URL_DOMAIN}/revisions/materials?{send_last_updated}", headers=self.headers)
-        
-        self.logger.debug(responce.json())
+        responce = self.transport.get(f"{self.url_domain}/revisions/materials?{send_last_updated}", headers=self.headers)
         
-        try: return GetRevisionMaterials(**responce.json())
-        except ValidationError: 
-            if responce.status_code == 500 or responce.status_code == 403:
-                return ResponceErrorAlternative(**responce.json())
-            return ResponceError(**{"code": responce.status_code, **responce.json() })
+        return parse_responce(responce, GetRevisionMaterials, "getRevisionMaterials", self.metrics,
+                              build=lambda data: construct(GetRevisionMaterials, data, self.validation, self.sample_rate))
         
-    def getFile(self, file_id: int) -> Union[GetFile, ResponceError]:
-        """ Method for getting files via API
+    @coalesced("getFile", side_effects=("target",))
+    def getFile(self, file_id: int, target: Union[str, os.PathLike, BinaryIO, None]=None,
+                chunk_size: int=65536) -> Union[GetFile, GetFileDownload, ResponceError, ResponceErrorAlternative]:
+        """ Method for getting files via API. If `target` (path or writable binary file object) is set, responce is
+        read by chunks and base64 content is decoded straight to `target`, so memory does not depend on size of file.
 
         Args:
             file_id (int): id file.
+            target (str, os.PathLike, BinaryIO, optional): Path or file object for write content. Defaults to None 
+                (content is returned in `GetFile`).
+            chunk_size (int, optional): Size of read chunk in bytes. Defaults to 65536.
 
         Returns:
-            Union[GetFile, ResponceError]: Return file name and content.
+            Union[GetFile, GetFileDownload, ResponceError, ResponceErrorAlternative]: Return file name and content,
+            or file name and size of written content if `target` is set.
             
         Example:
             >>> dkc_api.Content.getFile(id=1)
             > getFile({name="Спецификация.txt", content="MUAyODExMjAxOUBAMzYwNTA1QDEwQNCo0KJADQoyQDI4MTEyM..."})
+            
+            >>> dkc_api.Content.getFile(file_id=1, target="/tmp/specification.txt")
+            > GetFileDownload(name='Спецификация.txt', size=352616483, path='/tmp/specification.txt')
         """
 
         if not isinstance(file_id, int):
             raise NotValidVariables(f"Variables id not valid int class. Getting {type(file_id)} class.")
         
-        responce = requests.get(f"{URL_DOMAIN}/file?id={file_id}", headers=self.headers)
-        
-        try: return GetFile(**responce.json())
-        except ValidationError: 
-            if responce.status_code == 500 or responce.status_code == 403:
-                return ResponceErrorAlternative(**responce.json())
-            return ResponceError(**{"code": responce.status_code, **responce.json() })
+        if target is None:
+            responce = self.transport.get(f"{self.url_domain}/file?id={file_id}", headers=self.headers)
+            return parse_responce(responce, GetFile, "getFile", self.metrics)
+
+        responce = self.transport.get(f"{self.url_domain}/file?id={file_id}", headers=self.headers, stream=True)
+        if responce.status_code == 200:
+            return write_file_stream(MeteredStream(responce, "getFile", self.metrics), target, chunk_size=chunk_size)
+
+        try: return parse_error(responce, "getFile", self.metrics)
+        finally: responce.close()
         
-    def postFile(self, file_content: PostFileContent) -> Union[PostFile, ResponceError]:
-        """ Method for getting files via API
+    def postFile(self, file_content: Union[PostFileContent, str, os.PathLike, BinaryIO], name: Optional[str]=None,
+                 chunk_size: int=65536) -> Union[PostFile, ResponceError]:
+        """ Method for getting files via API. File on path or binary file object is read by chunks and encoded to
+        base64 while it is sent, so memory does not depend on size of file.
 
         Args:
-            file_content (PostFileContent): file content.
+            file_content (PostFileContent, str, os.PathLike, BinaryIO): file content, path to file or file object.
+            name (str, optional): Name of file on path or file object. Defaults to None (base name of file).
+            chunk_size (int, optional): Size of read chunk in bytes. Defaults to 65536.
 
         Returns:
             Union[PostFile, ResponceError]: Return file name id.
@@ -218,15 +272,28 @@ class Content:
         Example:
             >>> dkc_api.Content.PostFile(PostFileContent={name="file_with_key.txt", value="8-khkjgj7hgJHGJHG97jhHKJ"})
             > PostFile({id=889})
+            
+            >>> dkc_api.Content.postFile("/tmp/specification.txt")
+            > PostFile({id=890})
         """
 
-        if not isinstance(file_content, PostFileContent):
-            raise NotValidVariables(f"Variables file_content not valid PostFileContent class. Getting {type(file_content)} class.")
-        
-        responce = requests.post(f"{URL_DOMAIN}/file", data=file_content.dict(), headers=self.headers)
+        if isinstance(file_content, PostFileContent):
+            responce = self.transport.post(f"{self.url_domain}/file", data=file_content.dict(), headers=self.headers)
+            return parse_responce(responce, PostFile, "postFile", self.metrics)
+
+        if not isinstance(file_content, (str, os.PathLike)) and not hasattr(file_content, "read"):
+            raise NotValidVariables(f"Variables file_content not valid PostFileContent class, path or file object. Getting {type(file_content)} class.")
+
+        if name is None:
+            source = file_content if isinstance(file_content, (str, os.PathLike)) else getattr(file_content, "name", "")
+            name = os.path.basename(os.fspath(source)) if isinstance(source, (str, os.PathLike)) else ""
+        if not name:
+            raise NotValidVariables("Name of file object is not known, send it to 'name' variable.")
+
+        responce = self.transport.post(
+            f"{self.url_domain}/file",
+            data=Base64FormBody(name, file_content, chunk_size=chunk_size),
+            headers={ **self.headers, "Content-Type": "application/x-www-form-urlencoded" }
+        )
         
-        try: return PostFile(**responce.json())
-        except ValidationError: 
-            if responce.status_code == 500 or responce.status_code == 403:
-                return ResponceErrorAlternative(**responce.json())
-            return ResponceError(**{"code": responce.status_code, **responce.json() })
\ No newline at end of file
+        return parse_responce(responce, PostFile, "postFile", self.metrics)
\ No newline at end of file
@@ -231,6 +231,11 @@ class GetFile(BaseModel):
     name: str
     value: str
 
+class GetFileDownload(BaseModel):
+    name: str
+    size: int
+    path: Optional[str]
+
 
 class PostFile(BaseModel):
     id: int
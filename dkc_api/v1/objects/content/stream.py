@@ -0,0 +1,183 @@
+from __future__ import annotations
+from typing import BinaryIO, Iterator, NamedTuple, Optional, Union
+from json import JSONDecodeError
+from urllib.parse import quote_plus
+
+from dkc_api.v1.streaming import JsonStreamReader, iter_base64_decode
+
+from .models import RevisionLastCountriesUpdated, RevisionLastCitiesUpdated, RevisionLastNodesUpdated, \
+    RevisionLastNodesProducts, RevisionLastCataloguesUpdates, RevisionLastBookletsUpdates, RevisionLastCertificatesUpdates, \
+    RevisionLastInstructionsUpdates, RevisionLastSalepointsUpdates, GetFileDownload
+
+import os
+import base64
+
+import requests
+from pydantic import BaseModel
+
+
+REVISION_LAST_SECTIONS: dict[str, type[BaseModel]] = {
+    "countries": RevisionLastCountriesUpdated,
+    "cities": RevisionLastCitiesUpdated,
+    "nodes": RevisionLastNodesUpdated,
+    "products": RevisionLastNodesProducts,
+    "catalogues": RevisionLastCataloguesUpdates,
+    "booklets": RevisionLastBookletsUpdates,
+    "certificates": RevisionLastCertificatesUpdates,
+    "instructions": RevisionLastInstructionsUpdates,
+    "salepoints": RevisionLastSalepointsUpdates,
+}
+
+
+class RevisionLastItem(NamedTuple):
+    """ One item of revision. `kind` is "updated" (value is section model) or "removed" (value is removed id) """
+    section: str
+    kind: str
+    value: Union[BaseModel, str]
+
+
+class RevisionLastStream:
+    """ Stream of full revision upload. Parse responce body incrementally and yield items section by section.
+    `delta` is None while it is not read: if it follows sections in body, it is known only after items of them """
+
+    def __init__(self, responce: requests.Response, chunk_size: int=65536) -> None:
+        """ Stream of full revision upload. Read body of `responce` while first item is not got.
+
+            Args:
+                responce (requests.Response): Responce opened with `stream=True`.
+                chunk_size (int, optional): Size of read chunk in bytes. Defaults to 65536.
+        """
+        self.responce = responce
+        self.delta: Optional[bool] = None
+
+        self._reader = JsonStreamReader(responce.iter_content(chunk_size=chunk_size))
+        self._items = self._iter_items()
+        self._first = next(self._items, None)
+
+    def _iter_items(self) -> Iterator[RevisionLastItem]:
+        """ Walk over revision object and yield items of known sections """
+        reader = self._reader
+
+        for key in reader.iter_object():
+            if key != "revision":
+                reader.read_value()
+                continue
+
+            for section in reader.iter_object():
+                model = REVISION_LAST_SECTIONS.get(section)
+
+                if section == "delta":
+                    self.delta = reader.read_value()
+                elif model is None:
+                    reader.read_value()
+                else:
+                    for kind in reader.iter_object():
+                        if kind == "updated":
+                            for item in reader.iter_array(): yield RevisionLastItem(section, kind, model(**item))
+                        elif kind == "removed":
+                            for item in reader.iter_array(): yield RevisionLastItem(section, kind, str(item))
+                        else:
+                            reader.read_value()
+
+    def __iter__(self) -> Iterator[RevisionLastItem]:
+        """ Yield `RevisionLastItem` one by one in order of responce body """
+        try:
+            if self._first is not None:
+                first, self._first = self._first, None
+                yield first
+
+            yield from self._items
+        finally:
+            self.close()
+
+    def close(self) -> None:
+        """ Close responce connection """
+        self.responce.close()
+
+    def __enter__(self) -> RevisionLastStream:
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
+
+
+def write_file_stream(responce: requests.Response, target: Union[str, os.PathLike, BinaryIO],
+                      chunk_size: int=65536) -> GetFileDownload:
+    """ Decode base64 `value` of `/file` responce opened with `stream=True` part by part and write it to `target`.
+    File on path is written to `<path>.part` and renamed after full body is read, so broken download does
+    not leave half of file on `target` path.
+
+    Raises:
+        JSONDecodeError: If body is not valid json or has no `value`.
+    """
+    path = os.fspath(target) if isinstance(target, (str, os.PathLike)) else None
+    file: BinaryIO = open(f"{path}.part", "wb") if path is not None else target
+
+    name, size = None, None
+    try:
+        reader = JsonStreamReader(responce.iter_content(chunk_size=chunk_size))
+        for key in reader.iter_object():
+            if key == "value":
+                size = 0
+                for data in iter_base64_decode(reader.iter_string()):
+                    file.write(data)
+                    size += len(data)
+            elif key == "name":
+                name = reader.read_value()
+            else:
+                reader.read_value()
+
+        if size is None: raise JSONDecodeError("Responce has no 'value'", "", 0)
+    except BaseException:
+        if path is not None:
+            file.close()
+            os.remove(f"{path}.part")
+        raise
+    finally:
+        responce.close()
+
+    if path is not None:
+        file.close()
+        os.replace(f"{path}.part", path)
+
+    return GetFileDownload(name=name or "", size=size, path=path)
+
+
+class Base64FormBody:
+    """ Form body `name=...&value=<base64 of file>` how is encoded while it is sent. Body can be iterated again
+    (file on path is opened again, file object is seeked back), so request can be repeated """
+
+    def __init__(self, name: str, source: Union[str, os.PathLike, BinaryIO], chunk_size: int=65536) -> None:
+        self.name = name
+        self.source = source
+        # Size of read part is multiple of 3, so base64 of parts can be joined without padding inside
+        self.chunk_size = max(chunk_size - chunk_size % 3, 3)
+        self._start = source.tell() if not isinstance(source, (str, os.PathLike)) and source.seekable() else None
+        self._iterated = False
+
+    def __iter__(self) -> Iterator[bytes]:
+        if isinstance(self.source, (str, os.PathLike)):
+            with open(self.source, "rb") as file: yield from self._encode(file)
+            return
+
+        if self._iterated:
+            if self._start is None: raise ValueError("Not seekable file object can be sent only once")
+            self.source.seek(self._start)
+        self._iterated = True
+        yield from self._encode(self.source)
+
+    def _encode(self, file: BinaryIO) -> Iterator[bytes]:
+        yield f"name={quote_plus(self.name)}&value=".encode("ascii")
+
+        rest = b""
+        while True:
+            data = file.read(self.chunk_size)
+            if not data: break
+
+            # Read can return less than asked (pipe, socket), rest of not multiple of 3 is encoded with next part
+            data = rest + data
+            size = len(data) - len(data) % 3
+            rest = data[size:]
+            if size: yield quote_plus(base64.b64encode(data[:size])).encode("ascii")
+
+        if rest: yield quote_plus(base64.b64encode(rest)).encode("ascii")
\ No newline at end of file
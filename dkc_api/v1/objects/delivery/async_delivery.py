@@ -0,0 +1,85 @@
+from __future__ import annotations
+from typing import TYPE_CHECKING, Union
+from urllib.parse import urlencode
+
+from dkc_api.v1.const import URL_DOMAIN
+from dkc_api.v1.async_transport import AsyncTransport
+from dkc_api.v1.metrics import Metrics
+from dkc_api.v1.models.error import ResponceError, ResponceErrorAlternative
+from dkc_api.v1.responce import parse_responce
+from dkc_api.v1.exceptions.exceptions import NotValidVariables
+from dkc_api.v1.lazy import logger as default_logger
+
+from .models import DeliveryTimeContent, GetDeliveryTime
+from .quotes import QuoteCache, QuoteBatch
+
+from json import JSONDecodeError
+
+import asyncio
+
+import httpx
+from pydantic.error_wrappers import ValidationError
+
+if TYPE_CHECKING:
+    import loguru
+
+
+class AsyncDelivery:
+    """ Asyncio class for interacting with the delivery unit. Methods are the same as in `Delivery` """
+
+    def __init__(self, access_token: str, headers: dict, transport: AsyncTransport, debug: bool=False,
+                 logger: loguru.Logger = default_logger, url_domain: str = URL_DOMAIN, quote_cache: QuoteCache = None,
+                 metrics: Metrics = None):
+        """ Asyncio class for interacting with the delivery unit. Methods are the same as in `Delivery` """
+        self.access_token = access_token
+        self.headers = headers
+        self.transport = transport
+        self.logger = logger
+        self.debug = debug
+        self.url_domain = url_domain
+        self.quote_cache = quote_cache if quote_cache is not None else QuoteCache()
+        self.metrics = metrics if metrics is not None else Metrics()
+
+    async def getDeliveryTime(self, delivery_time_content: DeliveryTimeContent) -> Union[GetDeliveryTime, ResponceError]:
+        """ Async version of `Delivery.getDeliveryTime`. An array containing the shipping dates.
+
+        Example:
+            >>> await dkc_api.Delivery.getDeliveryTime(DeliveryTimeContent(company_warehouse="test", items=[]))
+            > GetDeliveryTime(items=[...])
+        """
+
+        if not isinstance(delivery_time_content, DeliveryTimeContent):
+            raise NotValidVariables(f"Variables delivery_time_content not valid DeliveryTimeContent class. Getting {type(delivery_time_content)} class")
+
+        # Form encoded the same way as `requests` does it for the sync `Delivery`
+        responce = await self.transport.post(
+            f"{self.url_domain}/delivery/time",
+            content=urlencode(delivery_time_content.dict(), doseq=True),
+            headers={ **self.headers, "Content-Type": "application/x-www-form-urlencoded" }
+        )
+
+        return parse_responce(responce, GetDeliveryTime, "getDeliveryTime", self.metrics)
+
+    async def getDeliveryTimeBatch(self, delivery_time_content: DeliveryTimeContent,
+                                   chunk_size: int=50) -> Union[GetDeliveryTime, ResponceError, ResponceErrorAlternative]:
+        """ Async version of `Delivery.getDeliveryTimeBatch`. Chunks are sent concurrently, count of requests
+        in flight is bounded by `max_concurrency` of transport.
+
+        Example:
+            >>> await dkc_api.Delivery.getDeliveryTimeBatch(DeliveryTimeContent(company_warehouse="1100", items=[*500 items*]))
+            > GetDeliveryTime(items=[DeliveryTime(code=1200, status=True, ...), ...], errors=[])
+        """
+
+        if not isinstance(delivery_time_content, DeliveryTimeContent):
+            raise NotValidVariables(f"Variables delivery_time_content not valid DeliveryTimeContent class. Getting {type(delivery_time_content)} class")
+
+        batch = QuoteBatch(delivery_time_content, self.quote_cache, chunk_size)
+        results = await asyncio.gather(*(self._getDeliveryTimeSafe(content) for content in batch.contents()))
+
+        return batch.merge(results)
+
+    async def _getDeliveryTimeSafe(self, delivery_time_content: DeliveryTimeContent) -> Union[GetDeliveryTime, ResponceError, ResponceErrorAlternative]:
+        """ Call `getDeliveryTime` and convert network error to ResponceError, for not abort other chunks """
+        try: return await self.getDeliveryTime(delivery_time_content)
+        except (httpx.HTTPError, ValidationError, JSONDecodeError) as e:
+            return ResponceError(code=0, message=f"{type(e).__name__}: {e}")
\ No newline at end of file
@@ -1,27 +1,43 @@
 from __future__ import annotations
-from typing import Union
+from typing import TYPE_CHECKING, Union
 
 from dkc_api.v1.const import URL_DOMAIN
+from dkc_api.v1.transport import Transport
+from dkc_api.v1.metrics import Metrics
+from dkc_api.v1.responce import parse_responce
 from dkc_api.v1.models.error import ResponceError, ResponceErrorAlternative
 from dkc_api.v1.exceptions.exceptions import NotValidVariables
+from dkc_api.v1.lazy import logger as default_logger
 
 from .models import DeliveryTimeContent, GetDeliveryTime
+from .quotes import QuoteCache, QuoteBatch
 
-import loguru
-import requests
+from concurrent.futures import ThreadPoolExecutor
+from json import JSONDecodeError
 
+import requests
 from pydantic.error_wrappers import ValidationError
 
+if TYPE_CHECKING:
+    import loguru
+
 
 class Delivery:
     """ Class for interacting with the delivery unit """
     
-    def __init__(self, access_token: str, headers: dict, debug: bool=False, logger: loguru.Logger = loguru.logger):
-        """ Class for interacting with the delivery unit """
+    def __init__(self, access_token: str, headers: dict, debug: bool=False, logger: loguru.Logger = default_logger,
+                 transport: Transport = None, url_domain: str = URL_DOMAIN, metrics: Metrics = None,
+                 quote_cache: QuoteCache = None):
+        """ Class for interacting with the delivery unit. Quotes of `getDeliveryTimeBatch` are cached in `quote_cache`
+        (60 seconds by default) """
         self.access_token = access_token
         self.headers = headers
         self.logger = logger
         self.debug = debug
+        self.url_domain = url_domain
+        self.metrics = metrics if metrics is not None else Metrics()
+        self.transport = transport if transport is not None else Transport()
+        self.quote_cache = quote_cache if quote_cache is not None else QuoteCache()
 
     def getDeliveryTime(self, delivery_time_content: DeliveryTimeContent) -> Union[GetDeliveryTime, ResponceError]:
         """An array containing the shipping dates. If the warehouse is absent or is not 
@@ -41,10 +57,44 @@ class Delivery:
         if not isinstance(delivery_time_content, DeliveryTimeContent): 
             raise NotValidVariables(f"Variables delivery_time_content not valid DeliveryTimeContent class. Getting {type(delivery_time_content)} class")
         
-        responce = requests.post(f"{URL_DOMAIN}/delivery/time", data=delivery_time_content.dict(), headers=self.headers)
+        responce = self.transport.post(f"{self.url_domain}/delivery/time", data=delivery_time_content.dict(), headers=self.headers)
+
+        return parse_responce(responce, GetDeliveryTime, "getDeliveryTime", self.metrics)
+
+    def getDeliveryTimeBatch(self, delivery_time_content: DeliveryTimeContent, chunk_size: int=50,
+                             workers: int=4) -> Union[GetDeliveryTime, ResponceError, ResponceErrorAlternative]:
+        """Shipping dates for large order. Quotes of items are taken from `quote_cache`, other items (every
+        (code, count, warehouse_id) once) are split to chunks of `chunk_size` items and sent in parallel by `workers` threads.
+
+        Args:
+            delivery_time_content (DeliveryTimeContent): delivery time content. Work how filter.
+            chunk_size (int, optional): Count of items in one request. Defaults to 50.
+            workers (int, optional): Count of parallel requests. Defaults to 4.
+
+        Returns:
+            Union[GetDeliveryTime, ResponceError, ResponceErrorAlternative]: Return quote of every item in order of items, 
+            errors of chunks are in `errors`.
+            
+        Example:
+            >>> dkc_api.Delivery.getDeliveryTimeBatch(DeliveryTimeContent(company_warehouse="1100", items=[*500 items*]))
+            > GetDeliveryTime(items=[DeliveryTime(code=1200, status=True, ...), ...], errors=[])
+        """
+
+        if not isinstance(delivery_time_content, DeliveryTimeContent): 
+            raise NotValidVariables(f"Variables delivery_time_content not valid DeliveryTimeContent class. Getting {type(delivery_time_content)} class")
+
+        batch = QuoteBatch(delivery_time_content, self.quote_cache, chunk_size)
+        if self.debug: 
+            self.logger.debug(f"getDeliveryTimeBatch -> {len(batch.quotes)} quotes from cache, {len(batch.chunks)} chunks")
+        if not batch.chunks: return batch.merge([])
+
+        with ThreadPoolExecutor(max_workers=max(min(workers, len(batch.chunks)), 1)) as executor:
+            results = list(executor.map(self._getDeliveryTimeSafe, batch.contents()))
+
+        return batch.merge(results)
 
-        try: return GetDeliveryTime(**responce.json())
-        except ValidationError: 
-            if responce.status_code == 500 or responce.status_code == 403:
-                return ResponceErrorAlternative(**responce.json())
-            return ResponceError(**{"code": responce.status_code, **responce.json() })
+    def _getDeliveryTimeSafe(self, delivery_time_content: DeliveryTimeContent) -> Union[GetDeliveryTime, ResponceError, ResponceErrorAlternative]:
+        """ Call `getDeliveryTime` and convert network error to ResponceError, for not abort other chunks """
+        try: return self.getDeliveryTime(delivery_time_content)
+        except (requests.RequestException, ValidationError, JSONDecodeError) as e:
+            return ResponceError(code=0, message=f"{type(e).__name__}: {e}")
@@ -1,7 +1,10 @@
 
+from typing import Union
 from datetime import datetime
 from pydantic.main import BaseModel
 
+from dkc_api.v1.models.error import ResponceError, ResponceErrorAlternative
+
 
 class DeliveryTimeContentItem(BaseModel):
     code: int
@@ -27,5 +30,17 @@ class DeliveryTime(BaseModel):
     date_last: DeliveryTimeDateLast
     date_detail: list[DeliveryTimeDateDetail]
 
+class DeliveryTimeChunkError(BaseModel):
+    index: int
+    items: list[DeliveryTimeContentItem]
+    error: Union[ResponceError, ResponceErrorAlternative]
+
 class GetDeliveryTime(BaseModel):
-    items: list[DeliveryTime]
\ No newline at end of file
+    items: list[DeliveryTime]
+    errors: list[DeliveryTimeChunkError] = []
+
+
+class QuoteCacheStats(BaseModel):
+    hits: int
+    misses: int
+    entries: int
\ No newline at end of file
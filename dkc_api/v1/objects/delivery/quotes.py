@@ -0,0 +1,137 @@
+from __future__ import annotations
+from typing import Optional, Sequence, Union
+from collections import Counter, OrderedDict
+
+from dkc_api.v1.models.error import ResponceError, ResponceErrorAlternative
+
+from .models import DeliveryTime, DeliveryTimeContent, DeliveryTimeContentItem, DeliveryTimeChunkError, GetDeliveryTime, \
+    QuoteCacheStats
+
+import time
+import threading
+
+
+# Key of one quote: company warehouse, material code, count, warehouse id
+QuoteKey = tuple[str, int, int, int]
+
+
+def quote_key(company_warehouse: str, item: DeliveryTimeContentItem) -> QuoteKey:
+    return (company_warehouse, item.code, item.count, item.warehouse_id)
+
+
+def match_quotes(items: Sequence[DeliveryTimeContentItem], quotes: Sequence[DeliveryTime]) -> list[Optional[DeliveryTime]]:
+    """ Quote of every item. Api answers one quote per item in order of items, if count of quotes is other -
+    quotes are matched by material code. Quote has no count and warehouse, so items how have the same code as other
+    item of batch (or code with several quotes) are ambiguous and get None (they are not cached) """
+    if len(items) == len(quotes): return list(quotes)
+
+    items_by_code = Counter(item.code for item in items)
+    quotes_by_code: dict[int, list[DeliveryTime]] = {}
+    for quote in quotes: quotes_by_code.setdefault(quote.code, []).append(quote)
+
+    result = []
+    for item in items:
+        matched = quotes_by_code.get(item.code, [])
+        result.append(matched[0] if items_by_code[item.code] == 1 and len(matched) == 1 else None)
+    return result
+
+
+class QuoteCache:
+    """ In-memory LRU cache of delivery time quotes with short time to live """
+
+    def __init__(self, ttl: float=60.0, max_entries: int=10000) -> None:
+        """ In-memory LRU cache of delivery time quotes. Key is (company_warehouse, code, count, warehouse_id).
+
+            Args:
+                ttl (float, optional): Time to live of quote in seconds. Defaults to 60.
+                max_entries (int, optional): Max count of quotes. Defaults to 10000.
+
+            Example:
+                >>> dkc_api = DkcAPI(master_key="xxxxxxxxxx", quote_cache=QuoteCache(ttl=300))
+                >>> dkc_api.Delivery.quote_cache.stats
+                > QuoteCacheStats(hits=1840, misses=160, entries=160)
+        """
+        self.ttl = ttl
+        self.max_entries = max_entries
+
+        self._entries: OrderedDict[QuoteKey, tuple[float, DeliveryTime]] = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+
+    def get(self, key: QuoteKey) -> Optional[DeliveryTime]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] <= time.monotonic():
+                del self._entries[key]
+                entry = None
+
+            if entry is None:
+                self._misses += 1
+                return None
+
+            self._hits += 1
+            self._entries.move_to_end(key)
+            return entry[1]
+
+    def set(self, key: QuoteKey, quote: DeliveryTime) -> None:
+        with self._lock:
+            self._entries.pop(key, None)
+            self._entries[key] = (time.monotonic() + self.ttl, quote)
+            while len(self._entries) > self.max_entries: self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    @property
+    def stats(self) -> QuoteCacheStats:
+        with self._lock:
+            return QuoteCacheStats(hits=self._hits, misses=self._misses, entries=len(self._entries))
+
+
+class QuoteBatch:
+    """ Plan of batch quote: cached quotes and chunks of not cached items (every item once) """
+
+    def __init__(self, delivery_time_content: DeliveryTimeContent, cache: Optional[QuoteCache], chunk_size: int) -> None:
+        self.company_warehouse = delivery_time_content.company_warehouse
+        self.cache = cache
+        self.keys = [quote_key(self.company_warehouse, item) for item in delivery_time_content.items]
+        self.quotes: dict[QuoteKey, DeliveryTime] = {}
+
+        missing: dict[QuoteKey, DeliveryTimeContentItem] = {}
+        for key, item in zip(self.keys, delivery_time_content.items):
+            if key in self.quotes or key in missing: continue
+
+            quote = cache.get(key) if cache is not None else None
+            if quote is not None: self.quotes[key] = quote
+            else: missing[key] = item
+
+        items = list(missing.values())
+        self.chunks = [items[index:index + chunk_size] for index in range(0, len(items), max(chunk_size, 1))]
+
+    def contents(self) -> list[DeliveryTimeContent]:
+        """ Request body of every chunk """
+        return [DeliveryTimeContent(company_warehouse=self.company_warehouse, items=chunk) for chunk in self.chunks]
+
+    def merge(self, results: Sequence[Union[GetDeliveryTime, ResponceError, ResponceErrorAlternative]]
+              ) -> Union[GetDeliveryTime, ResponceError, ResponceErrorAlternative]:
+        """ Save quotes of chunks to cache and build responce with quote of every item in order of items.
+        Errors of chunks are in `errors`, if every chunk is failed and nothing is cached - error of first chunk """
+        errors = []
+        for index, (chunk, result) in enumerate(zip(self.chunks, results)):
+            if isinstance(result, (ResponceError, ResponceErrorAlternative)):
+                errors.append(DeliveryTimeChunkError(index=index, items=chunk, error=result))
+                continue
+
+            for item, quote in zip(chunk, match_quotes(chunk, result.items)):
+                if quote is None: continue
+
+                key = quote_key(self.company_warehouse, item)
+                self.quotes[key] = quote
+                if self.cache is not None: self.cache.set(key, quote)
+
+        if errors and len(errors) == len(self.chunks) and not self.quotes: return errors[0].error
+
+        # Quotes are already validated, so merged model is not validated again
+        return GetDeliveryTime.construct(items=[self.quotes[key] for key in self.keys if key in self.quotes], errors=errors)
\ No newline at end of file
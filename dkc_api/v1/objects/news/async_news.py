@@ -0,0 +1,121 @@
+from __future__ import annotations
+from typing import TYPE_CHECKING, AsyncIterator, Optional, Union
+
+from dkc_api.v1.const import URL_DOMAIN
+from dkc_api.v1.async_transport import AsyncTransport
+from dkc_api.v1.metrics import Metrics
+from dkc_api.v1.models.error import ResponceError
+from dkc_api.v1.responce import parse_responce
+from dkc_api.v1.exceptions.exceptions import NotValidVariables
+from dkc_api.v1.lazy import logger as default_logger
+
+from .models import GetNewsCompany, GetNewsCommunity, GetNewsProducts, NewsCompany, NewsCommunity, NewsProducts
+from .pages import aiter_pages
+
+from datetime import date, datetime
+
+if TYPE_CHECKING:
+    import loguru
+
+
+class AsyncNews:
+    """ Asyncio class for interacting with site news. Methods are the same as in `News` """
+
+    def __init__(self, access_token: str, headers: dict, transport: AsyncTransport, debug: bool=False,
+                 logger: loguru.Logger = default_logger, url_domain: str = URL_DOMAIN,
+                 metrics: Metrics = None):
+        """ Asyncio class for interacting with site news. Methods are the same as in `News` """
+        self.access_token = access_token
+        self.headers = headers
+        self.transport = transport
+        self.logger = logger
+        self.debug = debug
+        self.url_domain = url_domain
+        self.metrics = metrics if metrics is not None else Metrics()
+
+    async def getNewsCompany(self, page_index: int=0, length: int=10) -> Union[GetNewsCompany, ResponceError]:
+        """ Async version of `News.getNewsCompany`. Get news company.
+
+        Example:
+            >>> await dkc_api.News.getNewsCompany()
+            > getNewsCompany(news=[{ title="Каркас...", text="'\r\n\t Покупка...", thumbnail_url="https://...", ...}, ...])
+        """
+
+        if not isinstance(page_index, int):
+            raise NotValidVariables(f"Variables page_index not valid int class. Getting {type(page_index)} class")
+
+        if not isinstance(length, int):
+            raise NotValidVariables(f"Variables length not valid int class. Getting {type(page_index)} class")
+
+        responce = await self.transport.get(f"{self.url_domain}/news/company?page_index={page_index}&length={length}", headers=self.headers)
+
+        return parse_responce(responce, GetNewsCompany, "getNewsCompany", self.metrics)
+
+    async def getNewsCommunity(self, page_index: int=0, length: int=10) -> Union[GetNewsCommunity, ResponceError]:
+        """ Async version of `News.getNewsCommunity`. Get news community.
+
+        Example:
+            >>> await dkc_api.News.getNewsCommunity()
+            > GetNewsCommunity(news=[{ text="'\r\n\t Покупка...", timestamp="datetime.date(2021, 6, 24)"}, ...])
+        """
+
+        if not isinstance(page_index, int):
+            raise NotValidVariables(f"Variables page_index not valid int class. Getting {type(page_index)} class")
+
+        if not isinstance(length, int):
+            raise NotValidVariables(f"Variables length not valid int class. Getting {type(page_index)} class")
+
+        responce = await self.transport.get(f"{self.url_domain}/news/community?page_index={page_index}&length={length}", headers=self.headers)
+
+        return parse_responce(responce, GetNewsCommunity, "getNewsCommunity", self.metrics)
+
+    async def getNewsProducts(self, page_index: int=0, length: int=10) -> Union[GetNewsProducts, ResponceError]:
+        """ Async version of `News.getNewsProducts`. Get news products.
+
+        Example:
+            >>> await dkc_api.News.getNewsProducts()
+            > GetNewsProducts(news=[{ title="Каркас...", text="'\r\n\t Покупка...", thumbnail_url="https://...", ...}, ...])
+        """
+
+        if not isinstance(page_index, int):
+            raise NotValidVariables(f"Variables page_index not valid int class. Getting {type(page_index)} class")
+
+        if not isinstance(length, int):
+            raise NotValidVariables(f"Variables length not valid int class. Getting {type(page_index)} class")
+
+        responce = await self.transport.get(f"{self.url_domain}/news/products?page_index={page_index}&length={length}", headers=self.headers)
+
+        return parse_responce(responce, GetNewsProducts, "getNewsProducts", self.metrics)
+
+    def iterNewsCompany(self, since: Optional[Union[date, datetime]]=None, length: int=10, prefetch: int=4,
+                       start_page: int=0, max_pages: Optional[int]=None) -> AsyncIterator[NewsCompany]:
+        """ Async version of `News.iterNewsCompany`. Next `prefetch` pages are fetched in tasks.
+
+        Example:
+            >>> async for news in dkc_api.News.iterNewsCompany(since=last_sync, prefetch=8):
+            >>>     save(news)
+        """
+        return aiter_pages(self.getNewsCompany, since=since, length=length, prefetch=prefetch, start_page=start_page,
+                           max_pages=max_pages)
+
+    def iterNewsCommunity(self, since: Optional[Union[date, datetime]]=None, length: int=10, prefetch: int=4,
+                       start_page: int=0, max_pages: Optional[int]=None) -> AsyncIterator[NewsCommunity]:
+        """ Async version of `News.iterNewsCommunity`. Next `prefetch` pages are fetched in tasks.
+
+        Example:
+            >>> async for news in dkc_api.News.iterNewsCommunity(since=last_sync, prefetch=8):
+            >>>     save(news)
+        """
+        return aiter_pages(self.getNewsCommunity, since=since, length=length, prefetch=prefetch, start_page=start_page,
+                           max_pages=max_pages)
+
+    def iterNewsProducts(self, since: Optional[Union[date, datetime]]=None, length: int=10, prefetch: int=4,
+                       start_page: int=0, max_pages: Optional[int]=None) -> AsyncIterator[NewsProducts]:
+        """ Async version of `News.iterNewsProducts`. Next `prefetch` pages are fetched in tasks.
+
+        Example:
+            >>> async for news in dkc_api.News.iterNewsProducts(since=last_sync, prefetch=8):
+            >>>     save(news)
+        """
+        return aiter_pages(self.getNewsProducts, since=since, length=length, prefetch=prefetch, start_page=start_page,
+                           max_pages=max_pages)
\ No newline at end of file
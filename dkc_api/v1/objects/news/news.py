@@ -1,28 +1,41 @@
 from __future__ import annotations
-from typing import Union
+from typing import TYPE_CHECKING, Iterator, Optional, Union
 
 from dkc_api.v1.const import URL_DOMAIN
-from dkc_api.v1.models.error import ResponceError, ResponceErrorAlternative
+from dkc_api.v1.transport import Transport
+from dkc_api.v1.metrics import Metrics
+from dkc_api.v1.coalesce import Coalescer, coalesced
+from dkc_api.v1.responce import parse_responce
+from dkc_api.v1.models.error import ResponceError
 from dkc_api.v1.exceptions.exceptions import NotValidVariables
+from dkc_api.v1.lazy import logger as default_logger
 
-from .models import GetNewsCompany, GetNewsCommunity, GetNewsProducts
+from .models import GetNewsCompany, GetNewsCommunity, GetNewsProducts, NewsCompany, NewsCommunity, NewsProducts
+from .pages import iter_pages
 
-import loguru
-import requests
+from datetime import date, datetime
 
-from pydantic.error_wrappers import ValidationError
+if TYPE_CHECKING:
+    import loguru
 
 
 class News:
     """ Class for interacting with available operations for working with site news """
     
-    def __init__(self, access_token: str, headers: dict, debug: bool=False, logger: loguru.Logger = loguru.logger):
+    def __init__(self, access_token: str, headers: dict, debug: bool=False, logger: loguru.Logger = default_logger,
+                 transport: Transport = None, url_domain: str = URL_DOMAIN, metrics: Metrics = None,
+                 coalescer: Coalescer = None):
         """ Class for interacting with available operations for working with site news """
         self.access_token = access_token
         self.headers = headers
         self.logger = logger
         self.debug = debug
+        self.url_domain = url_domain
+        self.metrics = metrics if metrics is not None else Metrics()
+        self.transport = transport if transport is not None else Transport()
+        self.coalescer = coalescer
 
+    @coalesced("getNewsCompany")
     def getNewsCompany(self, page_index: int=0, length: int=10) -> Union[GetNewsCompany, ResponceError]:
         """Array containing news notes sorted in reverse chronological order. Get news company.
 
@@ -44,14 +57,11 @@ class News:
         if not isinstance(length, int):
             raise NotValidVariables(f"Variables length not valid int class. Getting {type(page_index)} class")
         
-        responce = requests.get(f"{URL_DOMAIN}/news/company?page_index={page_index}&length={length}", headers=self.headers)
+        responce = self.transport.get(f"{self.url_domain}/news/company?page_index={page_index}&length={length}", headers=self.headers)
 
-        try: return GetNewsCompany(**responce.json())
-        except ValidationError: 
-            if responce.status_code == 500 or responce.status_code == 403:
-                return ResponceErrorAlternative(**responce.json())
-            return ResponceError(**{"code": responce.status_code, **responce.json() })
+        return parse_responce(responce, GetNewsCompany, "getNewsCompany", self.metrics)
         
+    @coalesced("getNewsCommunity")
     def getNewsCommunity(self, page_index: int=0, length: int=10) -> Union[GetNewsCommunity, ResponceError]:
         """Array containing news notes sorted in reverse chronological order. Get news community.
 
@@ -73,14 +83,11 @@ class News:
         if not isinstance(length, int):
             raise NotValidVariables(f"Variables length not valid int class. Getting {type(page_index)} class")
         
-        responce = requests.get(f"{URL_DOMAIN}/news/community?page_index={page_index}&length={length}", headers=self.headers)
+        responce = self.transport.get(f"{self.url_domain}/news/community?page_index={page_index}&length={length}", headers=self.headers)
 
-        try: return GetNewsCommunity(**responce.json())
-        except ValidationError: 
-            if responce.status_code == 500 or responce.status_code == 403:
-                return ResponceErrorAlternative(**responce.json())
-            return ResponceError(**{"code": responce.status_code, **responce.json() })
+        return parse_responce(responce, GetNewsCommunity, "getNewsCommunity", self.metrics)
 
+    @coalesced("getNewsProducts")
     def getNewsProducts(self, page_index: int=0, length: int=10) -> Union[GetNewsProducts, ResponceError]:
         """Array containing news notes sorted in reverse chronological order. Get news products.
 
@@ -102,10 +109,75 @@ class News:
         if not isinstance(length, int):
             raise NotValidVariables(f"Variables length not valid int class. Getting {type(page_index)} class")
         
-        responce = requests.get(f"{URL_DOMAIN}/news/company?page_index={page_index}&length={length}", headers=self.headers)
+        responce = self.transport.get(f"{self.url_domain}/news/products?page_index={page_index}&length={length}", headers=self.headers)
 
-        try: return GetNewsCompany(**responce.json())
-        except ValidationError: 
-            if responce.status_code == 500 or responce.status_code == 403:
-                return ResponceErrorAlternative(**responce.json())
-            return ResponceError(**{"code": responce.status_code, **responce.json() })
\ No newline at end of file
+        return parse_responce(responce, GetNewsProducts, "getNewsProducts", self.metrics)
+
+    def iterNewsCompany(self, since: Optional[Union[date, datetime]]=None, length: int=10, prefetch: int=4,
+                       start_page: int=0, max_pages: Optional[int]=None) -> Iterator[NewsCompany]:
+        """Iterator of news company from newest to oldest. Next `prefetch` pages are fetched in parallel while
+        current page is consumed. Iteration is stopped on first news older than `since`, so incremental sync
+        gets only new pages (news with timestamp equal `since` are yielded again).
+
+        Args:
+            since (date, datetime, optional): Watermark, timestamp of last synced news. Defaults to None (all news).
+            length (int): Count news on page. Default 10 news.
+            prefetch (int): Max count of pages fetched ahead (first page is fetched alone). Default 4 pages.
+            start_page (int): Index of first page. Default first (0) page.
+            max_pages (int, optional): Max count of pages. Defaults to None (until last page).
+
+        Raises:
+            NewsPageError: If api answered error for page.
+
+        Example:
+            >>> for news in dkc_api.News.iterNewsCompany(since=last_sync, prefetch=8):
+            >>>     save(news)
+        """
+        return iter_pages(self.getNewsCompany, since=since, length=length, prefetch=prefetch, start_page=start_page,
+                          max_pages=max_pages)
+
+    def iterNewsCommunity(self, since: Optional[Union[date, datetime]]=None, length: int=10, prefetch: int=4,
+                       start_page: int=0, max_pages: Optional[int]=None) -> Iterator[NewsCommunity]:
+        """Iterator of news community from newest to oldest. Next `prefetch` pages are fetched in parallel while
+        current page is consumed. Iteration is stopped on first news older than `since`, so incremental sync
+        gets only new pages (news with timestamp equal `since` are yielded again).
+
+        Args:
+            since (date, datetime, optional): Watermark, timestamp of last synced news. Defaults to None (all news).
+            length (int): Count news on page. Default 10 news.
+            prefetch (int): Max count of pages fetched ahead (first page is fetched alone). Default 4 pages.
+            start_page (int): Index of first page. Default first (0) page.
+            max_pages (int, optional): Max count of pages. Defaults to None (until last page).
+
+        Raises:
+            NewsPageError: If api answered error for page.
+
+        Example:
+            >>> for news in dkc_api.News.iterNewsCommunity(since=last_sync, prefetch=8):
+            >>>     save(news)
+        """
+        return iter_pages(self.getNewsCommunity, since=since, length=length, prefetch=prefetch, start_page=start_page,
+                          max_pages=max_pages)
+
+    def iterNewsProducts(self, since: Optional[Union[date, datetime]]=None, length: int=10, prefetch: int=4,
+                       start_page: int=0, max_pages: Optional[int]=None) -> Iterator[NewsProducts]:
+        """Iterator of news products from newest to oldest. Next `prefetch` pages are fetched in parallel while
+        current page is consumed. Iteration is stopped on first news older than `since`, so incremental sync
+        gets only new pages (news with timestamp equal `since` are yielded again).
+
+        Args:
+            since (date, datetime, optional): Watermark, timestamp of last synced news. Defaults to None (all news).
+            length (int): Count news on page. Default 10 news.
+            prefetch (int): Max count of pages fetched ahead (first page is fetched alone). Default 4 pages.
+            start_page (int): Index of first page. Default first (0) page.
+            max_pages (int, optional): Max count of pages. Defaults to None (until last page).
+
+        Raises:
+            NewsPageError: If api answered error for page.
+
+        Example:
+            >>> for news in dkc_api.News.iterNewsProducts(since=last_sync, prefetch=8):
+            >>>     save(news)
+        """
+        return iter_pages(self.getNewsProducts, since=since, length=length, prefetch=prefetch, start_page=start_page,
+                          max_pages=max_pages)
\ No newline at end of file
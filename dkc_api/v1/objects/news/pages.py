@@ -0,0 +1,106 @@
+from __future__ import annotations
+from typing import Any, AsyncIterator, Awaitable, Callable, Iterator, Optional, Union
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, datetime, timezone
+
+from dkc_api.v1.models.error import ResponceError, ResponceErrorAlternative
+from dkc_api.v1.exceptions.exceptions import NewsPageError
+
+import asyncio
+
+
+def is_older(timestamp: Union[date, datetime], since: Union[date, datetime]) -> bool:
+    """ Timestamp of news is older than watermark. Date is compared by day, naive datetime is taken as UTC """
+    if isinstance(timestamp, datetime) != isinstance(since, datetime):
+        timestamp = timestamp.date() if isinstance(timestamp, datetime) else timestamp
+        since = since.date() if isinstance(since, datetime) else since
+        return timestamp < since
+
+    if isinstance(timestamp, datetime) and (timestamp.tzinfo is None) != (since.tzinfo is None):
+        if timestamp.tzinfo is None: timestamp = timestamp.replace(tzinfo=timezone.utc)
+        else: since = since.replace(tzinfo=timezone.utc)
+    return timestamp < since
+
+
+def _page_news(page_index: int, page: Any) -> list:
+    if isinstance(page, (ResponceError, ResponceErrorAlternative)):
+        raise NewsPageError(f"News page {page_index} not got. Responce -> `{page}`")
+    return page.news
+
+
+def _is_next_page_needed(news: list, since: Optional[Union[date, datetime]], length: int) -> bool:
+    """ Page is full and has no news older than `since`, so iteration goes to next page """
+    if len(news) < length: return False
+    return since is None or not any(is_older(item.timestamp, since) for item in news)
+
+
+def iter_pages(fetch: Callable[[int, int], Any], since: Optional[Union[date, datetime]]=None, length: int=10,
+               prefetch: int=4, start_page: int=0, max_pages: Optional[int]=None) -> Iterator[Any]:
+    """ News one by one from pages `start_page`, `start_page + 1`, ... Next pages are fetched in background
+    threads while caller consumes current page: first page is fetched alone, count of prefetched pages is
+    doubled up to `prefetch` after every full page how is entirely newer than `since`. Iteration is stopped
+    on first news older than `since`, on empty or not full page and after `max_pages` pages.
+
+    Raises:
+        NewsPageError: If api answered error for page.
+    """
+    end_page = start_page + max_pages if max_pages is not None else None
+    executor = ThreadPoolExecutor(max_workers=max(prefetch, 1))
+    pages: deque = deque()
+    next_page, window = start_page, 1
+
+    def submit() -> None:
+        nonlocal next_page
+        while len(pages) < window and (end_page is None or next_page < end_page):
+            pages.append((next_page, executor.submit(fetch, next_page, length)))
+            next_page += 1
+
+    try:
+        submit()
+        while pages:
+            page_index, future = pages.popleft()
+            news = _page_news(page_index, future.result())
+            if _is_next_page_needed(news, since, length):
+                window = min(window * 2, max(prefetch, 1))
+                submit()
+
+            for item in news:
+                if since is not None and is_older(item.timestamp, since): return
+                yield item
+
+            if len(news) < length: return
+    finally:
+        # Caller can stop iteration early, pages how are not started yet are not fetched
+        executor.shutdown(wait=False, cancel_futures=True)
+
+
+async def aiter_pages(fetch: Callable[[int, int], Awaitable[Any]], since: Optional[Union[date, datetime]]=None,
+                      length: int=10, prefetch: int=4, start_page: int=0, max_pages: Optional[int]=None) -> AsyncIterator[Any]:
+    """ Async version of `iter_pages`, next pages are fetched in tasks """
+    end_page = start_page + max_pages if max_pages is not None else None
+    pages: deque = deque()
+    next_page, window = start_page, 1
+
+    def submit() -> None:
+        nonlocal next_page
+        while len(pages) < window and (end_page is None or next_page < end_page):
+            pages.append((next_page, asyncio.ensure_future(fetch(next_page, length))))
+            next_page += 1
+
+    try:
+        submit()
+        while pages:
+            page_index, task = pages.popleft()
+            news = _page_news(page_index, await task)
+            if _is_next_page_needed(news, since, length):
+                window = min(window * 2, max(prefetch, 1))
+                submit()
+
+            for item in news:
+                if since is not None and is_older(item.timestamp, since): return
+                yield item
+
+            if len(news) < length: return
+    finally:
+        for _, task in pages: task.cancel()
\ No newline at end of file
@@ -0,0 +1,165 @@
+from __future__ import annotations
+from typing import Any, Callable, Optional
+
+from .exceptions.exceptions import NotValidVariables
+
+import gc
+import json
+import random
+import datetime
+
+from pydantic import BaseModel
+from pydantic.json import pydantic_encoder
+from pydantic.fields import SHAPE_LIST, SHAPE_SINGLETON
+from pydantic.datetime_parse import parse_datetime
+from pydantic.error_wrappers import ValidationError
+
+
+# full - every item is validated by pydantic model (default)
+# trusted - payload is converted to `Record` objects without validation
+# sampled - as trusted, but 1 in `sample_rate` items of every list is validated by pydantic model
+VALIDATION_MODES = ("full", "trusted", "sampled")
+
+DEFAULT_SAMPLE_RATE = 100
+
+
+def check_validation(validation: str, sample_rate: int) -> None:
+    """ Raise NotValidVariables if validation mode or sample rate is not valid """
+    if validation not in VALIDATION_MODES:
+        raise NotValidVariables(f"Variables validation must be one of {', '.join(VALIDATION_MODES)}. Getting `{validation}`.")
+    if not isinstance(sample_rate, int) or sample_rate < 1:
+        raise NotValidVariables(f"Variables sample_rate must be int greater than 0. Getting `{sample_rate}`.")
+
+
+class Record:
+    """ Lightweight `__slots__` object with fields of pydantic model. Values keep json types, only nested models
+    are converted to records and datetime fields are parsed. """
+    __slots__ = ()
+    __model__: type[BaseModel]
+
+    def __repr__(self) -> str:
+        values = ", ".join(f"{name}={getattr(self, name)!r}" for name in self.__slots__)
+        return f"{type(self).__name__}({values})"
+
+    def __eq__(self, other: Any) -> bool:
+        if type(other) is not type(self): return NotImplemented
+        return all(getattr(self, name) == getattr(other, name) for name in self.__slots__)
+
+    def dict(self) -> dict:
+        """ Convert record to dict, same as `BaseModel.dict` """
+        return { name: _to_python(getattr(self, name)) for name in self.__slots__ }
+
+    def json(self) -> str:
+        """ Convert record to json string, same as `BaseModel.json` """
+        return json.dumps(self.dict(), default=pydantic_encoder)
+
+    def to_model(self) -> BaseModel:
+        """ Validate record by pydantic model """
+        return self.__model__.parse_obj(self.dict())
+
+
+def _to_python(value: Any) -> Any:
+    if isinstance(value, Record): return value.dict()
+    if isinstance(value, list): return [_to_python(item) for item in value]
+    return value
+
+
+_record_classes: dict[type[BaseModel], type[Record]] = {}
+_builders: dict[type[BaseModel], Callable[[dict, int], Record]] = {}
+
+
+def record_class(model: type[BaseModel]) -> type[Record]:
+    """ `Record` class with fields of pydantic model. Classes are created once and cached """
+    cls = _record_classes.get(model)
+    if cls is None:
+        cls = _record_classes[model] = type(model.__name__, (Record,), {
+            "__slots__": tuple(model.__fields__), "__model__": model, "__module__": __name__
+        })
+    return cls
+
+
+def _converter(field) -> Optional[Callable[[Any, int], Any]]:
+    """ Function how convert json value of field, or None if value is kept as is """
+    type_ = field.type_
+
+    if isinstance(type_, type) and issubclass(type_, BaseModel):
+        build = _builder(type_)
+        if field.shape == SHAPE_SINGLETON: return build
+        if field.shape == SHAPE_LIST: return lambda value, sample_rate: _build_list(type_, build, value, sample_rate)
+
+    if type_ is datetime.datetime and field.shape == SHAPE_SINGLETON:
+        return _parse_datetime
+
+    return None
+
+
+def _parse_datetime(value: Any, sample_rate: int) -> datetime.datetime:
+    # fromisoformat is much faster than pydantic parser, pydantic parser is used for other formats (timestamps, ...)
+    if isinstance(value, str):
+        try: return datetime.datetime.fromisoformat(value)
+        except ValueError: pass
+    return parse_datetime(value)
+
+
+def _build_list(model: type[BaseModel], build: Callable[[dict, int], Record], items: list, sample_rate: int) -> list:
+    if sample_rate and items:
+        for index in range(random.randrange(sample_rate), len(items), sample_rate): model.validate(items[index])
+    return [build(item, sample_rate) for item in items]
+
+
+def _builder(model: type[BaseModel]) -> Callable[[dict, int], Record]:
+    """ Function how build `Record` from json dict. Missing required key raises KeyError """
+    build = _builders.get(model)
+    if build is not None: return build
+
+    cls = record_class(model)
+    new = object.__new__
+    set_value = object.__setattr__
+    fields = []
+
+    def build(data: dict, sample_rate: int) -> Record:
+        record = new(cls)
+        for name, alias, required, default, convert in fields:
+            value = data[alias] if required else data.get(alias, default)
+            if convert is not None and value is not None: value = convert(value, sample_rate)
+            set_value(record, name, value)
+        return record
+
+    # Builder is registered before fields are filled, so recursive models are supported
+    _builders[model] = build
+    fields.extend((field.name, field.alias, field.required, field.default, _converter(field))
+                  for field in model.__fields__.values())
+    return build
+
+
+def construct(model: type[BaseModel], data: Any, validation: str="full", sample_rate: int=DEFAULT_SAMPLE_RATE) -> Any:
+    """ Build responce object by validation mode.
+
+    Args:
+        model (type[BaseModel]): Pydantic model of responce.
+        data (Any): Decoded json.
+        validation (str, optional): "full", "trusted" or "sampled". Defaults to "full".
+        sample_rate (int, optional): In "sampled" mode 1 in `sample_rate` list items is validated. Defaults to 100.
+
+    Raises:
+        ValidationError: If data is not valid. In "trusted" and "sampled" modes only missing required keys
+            and errors of sampled items are found, then data is validated fully for get same error as in "full" mode.
+
+    Returns:
+        Any: Pydantic model in "full" mode, `Record` in other modes.
+
+    Example:
+        >>> construct(GetMaterialStock, responce.json(), validation="trusted")
+        > GetMaterialStock(create=datetime.datetime(2021, 7, 19, 21, 0, tzinfo=datetime.timezone.utc), materials=[...])
+    """
+    if validation == "full": return model(**data)
+
+    # Records have no reference cycles, but hundreds of thousands new objects start cyclic garbage collector
+    # many times, so it is paused while building
+    gc_enabled = gc.isenabled()
+    if gc_enabled: gc.disable()
+    try: return _builder(model)(data, sample_rate if validation == "sampled" else 0)
+    except (KeyError, TypeError, AttributeError, ValueError, ValidationError):
+        return model(**data)
+    finally:
+        if gc_enabled: gc.enable()
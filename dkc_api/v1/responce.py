@@ -0,0 +1,196 @@
+from __future__ import annotations
+from typing import Any, Callable, Iterator, Optional, Union
+from json import JSONDecodeError
+
+from .metrics import Metrics, CallRecord
+from .models.error import ResponceError, ResponceErrorAlternative
+
+import json
+import time
+
+import requests
+from pydantic import BaseModel
+from pydantic.error_wrappers import ValidationError
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+# Function how decode responce body (bytes) to python objects
+JsonDecoder = Callable[[bytes], Any]
+
+NOT_JSON_MESSAGE = "With converting json request excaption error!"
+
+_decoder: JsonDecoder = orjson.loads if orjson is not None else json.loads
+
+
+def set_json_decoder(decoder: Optional[JsonDecoder]=None) -> None:
+    """ Set json decoder of responce bodies for all objects of DkcAPI and AsyncDkcAPI.
+
+    Args:
+        decoder (JsonDecoder, optional): Function how decode bytes, for example `orjson.loads`, `ujson.loads`
+            or `json.loads`. Defaults to None (`orjson.loads` if orjson is installed, else `json.loads`).
+
+    Example:
+        >>> from dkc_api.v1.responce import set_json_decoder
+        >>> set_json_decoder(json.loads)
+    """
+    global _decoder
+    _decoder = decoder if decoder is not None else (orjson.loads if orjson is not None else json.loads)
+
+
+def get_json_decoder() -> JsonDecoder:
+    """ Current json decoder of responce bodies """
+    return _decoder
+
+
+def decode_json(content: bytes) -> Any:
+    """ Decode responce body by current json decoder.
+
+    Raises:
+        JSONDecodeError: If body is not json (error of any decoder is converted to JSONDecodeError).
+    """
+    try: return _decoder(content)
+    except JSONDecodeError: raise
+    except (ValueError, TypeError) as e:
+        raise JSONDecodeError(str(e), content[:100].decode("utf-8", "replace"), 0) from e
+
+
+def decode_responce(responce: Union[requests.Response, Any]) -> Any:
+    """ Decode body of responce by current json decoder. With `json.loads` decoder (orjson is not installed and
+    other decoder is not set) `responce.json()` of requests / httpx is used, as before pluggable decoders.
+
+    Raises:
+        JSONDecodeError: If body is not json.
+    """
+    if _decoder is not json.loads: return decode_json(responce.content)
+
+    try: return responce.json()
+    except JSONDecodeError: raise
+    except (ValueError, TypeError) as e:
+        raise JSONDecodeError(str(e), responce.content[:100].decode("utf-8", "replace"), 0) from e
+
+
+def responce_error(status_code: int, data: Any) -> Union[ResponceError, ResponceErrorAlternative]:
+    """ Error model of decoded body: `ResponceErrorAlternative` for 500 and 403 status, `ResponceError` for other.
+    If body has no fields of error model, `ResponceError` with status code and body as message is returned """
+    if isinstance(data, dict):
+        try:
+            if status_code == 500 or status_code == 403: return ResponceErrorAlternative(**data)
+            return ResponceError(**{ "code": status_code, **data })
+        except ValidationError:
+            pass
+
+    return ResponceError(code=status_code, message=f"Unexpected responce: {str(data)[:200]}")
+
+
+def parse_error(responce: Union[requests.Response, Any], endpoint: Optional[str]=None,
+                metrics: Optional[Metrics]=None) -> Union[ResponceError, ResponceErrorAlternative]:
+    """ Error model of not success responce (`requests.Response` or `httpx.Response`), body is decoded once.
+    If `metrics` is given, call is recorded as error of `endpoint` """
+    start = time.perf_counter()
+    try: data = decode_responce(responce)
+    except JSONDecodeError: result = ResponceError(code=responce.status_code, message=NOT_JSON_MESSAGE)
+    else: result = responce_error(responce.status_code, data)
+
+    record_call(metrics, endpoint, responce, time.perf_counter() - start, 0.0, True)
+    return result
+
+
+def parse_responce(responce: Union[requests.Response, Any], model: type[BaseModel], endpoint: str,
+                   metrics: Optional[Metrics]=None, build: Optional[Callable[[Any], Any]]=None) -> Any:
+    """ Decode json body once and build model. Status is checked first: error status (not 2xx) gives error model
+    without validation of success model, body of 2xx status how is not valid for model gives error model too,
+    see `responce_error`. Body how is not json gives `ResponceError` with status code. Time of decode and
+    validation, status and size of body are recorded to `metrics`.
+
+    Args:
+        responce (Union[requests.Response, httpx.Response]): Responce from api.
+        model (type[BaseModel]): Model of success responce.
+        endpoint (str): Method name for metrics, for example "getMaterial".
+        metrics (Metrics, optional): Metrics for record call. Defaults to None (not record).
+        build (Callable[[Any], Any], optional): Function how build result from decoded json. Defaults to `model(**data)`.
+    """
+    start = time.perf_counter()
+    try: data = decode_responce(responce)
+    except JSONDecodeError:
+        record_call(metrics, endpoint, responce, time.perf_counter() - start, 0.0, True)
+        return ResponceError(code=responce.status_code, message=NOT_JSON_MESSAGE)
+    decoded = time.perf_counter()
+
+    if 200 <= responce.status_code < 300:
+        try: result = build(data) if build is not None else model(**data)
+        except (ValidationError, TypeError): result = responce_error(responce.status_code, data)
+    else:
+        result = responce_error(responce.status_code, data)
+
+    record_call(metrics, endpoint, responce, decoded - start, time.perf_counter() - decoded,
+            isinstance(result, (ResponceError, ResponceErrorAlternative)))
+    return result
+
+
+def record_call(metrics: Optional[Metrics], endpoint: str, responce: Union[requests.Response, Any], decode: float,
+                validate: float, error: bool) -> None:
+    """ Record call with status, size of body and network time of `responce` to `metrics` (if it is not None) """
+    if metrics is None: return
+    metrics.record(CallRecord(
+        endpoint=endpoint,
+        status=responce.status_code,
+        received_bytes=len(responce.content),
+        network=getattr(responce, "network_time", 0.0),
+        decode=decode,
+        validate=validate,
+        error=error,
+    ))
+
+
+class MeteredStream:
+    """ Responce opened with `stream=True` how record call to `metrics` when it is closed. Body is read by
+    `iter_content`, so read bytes and time of reading chunks are added to network time of responce. Call is
+    recorded as error if read of body failed. Other attributes are taken from wrapped responce. """
+
+    def __init__(self, responce: requests.Response, endpoint: str, metrics: Optional[Metrics]=None) -> None:
+        self.responce = responce
+        self.endpoint = endpoint
+        self.metrics = metrics
+
+        self.received_bytes = 0
+        self.network_time = getattr(responce, "network_time", 0.0)
+        self.failed = False
+        self._recorded = False
+
+    def iter_content(self, chunk_size: int=1, decode_unicode: bool=False) -> Iterator[bytes]:
+        chunks = self.responce.iter_content(chunk_size=chunk_size, decode_unicode=decode_unicode)
+        while True:
+            start = time.perf_counter()
+            try: chunk = next(chunks, None)
+            except BaseException:
+                self.failed = True
+                raise
+            finally:
+                self.network_time += time.perf_counter() - start
+
+            if chunk is None: return
+            self.received_bytes += len(chunk)
+            yield chunk
+
+    def close(self) -> None:
+        """ Close responce and record call (once) """
+        try: self.responce.close()
+        finally:
+            if not self._recorded and self.metrics is not None:
+                self._recorded = True
+                self.metrics.record(CallRecord(
+                    endpoint=self.endpoint,
+                    status=self.responce.status_code,
+                    received_bytes=self.received_bytes,
+                    network=self.network_time,
+                    decode=0.0,
+                    validate=0.0,
+                    error=self.failed,
+                ))
+
+    def __getattr__(self, name: str):
+        return getattr(self.responce, name)
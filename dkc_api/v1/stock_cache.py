@@ -0,0 +1,147 @@
+from __future__ import annotations
+from typing import TYPE_CHECKING, Optional, Union
+
+from .models.error import ResponceError, ResponceErrorAlternative
+from .objects.catalog.models import GetMaterialStock, MaterialStock
+
+import datetime
+import threading
+
+if TYPE_CHECKING:
+    from .objects.catalog.catalog import Catalog
+
+
+def _split_values(value: Union[list[str], str, int]) -> list[str]:
+    """ Convert code or id variable (list, comma separated string or int) to list of strings """
+    values = value if isinstance(value, list) else [value] if isinstance(value, (str, int)) else []
+    return [part.strip() for item in values for part in str(item).split(",") if part.strip()]
+
+
+def _as_utc(create: Optional[datetime.datetime]) -> Optional[datetime.datetime]:
+    """ Revision time without timezone is UTC """
+    if create is not None and create.tzinfo is None: return create.replace(tzinfo=datetime.timezone.utc)
+    return create
+
+
+class StockCache:
+    """ In-memory cache of full stock snapshot. Stock revision is formed 1 time per hour, so snapshot is fetched once
+    per revision (detected by `GetMaterialStock.create`) and all lookups are answered from index by code and id. """
+
+    def __init__(self, catalog: Catalog, revision_interval: datetime.timedelta=datetime.timedelta(hours=1),
+                 retry_interval: datetime.timedelta=datetime.timedelta(minutes=1)) -> None:
+        """ In-memory cache of full stock snapshot.
+
+            Args:
+                catalog (Catalog): Catalog object how used for get snapshot.
+                revision_interval (timedelta, optional): How often server forms new revision. Defaults to 1 hour.
+                retry_interval (timedelta, optional): Pause before next check, if new revision is due but server
+                    still returns old one, or request fails. Defaults to 1 minute.
+
+            Example:
+                >>> stock = StockCache(dkc_api.Catalog)
+                >>> stock.get("FKC600INOX316L")
+                > MaterialStock(id=1052191, status=True, code='FKC600INOX316L', warehouse=[...])
+        """
+        self.catalog = catalog
+        self.revision_interval = revision_interval
+        self.retry_interval = retry_interval
+
+        self.create: Optional[datetime.datetime] = None
+        self.next_check: Optional[datetime.datetime] = None
+        self.last_error: Optional[Union[ResponceError, ResponceErrorAlternative]] = None
+
+        self._by_code: dict[str, MaterialStock] = {}
+        self._by_id: dict[int, MaterialStock] = {}
+        self._lock = threading.Lock()
+
+    def _now(self) -> datetime.datetime:
+        return datetime.datetime.now(datetime.timezone.utc)
+
+    def _is_due(self) -> bool:
+        return self.next_check is None or self._now() >= self.next_check
+
+    def refresh(self, force: bool=False) -> Optional[Union[ResponceError, ResponceErrorAlternative]]:
+        """ Fetch snapshot if next revision is due (or `force`). Concurrent callers wait one fetch.
+
+        Returns:
+            Optional[Union[ResponceError, ResponceErrorAlternative]]: Error of fetch or None.
+        """
+        if not force and not self._is_due(): return None
+
+        with self._lock:
+            if not force and not self._is_due(): return None
+
+            stream = self.catalog.getMaterialStockStream()
+            if isinstance(stream, (ResponceError, ResponceErrorAlternative)):
+                self.catalog.logger.warning(f"Stock snapshot not got. Responce -> {stream}")
+                self.last_error = stream
+                self.next_check = self._now() + self.retry_interval
+                return stream
+
+            with stream:
+                create = _as_utc(stream.create)
+                if create is not None and create == self.create:
+                    # Revision is not formed yet, keep current snapshot
+                    self.next_check = self._now() + self.retry_interval
+                    return None
+
+                by_code, by_id = {}, {}
+                for material in stream:
+                    by_code[material.code] = material
+                    by_id[material.id] = material
+
+            # Server can send `create` after `materials`, so it is read again after stream is consumed
+            create = _as_utc(stream.create)
+            if create is None:
+                error = ResponceError(code=stream.responce.status_code, message="Stock snapshot has no `create` field")
+                self.catalog.logger.warning(f"Stock snapshot not got. Responce -> {error}")
+                self.last_error = error
+                self.next_check = self._now() + self.retry_interval
+                return error
+
+            if create == self.create:
+                # Same revision, `create` was sent after `materials`
+                self.next_check = self._now() + self.retry_interval
+                return None
+
+            self._by_code, self._by_id = by_code, by_id
+            self.create = create
+            self.last_error = None
+
+            self.next_check = max(create + self.revision_interval, self._now() + self.retry_interval)
+
+            if self.catalog.debug: self.catalog.logger.debug(f"Stock snapshot {create} -> {len(by_code)} materials")
+
+        return None
+
+    def get(self, code: str) -> Optional[MaterialStock]:
+        """ Get stock of material by code """
+        self.refresh()
+        return self._by_code.get(str(code))
+
+    def get_by_id(self, id: int) -> Optional[MaterialStock]:
+        """ Get stock of material by id """
+        self.refresh()
+        return self._by_id.get(int(id))
+
+    def getMaterialStock(self, code: Union[list[str], str, int]=[], id: Union[list[str], str, int]=[]) -> Union[GetMaterialStock, ResponceError, ResponceErrorAlternative]:
+        """ Same as `Catalog.getMaterialStock`, but answered from snapshot. If ‘Material code’ is present,
+        ‘Material ID’ is not taken into account. Without code and id returns all data. """
+        error = self.refresh()
+        if self.create is None:
+            # No snapshot: error of this fetch or of last fetch (while retry interval is not passed)
+            if error is None: error = self.last_error
+            return error if error is not None else ResponceError(code=0, message="Stock snapshot is not loaded")
+
+        # As in Catalog, `code=0` means all data
+        codes = _split_values(code) if code != 0 else []
+        ids = _split_values(id)
+
+        if codes: materials = [self._by_code[c] for c in codes if c in self._by_code]
+        elif ids: materials = [self._by_id[int(i)] for i in ids if i.isdigit() and int(i) in self._by_id]
+        else: materials = list(self._by_code.values())
+
+        return GetMaterialStock.construct(create=self.create, materials=materials)
+
+    def __len__(self) -> int:
+        return len(self._by_code)
@@ -0,0 +1,174 @@
+from __future__ import annotations
+from typing import Iterable, NamedTuple, Optional
+
+from .objects.catalog.models import GetMaterialStock, MaterialStock
+
+import array
+import datetime
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
+class StockReceipts(NamedTuple):
+    """ Incoming receipts, one row per receipt """
+    material_id: "np.ndarray"
+    warehouse: "np.ndarray"
+    date: "np.ndarray"
+    amount: "np.ndarray"
+
+
+def _timestamp(value: datetime.datetime) -> int:
+    """ Convert datetime to UTC timestamp in seconds. Naive datetime is UTC """
+    if value.tzinfo is None: value = value.replace(tzinfo=datetime.timezone.utc)
+    return int(value.timestamp())
+
+
+class ColumnarStock:
+    """ Compact columnar representation of stock balances. Every level of `MaterialStock` -> `Warehouse` ->
+    `WarehouseReceipt` is kept in flat NumPy arrays, so aggregation queries are vectorized.
+    Need `numpy` package (python -m pip install dkc-api[columnar]).
+
+        Columns:
+            material_id, material_code, material_status: one row per material.
+            warehouse_material, warehouse_code, warehouse_amount: one row per material warehouse,
+                `warehouse_material` is row index in material columns.
+            receipt_warehouse, receipt_date, receipt_amount: one row per receipt,
+                `receipt_warehouse` is row index in warehouse columns.
+    """
+
+    def __init__(self, create: Optional[datetime.datetime], material_id: np.ndarray, material_code: np.ndarray,
+                 material_status: np.ndarray, warehouse_material: np.ndarray, warehouse_code: np.ndarray,
+                 warehouse_amount: np.ndarray, receipt_warehouse: np.ndarray, receipt_date: np.ndarray,
+                 receipt_amount: np.ndarray) -> None:
+        if np is None:
+            raise ImportError("ColumnarStock need `numpy` package. Install it: python -m pip install dkc-api[columnar]")
+
+        self.create = create
+
+        self.material_id = material_id
+        self.material_code = material_code
+        self.material_status = material_status
+
+        self.warehouse_material = warehouse_material
+        self.warehouse_code = warehouse_code
+        self.warehouse_amount = warehouse_amount
+
+        self.receipt_warehouse = receipt_warehouse
+        self.receipt_date = receipt_date
+        self.receipt_amount = receipt_amount
+
+    @classmethod
+    def from_stock(cls, stock: GetMaterialStock) -> ColumnarStock:
+        """ Build columns from `GetMaterialStock` model """
+        return cls.from_materials(stock.materials, create=stock.create)
+
+    @classmethod
+    def from_materials(cls, materials: Iterable[MaterialStock], create: Optional[datetime.datetime]=None) -> ColumnarStock:
+        """ Build columns from any iterable of `MaterialStock`. With `Catalog.getMaterialStockStream` full catalog
+        is never held as models in memory.
+
+        Example:
+            >>> with dkc_api.Catalog.getMaterialStockStream() as stream:
+            >>>     stock = ColumnarStock.from_materials(stream, create=stream.create)
+        """
+        if np is None:
+            raise ImportError("ColumnarStock need `numpy` package. Install it: python -m pip install dkc-api[columnar]")
+
+        material_id, material_status, material_code = array.array("q"), array.array("b"), []
+        warehouse_material, warehouse_code, warehouse_amount = array.array("l"), array.array("l"), array.array("q")
+        receipt_warehouse, receipt_date, receipt_amount = array.array("l"), array.array("q"), array.array("q")
+
+        for material in materials:
+            material_index = len(material_id)
+            material_id.append(material.id)
+            material_status.append(material.status)
+            material_code.append(material.code)
+
+            for warehouse in material.warehouse:
+                warehouse_index = len(warehouse_code)
+                warehouse_material.append(material_index)
+                warehouse_code.append(warehouse.code)
+                warehouse_amount.append(warehouse.amount)
+
+                for receipt in warehouse.receipt:
+                    receipt_warehouse.append(warehouse_index)
+                    receipt_date.append(_timestamp(receipt.date))
+                    receipt_amount.append(receipt.amount)
+
+        return cls(
+            create=create if create is not None else getattr(materials, "create", None),
+            material_id=np.asarray(material_id, dtype=np.int64),
+            material_code=np.asarray(material_code, dtype=object),
+            material_status=np.asarray(material_status, dtype=bool),
+            warehouse_material=np.asarray(warehouse_material, dtype=np.int64),
+            warehouse_code=np.asarray(warehouse_code, dtype=np.int64),
+            warehouse_amount=np.asarray(warehouse_amount, dtype=np.int64),
+            receipt_warehouse=np.asarray(receipt_warehouse, dtype=np.int64),
+            receipt_date=np.asarray(receipt_date, dtype=np.int64).astype("datetime64[s]"),
+            receipt_amount=np.asarray(receipt_amount, dtype=np.int64),
+        )
+
+    def __len__(self) -> int:
+        return len(self.material_id)
+
+    @property
+    def nbytes(self) -> int:
+        """ Size of numeric columns in bytes """
+        return sum(column.nbytes for column in (
+            self.material_id, self.material_status, self.warehouse_material, self.warehouse_code,
+            self.warehouse_amount, self.receipt_warehouse, self.receipt_date, self.receipt_amount
+        ))
+
+    def total_by_warehouse(self) -> dict[int, int]:
+        """ Sum of stock amount by warehouse code.
+
+        Example:
+            >>> stock.total_by_warehouse()
+            > {1100: 1752040, 2765: 98123, ...}
+        """
+        codes, inverse = np.unique(self.warehouse_code, return_inverse=True)
+        totals = np.zeros(len(codes), dtype=np.int64)
+        np.add.at(totals, inverse, self.warehouse_amount)
+        return dict(zip(codes.tolist(), totals.tolist()))
+
+    def total_by_material(self, warehouse: Optional[int]=None) -> np.ndarray:
+        """ Sum of stock amount for every material row, in all warehouses or only in `warehouse` """
+        mask = slice(None) if warehouse is None else self.warehouse_code == warehouse
+
+        totals = np.zeros(len(self.material_id), dtype=np.int64)
+        np.add.at(totals, self.warehouse_material[mask], self.warehouse_amount[mask])
+        return totals
+
+    def below_threshold(self, threshold: int, warehouse: Optional[int]=None) -> np.ndarray:
+        """ Ids of materials how have stock amount less than `threshold` (in all warehouses or only in `warehouse`).
+
+        Example:
+            >>> stock.below_threshold(10, warehouse=1100)
+            > array([81, 1052191, ...])
+        """
+        return self.material_id[self.total_by_material(warehouse) < threshold]
+
+    def receipts_between(self, start: datetime.datetime, end: datetime.datetime,
+                         warehouse: Optional[int]=None) -> StockReceipts:
+        """ Incoming receipts with date in window [start, end] (in all warehouses or only in `warehouse`).
+
+        Example:
+            >>> stock.receipts_between(datetime.datetime(2021, 8, 1), datetime.datetime(2021, 8, 7))
+            > StockReceipts(material_id=array([81, ...]), warehouse=array([1100, ...]), date=array([...]), amount=array([...]))
+        """
+        start = np.datetime64(_timestamp(start), "s")
+        end = np.datetime64(_timestamp(end), "s")
+
+        mask = (self.receipt_date >= start) & (self.receipt_date <= end)
+        if warehouse is not None: mask &= self.warehouse_code[self.receipt_warehouse] == warehouse
+
+        warehouse_rows = self.receipt_warehouse[mask]
+        return StockReceipts(
+            material_id=self.material_id[self.warehouse_material[warehouse_rows]],
+            warehouse=self.warehouse_code[warehouse_rows],
+            date=self.receipt_date[mask],
+            amount=self.receipt_amount[mask],
+        )
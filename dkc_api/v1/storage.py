@@ -1,11 +1,15 @@
 from __future__ import annotations
-from typing import Optional
+from typing import ContextManager, Iterator, Optional
+
+from .lazy import logger as default_logger
 
 import os
 import json
+import time
+import sqlite3
 import datetime
-import pytz
-import loguru
+import threading
+import contextlib
 
 
 class TokenStorage:
@@ -15,15 +19,20 @@ class TokenStorage:
     def save_token(self, access_token: str) -> bool:
         ...
 
+    def lock(self) -> ContextManager[None]:
+        """ Lock of storage for renew token. Storage how is shared between processes hold it, so only one process
+        get new token from api and others read it from storage. Default storage is not shared - no lock. """
+        return contextlib.nullcontext()
+
 class FileTokenStorage(TokenStorage):
-    def __init__(self, path_save_file: str=os.getcwd(), file_name: str='access_token.json') -> None:
+    def __init__(self, path_save_file: Optional[str]=None, file_name: str='access_token.json') -> None:
         """ File Token storage save access token to file
         
             Args:
-                path_save_file (str, optional): File path to save token. Defaults to os.getcwd().
+                path_save_file (str, optional): File path to save token. Defaults to None (current work dir on init).
                 file_name (str, optional): File name how to save token.Defaults to "access_token.json"
         """
-        self.path_save_file = os.path.join(path_save_file, file_name)
+        self.path_save_file = os.path.join(path_save_file if path_save_file is not None else os.getcwd(), file_name)
 
     def get_access_token(self) -> Optional[str]:
         """ Get access token with file.
@@ -45,13 +54,120 @@ class FileTokenStorage(TokenStorage):
         Returns:
             bool: Is success update or not
         """
+        # Write to temp file and replace, so other process never read half written file
+        import pytz  # Imported on first save of token, not on import of dkc_api
+
+        path_tmp_file = f"{self.path_save_file}.{os.getpid()}.tmp"
         try:
-            with open(self.path_save_file, "w", encoding="UTF-8") as file:
+            with open(path_tmp_file, "w", encoding="UTF-8") as file:
                 json.dump({
                     "time_update": str(datetime.datetime.now(pytz.timezone("Europe/Moscow"))),
                     "access_token": access_token
                 }, file)
+            os.replace(path_tmp_file, self.path_save_file)
         except OSError as e:
-            loguru.logger.error(e)
+            default_logger.error(e)
+            return False
+        return True
+
+
+class SQLiteTokenStorage(TokenStorage):
+    def __init__(self, path_save_file: Optional[str]=None, file_name: str='access_token.sqlite3',
+                 token_ttl: Optional[float]=None, key: str="default", timeout: float=30.0) -> None:
+        """ Token storage in SQLite database, safe for many processes (gunicorn workers) on one host. All processes
+        share one token: when token is not valid, only one process get new token from api (others wait lock of
+        database and read new token). Token and his expiry are kept in memory, database is read only on first
+        access, after expiry and on renew.
+
+            Args:
+                path_save_file (str, optional): Path to database. Defaults to None (current work dir on init).
+                file_name (str, optional): Database file name. Defaults to "access_token.sqlite3".
+                token_ttl (float, optional): Lifetime of token in seconds, after it token is got again.
+                    Defaults to None (token live until api answer 401/403).
+                key (str, optional): Name of token, for many master keys in one database. Defaults to "default".
+                timeout (float, optional): Time in seconds for wait lock of database. Defaults to 30.
+
+            Example:
+                >>> dkc_api = DkcAPI(master_key="xxxxxxxxxx", storage=SQLiteTokenStorage("/var/run/dkc", token_ttl=3600))
+        """
+        self.path_save_file = os.path.join(path_save_file if path_save_file is not None else os.getcwd(), file_name)
+        self.token_ttl = token_ttl
+        self.key = key
+        self.timeout = timeout
+
+        self.access_token: Optional[str] = None
+        self.expires_at: Optional[float] = None
+
+        self._local = threading.local()
+        self._connect().execute(
+            "CREATE TABLE IF NOT EXISTS tokens (key TEXT PRIMARY KEY, access_token TEXT NOT NULL, "
+            "updated_at REAL NOT NULL, expires_at REAL)"
+        )
+
+    def _connect(self) -> sqlite3.Connection:
+        """ Connection of current thread. Pid is checked, so connection is not used in forked worker """
+        connection: Optional[sqlite3.Connection] = getattr(self._local, "connection", None)
+        if connection is None or self._local.pid != os.getpid():
+            connection = sqlite3.connect(self.path_save_file, timeout=self.timeout, isolation_level=None)
+            connection.execute("PRAGMA journal_mode=WAL")
+            self._local.connection, self._local.pid = connection, os.getpid()
+        return connection
+
+    def _is_expired(self) -> bool:
+        return self.expires_at is not None and time.time() >= self.expires_at
+
+    def get_access_token(self) -> Optional[str]:
+        """ Get access token from memory, from database on first call, after expiry or in `lock`.
+
+        Returns:
+            Optional[str]: Return access_token or None if not saved or expired
+        """
+        if self.access_token is not None and not self._is_expired() and not getattr(self._local, "locked", False):
+            return self.access_token
+
+        row = self._connect().execute(
+            "SELECT access_token, expires_at FROM tokens WHERE key = ?", (self.key,)
+        ).fetchone()
+
+        self.access_token, self.expires_at = row if row is not None else (None, None)
+        if self._is_expired(): self.access_token = None
+        return self.access_token
+
+    def save_token(self, access_token: str) -> bool:
+        """ Save access token to database and memory.
+
+        Args:
+            access_token (str): access token DksAPI
+
+        Returns:
+            bool: Is success update or not
+        """
+        now = time.time()
+        expires_at = now + self.token_ttl if self.token_ttl is not None else None
+        try:
+            self._connect().execute(
+                "INSERT OR REPLACE INTO tokens (key, access_token, updated_at, expires_at) VALUES (?, ?, ?, ?)",
+                (self.key, access_token, now, expires_at)
+            )
+        except sqlite3.Error as e:
+            default_logger.error(e)
             return False
-        return True
\ No newline at end of file
+
+        self.access_token, self.expires_at = access_token, expires_at
+        return True
+
+    @contextlib.contextmanager
+    def lock(self) -> Iterator[None]:
+        """ Write lock of database (BEGIN IMMEDIATE) for all processes. In lock token is always read from database """
+        connection = self._connect()
+        connection.execute("BEGIN IMMEDIATE")
+        self._local.locked = True
+        try:
+            yield
+        except BaseException:
+            connection.execute("ROLLBACK")
+            raise
+        else:
+            connection.execute("COMMIT")
+        finally:
+            self._local.locked = False
\ No newline at end of file
@@ -0,0 +1,170 @@
+""" Incremental JSON reader. Parse big responce body chunk by chunk, without loading all document to memory """
+from __future__ import annotations
+from typing import Any, Iterable, Iterator
+from json import JSONDecoder, JSONDecodeError
+
+import codecs
+import base64
+import binascii
+
+
+WHITESPACE = " \t\n\r"
+ESCAPES = { '"': '"', "\\": "\\", "/": "/", "b": "\b", "f": "\f", "n": "\n", "r": "\r", "t": "\t" }
+
+
+class JsonStreamReader:
+    """ Incremental reader of JSON document from chunks of bytes.
+
+        Reader walks over objects and arrays with `iter_object` and `iter_array`, and decodes only values
+        how caller read with `read_value`. So in memory is only current value and not read part of chunk.
+
+        Example:
+            >>> reader = JsonStreamReader(responce.iter_content(chunk_size=65536))
+            >>> for key in reader.iter_object():
+            >>>     if key == "materials":
+            >>>         for item in reader.iter_array(): ...
+            >>>     else:
+            >>>         value = reader.read_value()
+    """
+
+    def __init__(self, chunks: Iterable[bytes], encoding: str="utf-8") -> None:
+        self._chunks = iter(chunks)
+        self._decoder = codecs.getincrementaldecoder(encoding)()
+        self._json_decoder = JSONDecoder()
+
+        self.buffer = ""
+        self.pos = 0
+        self.eof = False
+
+    def _fill(self) -> bool:
+        """ Read next chunk to buffer. Return False if document is ended """
+        if self.eof: return False
+
+        if self.pos > len(self.buffer) // 2:
+            self.buffer = self.buffer[self.pos:]
+            self.pos = 0
+
+        for chunk in self._chunks:
+            text = self._decoder.decode(chunk)
+            if text:
+                self.buffer += text
+                return True
+
+        self.buffer += self._decoder.decode(b"", final=True)
+        self.eof = True
+        return True
+
+    def peek(self) -> str:
+        """ Skip whitespaces and return next char without read it. Return empty string in end of document """
+        while True:
+            while self.pos < len(self.buffer) and self.buffer[self.pos] in WHITESPACE:
+                self.pos += 1
+
+            if self.pos < len(self.buffer): return self.buffer[self.pos]
+            if not self._fill(): return ""
+
+    def expect(self, char: str) -> None:
+        """ Read next char and check it """
+        if self.peek() != char:
+            raise JSONDecodeError(f"Expecting '{char}'", self.buffer, self.pos)
+        self.pos += 1
+
+    def read_value(self) -> Any:
+        """ Read and decode next full value (object, array, string, number or literal) """
+        self.peek()
+
+        while True:
+            try:
+                value, end = self._json_decoder.raw_decode(self.buffer, self.pos)
+            except JSONDecodeError:
+                if self._fill(): continue
+                raise
+
+            # Number in end of buffer can be continued in next chunk
+            if end == len(self.buffer) and not self.eof and self._fill(): continue
+
+            self.pos = end
+            return value
+
+    def iter_object(self) -> Iterator[str]:
+        """ Read object and yield his keys. Caller must read value of every key before next iteration """
+        self.expect("{")
+        if self.peek() == "}":
+            self.pos += 1
+            return
+
+        while True:
+            key = self.read_value()
+            if not isinstance(key, str):
+                raise JSONDecodeError("Expecting property name", self.buffer, self.pos)
+            self.expect(":")
+
+            yield key
+
+            char = self.peek()
+            self.pos += 1
+            if char == "}": return
+            if char != ",": raise JSONDecodeError("Expecting ',' delimiter", self.buffer, self.pos - 1)
+
+    def iter_array(self) -> Iterator[Any]:
+        """ Read array and yield his decoded items one by one """
+        self.expect("[")
+        if self.peek() == "]":
+            self.pos += 1
+            return
+
+        while True:
+            yield self.read_value()
+
+            char = self.peek()
+            self.pos += 1
+            if char == "]": return
+            if char != ",": raise JSONDecodeError("Expecting ',' delimiter", self.buffer, self.pos - 1)
+
+    def iter_string(self) -> Iterator[str]:
+        """ Read string value and yield it by parts, so long string (base64 file) is never kept whole in memory """
+        self.expect('"')
+
+        while True:
+            buffer = self.buffer
+            end = buffer.find('"', self.pos)
+            if end == -1: end = len(buffer)
+            slash = buffer.find("\\", self.pos, end)
+            if slash != -1: end = slash
+
+            if end > self.pos: yield buffer[self.pos:end]
+            self.pos = end
+
+            if end == len(buffer):
+                if not self._fill(): raise JSONDecodeError("Unterminated string", self.buffer, self.pos)
+                continue
+
+            if buffer[end] == '"':
+                self.pos += 1
+                return
+
+            # Escape sequence can be split between chunks
+            while len(self.buffer) - self.pos < 6 and not self.eof: self._fill()
+            char = self.buffer[self.pos + 1:self.pos + 2]
+            if char == "u":
+                yield chr(int(self.buffer[self.pos + 2:self.pos + 6], 16))
+                self.pos += 6
+            elif char in ESCAPES and char:
+                yield ESCAPES[char]
+                self.pos += 2
+            else:
+                raise JSONDecodeError("Invalid \\escape", self.buffer, self.pos)
+
+
+def iter_base64_decode(parts: Iterable[str]) -> Iterator[bytes]:
+    """ Decode base64 text from parts of any length, yield decoded bytes part by part """
+    rest = ""
+    for part in parts:
+        text = rest + "".join(part.split()) if any(char in part for char in WHITESPACE) else rest + part
+        size = len(text) - len(text) % 4
+        rest = text[size:]
+        if size: yield base64.b64decode(text[:size])
+
+    if rest:
+        try: yield base64.b64decode(rest + "=" * (-len(rest) % 4))
+        except binascii.Error as e: raise ValueError(f"Not valid base64 end -> {rest!r}") from e
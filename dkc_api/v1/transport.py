@@ -0,0 +1,132 @@
+from __future__ import annotations
+from typing import Optional
+
+from .models.transport import TransportStats
+from .limiter import RateLimiter
+
+import time
+import threading
+
+import requests
+from requests.adapters import HTTPAdapter, DEFAULT_POOLBLOCK, DEFAULT_POOLSIZE
+from urllib3.poolmanager import PoolManager
+
+
+class _CountingPoolManager(PoolManager):
+    """ Pool manager how remember every created connection pool, for count opened connections """
+
+    def __init__(self, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self.created_pools = []
+
+    def _new_pool(self, scheme, host, port, request_context=None):
+        pool = super()._new_pool(scheme, host, port, request_context=request_context)
+        self.created_pools.append(pool)
+        return pool
+
+
+class _PoolAdapter(HTTPAdapter):
+    """ HTTP adapter with counting pool manager """
+
+    def init_poolmanager(self, connections, maxsize, block=DEFAULT_POOLBLOCK, **pool_kwargs) -> None:
+        self._pool_connections = connections
+        self._pool_maxsize = maxsize
+        self._pool_block = block
+
+        self.poolmanager = _CountingPoolManager(num_pools=connections, maxsize=maxsize, block=block, **pool_kwargs)
+
+
+class Transport:
+    """ Shared HTTP transport for DkcAPI objects. Keep-alive session with connection pool """
+
+    def __init__(self, pool_connections: int=DEFAULT_POOLSIZE, pool_maxsize: int=DEFAULT_POOLSIZE,
+                 pool_block: bool=DEFAULT_POOLBLOCK, timeout: Optional[float]=None,
+                 limiter: Optional[RateLimiter]=None) -> None:
+        """ Shared HTTP transport for DkcAPI objects. One instance is used by Catalog, News, Content and Delivery,
+            so connections to api.dkc.ru are opened once and reused between calls.
+
+            Args:
+                pool_connections (int, optional): Count of hosts how keep connection pool. Defaults to 10.
+                pool_maxsize (int, optional): Max count of keep-alive connections to one host. Defaults to 10.
+                pool_block (bool, optional): If True - never open more than `pool_maxsize` connections to one host,
+                    wait free connection. Defaults to False.
+                timeout (float, optional): Timeout for every request in seconds. Defaults to None (without timeout).
+                limiter (RateLimiter, optional): Rate limit, adaptive concurrency and retries of requests.
+                    Defaults to None (requests are sent at once, without retries).
+        """
+        self.timeout = timeout
+        self.limiter = limiter
+
+        self.adapter = _PoolAdapter(pool_connections=pool_connections, pool_maxsize=pool_maxsize, pool_block=pool_block)
+
+        self.session = requests.Session()
+        self.session.mount("https://", self.adapter)
+        self.session.mount("http://", self.adapter)
+
+        self._lock = threading.Lock()
+        self._count_requests = 0
+
+    def request(self, method: str, url: str, **kwargs) -> requests.Response:
+        """ Send request with shared session.
+
+        Args:
+            method (str): HTTP method.
+            url (str): Full url.
+            **kwargs: Other arguments for `requests.Session.request`.
+
+        Returns:
+            requests.Response: Responce from server. `network_time` attribute is time of request with body transfer 
+            in seconds (without body transfer for `stream=True`).
+        """
+        kwargs.setdefault("timeout", self.timeout)
+
+        if self.limiter is None: return self._send(method, url, **kwargs)
+        return self.limiter.call(method, lambda: self._send(method, url, **kwargs))
+
+    def _send(self, method: str, url: str, **kwargs) -> requests.Response:
+        start = time.perf_counter()
+        responce = self.session.request(method, url, **kwargs)
+        responce.network_time = time.perf_counter() - start
+
+        with self._lock:
+            self._count_requests += 1
+
+        return responce
+
+    def get(self, url: str, **kwargs) -> requests.Response:
+        """ Send GET request with shared session """
+        return self.request("GET", url, **kwargs)
+
+    def post(self, url: str, **kwargs) -> requests.Response:
+        """ Send POST request with shared session """
+        return self.request("POST", url, **kwargs)
+
+    @property
+    def stats(self) -> TransportStats:
+        """ Statistic of connection reuse.
+
+        Returns:
+            TransportStats: Count of sent requests, opened connections and reused connections.
+        """
+        with self._lock:
+            count_requests = self._count_requests
+
+        count_connections = sum(pool.num_connections for pool in self.adapter.poolmanager.created_pools)
+        reused = max(count_requests - count_connections, 0)
+
+        return TransportStats(
+            requests=count_requests,
+            connections=count_connections,
+            reused=reused,
+            reuse_ratio=reused / count_requests if count_requests else 0.0
+        )
+
+    def close(self) -> None:
+        """ Close all opened connections """
+        self.session.close()
+
+    def __enter__(self) -> Transport:
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
@@ -12,7 +12,7 @@ setup(
     version=p_version,
     author="Alexandr Drachenin",
     author_email="alexdrachenin98@gmail.com",
-    packages=find_packages(),
+    packages=find_packages(exclude=["benchmarks", "benchmarks.*"]),
     url="https://github.com/Blackgard/dkc-api",
     download_url="https://github.com/Blackgard/dkc-api/tarball/v{0}".format(
         p_version
@@ -35,5 +35,11 @@ setup(
         "pytz==2021.1",
         "python-dotenv==0.19.0"
     ],
+    extras_require={
+        "async": ["httpx>=0.23.0"],
+        "http2": ["httpx[http2,brotli]>=0.23.0"],
+        "columnar": ["numpy>=1.21"],
+        "fast": ["orjson>=3.6"]
+    },
     python_requires='>=3.9'
 )